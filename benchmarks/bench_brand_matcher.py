@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fuzzy brand matching accuracy and throughput.
+
+Builds a brand_matcher.BrandMatcher over --entities synthetic company
+names, or the first --entities names of a --names file (one per line,
+JSON lines or a JSON list, as brand_matcher --entities reads, such as the
+labels of a Wikidata dump), and resolves queries written the way brands
+appear in the wild: different case, legal suffix and punctuation, accents
+added or dropped, "&" spelled out, a one-letter typo. Decoy queries
+(unknown names, and short names that are prefixes of indexed ones, like
+"Meta" against "Metallica") must resolve to nothing. The same query/title
+pairs are also judged with the substring rule check_wikipedia_presence()
+used before (brand.lower() in title.lower()).
+
+Build time includes compiling the prefix index. "fuzzy" times again just
+the queries no indexed name equals once normalized (typos, unknown
+names): each of those needs the full trigram search.
+
+Usage:
+    python benchmarks/bench_brand_matcher.py [--entities 50000] [--names PATH] [--queries 20000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from brand_matcher import BrandMatcher, load_records, normalize_name
+
+SUFFIXES = ["Inc.", "Inc", "Corp.", "Corporation", "LLC", "Ltd", "Limited", "GmbH", "AG", "S.A.", "d.o.o.", "plc", ""]
+ACCENTS = {"a": "á", "e": "é", "o": "ö", "u": "ü", "c": "č", "s": "š", "z": "ž"}
+
+
+ONSETS = list("bcdfghjklmnpqrstvwxz") + "bl br ch cl cr dr fl fr gl gr kl kr ph pl pr qu sc sh sk sl sm sn sp st sw th tr tw wh".split()
+VOWELS = list("aeiouy") + "ai au ea ee ei ie io oa oo ou".split()
+CODAS = [""] * 6 + list("klmnprstx") + "ck ft ld lt mp nd ng nk nt rd rk rm rn rt sk st".split()
+
+
+def pseudo_word(rng: random.Random) -> str:
+    """A pronounceable made-up word with roughly English letter variety."""
+    syllables = rng.randint(1, 3)
+    return "".join(rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(syllables)).title()
+
+
+def build_entities(count: int, rng: random.Random) -> list:
+    vocabulary = sorted({pseudo_word(rng) for _ in range(count)})
+    connectors = ["", "", "", "&", "and", "of"]
+    names = set()
+    entities = []
+    while len(entities) < count:
+        words = [rng.choice(vocabulary) for _ in range(rng.choice([1, 2, 2, 3]))]
+        connector = rng.choice(connectors)
+        if connector and len(words) > 1:
+            words.insert(1, connector)
+        name = " ".join(words)
+        if name in names:
+            continue
+        names.add(name)
+        entities.append({"id": f"Q{len(entities) + 1}", "label": f"{name} {rng.choice(SUFFIXES)}".strip()})
+    return entities
+
+
+def variant(label: str, rng: random.Random) -> str:
+    """label as someone else might write it."""
+    words = label.split()
+    if words[-1] in SUFFIXES:
+        words.pop()
+    text = " ".join(words)
+    choice = rng.randrange(6)
+    if choice == 0:
+        text = text.upper()
+    elif choice == 1:
+        text = text.lower()
+    elif choice == 2:
+        text = "".join(ACCENTS.get(c, c) if rng.random() < 0.3 else c for c in text)
+    elif choice == 3:
+        text = text.replace("&", "and") if "&" in text else text.replace(" and ", " & ")
+    elif choice == 4 and len(text) > 10:
+        i = rng.randrange(1, len(text) - 1)
+        text = text[:i] + rng.choice("aeiou") + text[i + 1 :]
+    return f"{text} {rng.choice(SUFFIXES)}".strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entities", type=int, default=50000)
+    parser.add_argument("--names", metavar="PATH", help="entity names to index instead of synthetic ones")
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.names:
+        records = load_records(args.names)[: args.entities]
+        entities = [dict(record, id=record.get("id") or f"Q{i + 1}") for i, record in enumerate(records)]
+    else:
+        entities = build_entities(args.entities, rng)
+    start = time.perf_counter()
+    matcher = BrandMatcher.from_records(entities)
+    matcher.match(entities[0]["label"])  # the first match compiles the prefix index
+    build = time.perf_counter() - start
+
+    positives = [(variant(e["label"], rng), e) for e in rng.sample(entities, args.queries // 2)]
+    decoys = []
+    for entity in rng.sample(entities, args.queries // 2):
+        if rng.random() < 0.5:
+            decoys.append((entity["label"][: rng.randint(3, 4)], entity))  # short prefix
+        else:
+            decoys.append((f"{pseudo_word(rng)}{pseudo_word(rng)} {pseudo_word(rng)}", entity))  # unknown
+
+    start = time.perf_counter()
+    positive_results = [matcher.best(query) for query, _ in positives]
+    decoy_results = [matcher.best(query) for query, _ in decoys]
+    elapsed = time.perf_counter() - start
+    queries = len(positives) + len(decoys)
+
+    # Queries no indexed name equals once normalized: each takes a full trigram search
+    known = {normalize_name(e["label"]) for e in entities}
+    fuzzy = [q for q, _ in positives + decoys if len(q) > 4 and normalize_name(q) not in known]
+    start = time.perf_counter()
+    for query in fuzzy:
+        matcher.best(query)
+    fuzzy_elapsed = time.perf_counter() - start
+
+    recall = sum(1 for r, (_, e) in zip(positive_results, positives) if r and r["id"] == e["id"]) / len(positives)
+    wrong = sum(1 for r, (_, e) in zip(positive_results, positives) if r and r["id"] != e["id"])
+    short_decoys = [(q, e) for q, e in decoys if len(q) <= 4]
+    # A short prefix that is itself an indexed name may match that name exactly
+    false_matches = sum(
+        1 for r, (q, _) in zip(decoy_results, decoys) if r and normalize_name(r["label"]) != normalize_name(q)
+    )
+
+    # The old rule, judged on the same (query, true title) and (decoy, title) pairs
+    legacy_recall = sum(1 for q, e in positives if q.lower() in e["label"].lower()) / len(positives)
+    legacy_false = sum(1 for q, e in short_decoys if q.lower() in e["label"].lower())
+
+    print(f"entities:   {len(entities)} names, matcher built and compiled in {build:.2f}s")
+    print(f"queries:    {queries} in {elapsed:.2f}s ({queries / elapsed:,.0f}/s)")
+    print(f"fuzzy:      {len(fuzzy)} with no exact name in {fuzzy_elapsed:.2f}s ({len(fuzzy) / fuzzy_elapsed:,.0f}/s)")
+    print(f"recall:     {recall:.1%} of variants resolved to the right entity ({wrong} to a wrong one)")
+    print(f"decoys:     {false_matches} of {len(decoys)} matched something")
+    print(f"old rule:   {legacy_recall:.1%} recall, {legacy_false} of {len(short_decoys)} short-name decoys accepted")
+    if recall < 0.95 or false_matches > len(decoys) * 0.01:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
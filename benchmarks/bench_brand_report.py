@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: brand report latency with concurrent platform checks.
+
+Runs brand_scanner.generate_brand_report() against local stand-in
+Wikipedia and Wikidata APIs that answer after a fixed delay, and compares
+it with the same lookups made one after the other. The report should take
+about as long as the slowest API, not their sum. A second run makes one
+API slower than the deadline and checks the report still returns on time
+with that lookup marked as timed out.
+
+Usage:
+    python benchmarks/bench_brand_report.py [--wikipedia-delay 0.4] [--wikidata-delay 0.6] [--deadline 1.5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from brand_scanner import (
+    ApiClient,
+    _search_wikidata,
+    _search_wikipedia,
+    check_linkedin_presence,
+    check_other_platforms,
+    check_reddit_presence,
+    check_youtube_presence,
+    generate_brand_report,
+)
+from wiki_standin import WikiStandin
+
+
+def sequential_checks(brand: str, api: WikiStandin) -> None:
+    """Every check and lookup in turn, as generate_brand_report() ran them before."""
+    check_youtube_presence(brand)
+    check_reddit_presence(brand)
+    client = ApiClient()
+    _search_wikipedia(client, brand, api.wikipedia)
+    _search_wikidata(client, brand, api.wikidata)
+    check_linkedin_presence(brand)
+    check_other_platforms(brand)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--brand", default="Globex")
+    parser.add_argument("--wikipedia-delay", type=float, default=0.4)
+    parser.add_argument("--wikidata-delay", type=float, default=0.6)
+    parser.add_argument("--deadline", type=float, default=1.5)
+    args = parser.parse_args()
+
+    delays = {"wikipedia": args.wikipedia_delay, "wikidata": args.wikidata_delay}
+    with WikiStandin(delays) as api:
+        start = time.perf_counter()
+        sequential_checks(args.brand, api)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        report = generate_brand_report(
+            args.brand, deadline=args.deadline, wikipedia_api=api.wikipedia, wikidata_api=api.wikidata
+        )
+        after = time.perf_counter() - start
+        found = report["platforms"]["wikipedia"]["has_wikidata_entry"]
+
+        # Wikidata now answers only after the deadline has passed
+        api.delays["wikidata"] = args.deadline * 3
+        start = time.perf_counter()
+        late = generate_brand_report(
+            args.brand, deadline=args.deadline, wikipedia_api=api.wikipedia, wikidata_api=api.wikidata
+        )
+        late_elapsed = time.perf_counter() - start
+
+    lookups = late["platforms"]["wikipedia"]["lookups"]
+    on_time = late_elapsed < args.deadline + 0.5
+    flagged = lookups["wikidata"]["status"] == "timeout" and lookups["wikipedia"]["status"] == "ok"
+
+    print(f"delays:      wikipedia {args.wikipedia_delay}s, wikidata {args.wikidata_delay}s")
+    print(f"sequential:  {before:.3f}s")
+    print(f"concurrent:  {after:.3f}s ({before / after:.1f}x, wikidata entry found: {'yes' if found else 'NO'})")
+    print(f"slow api:    {late_elapsed:.3f}s with a {args.deadline}s deadline (wikidata lookup: {lookups['wikidata']['status']})")
+    statuses = ", ".join(f"{key}={check['status']}" for key, check in late["platform_checks"].items())
+    print(f"platforms:   {statuses}")
+    if not (found and on_time and flagged):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: multi-brand scanning with batched, coalesced API calls.
+
+Scans a competitive set (stand-in brands, redirects, a disambiguation
+page, unknown names and case/spacing duplicates) with
+brand_scanner.scan_brands() against the local stand-in APIs, and with one
+check_wikipedia_presence() call per brand as a single-brand run makes
+them. Checks both agree on every brand's Wikipedia page and Wikidata id,
+and reports API requests and wall time. The batched scan is then repeated
+with an entity cache: cold, warm, and offline after the stand-in has shut
+down. Warm and offline scans must match the cold one.
+
+Usage:
+    python benchmarks/bench_brand_scan.py [--brands 100] [--delay 0.05] [--rate-limit 10]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from brand_scanner import check_wikipedia_presence, scan_brands
+from entity_cache import EntityCache
+from wiki_standin import BRANDS, synthetic_brands, WikiStandin
+
+
+def build_brand_list(count: int) -> list:
+    """count brand names: mostly known articles, some unknown, some duplicates."""
+    named = ["Acme", "Globex", "initech", "Initech Inc.", "Umbrella", "Stark Industries", "Hooli", "Pied Piper"]
+    known = [title for title, _, _ in synthetic_brands(count)]
+    unknown = [f"Unlisted Startup {i}" for i in range(count // 10)]
+    duplicates = [name.upper() for name in known[: count // 10]] + ["  Globex  "]
+    return named + unknown + known[: max(0, count - len(named) - len(unknown) - len(duplicates))] + duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--brands", type=int, default=100)
+    parser.add_argument("--delay", type=float, default=0.05, help="stand-in API response delay, seconds")
+    parser.add_argument("--rate-limit", type=float, default=10)
+    args = parser.parse_args()
+
+    brands = build_brand_list(args.brands)
+    delays = {"wikipedia": args.delay, "wikidata": args.delay}
+    with WikiStandin(delays, BRANDS + synthetic_brands(args.brands)) as api:
+        start = time.perf_counter()
+        singles = {
+            name: check_wikipedia_presence(name, wikipedia_api=api.wikipedia, wikidata_api=api.wikidata)
+            for name in dict.fromkeys(" ".join(b.split()) for b in brands)
+        }
+        before = time.perf_counter() - start
+        before_requests = sum(api.requests.values())
+
+        api.requests.clear()
+        api.actions.clear()
+        start = time.perf_counter()
+        report = scan_brands(
+            brands, wikipedia_api=api.wikipedia, wikidata_api=api.wikidata, rate_limit=args.rate_limit
+        )
+        after = time.perf_counter() - start
+        after_requests = sum(api.requests.values())
+        actions = dict(api.actions)
+
+        cache_path = os.path.join(tempfile.mkdtemp(), "entities.sqlite")
+        cached_runs = []
+        for run in ("cold", "warm"):
+            api.requests.clear()
+            start = time.perf_counter()
+            with EntityCache(cache_path) as cache:
+                cached = scan_brands(
+                    brands,
+                    wikipedia_api=api.wikipedia,
+                    wikidata_api=api.wikidata,
+                    rate_limit=args.rate_limit,
+                    cache=cache,
+                )
+            cached_runs.append((run, time.perf_counter() - start, sum(api.requests.values()), cached))
+    with EntityCache(cache_path) as cache:
+        start = time.perf_counter()
+        offline = scan_brands(brands, wikipedia_api=api.wikipedia, wikidata_api=api.wikidata, cache=cache, offline=True)
+        cached_runs.append(("offline", time.perf_counter() - start, 0, offline))
+
+    # Title lookups also resolve redirects that search misses; only a
+    # brand the per-brand search resolved and the batch didn't is a mismatch
+    mismatches = []
+    resolved_only_by_title = 0
+    for entry in report["brands"]:
+        batched = entry["platforms"]["wikipedia"]
+        single = singles[entry["brand_name"]]
+        if not single.get("wikidata_id") and batched.get("matched_by") == "title":
+            resolved_only_by_title += 1
+            continue
+        for field in ("has_wikipedia_page", "wikidata_id"):
+            if batched.get(field) != single.get(field):
+                mismatches.append(f"{entry['brand_name']}: {field} {batched.get(field)!r} != {single.get(field)!r}")
+
+    print(f"brands:       {len(brands)} given, {report['brands_scanned']} distinct")
+    print(f"per brand:    {before:.3f}s, {before_requests} API requests")
+    print(f"batched:      {after:.3f}s, {after_requests} API requests ({before / after:.1f}x faster)")
+    print(f"by action:    {', '.join(f'{action}={count}' for action, count in sorted(actions.items()))}")
+    print(f"coalesced:    {report['api']['coalesced']} duplicate queries")
+    print(f"equivalent:   {'yes' if not mismatches else f'NO ({len(mismatches)} mismatches)'}", end="")
+    print(f" ({resolved_only_by_title} more brands resolved through redirects)")
+    for line in mismatches[:10]:
+        print(f"  {line}")
+
+    cold = [entry["platforms"]["wikipedia"] for entry in cached_runs[0][3]["brands"]]
+    for run, elapsed, requests, cached in cached_runs:
+        same = [entry["platforms"]["wikipedia"] for entry in cached["brands"]] == cold
+        stats = cached["entity_cache"]
+        print(
+            f"cache {run + ':':8} {elapsed:.3f}s, {requests} API requests, hit rate {stats['hit_rate']}, "
+            f"{stats['negative_hits']} cached misses, {'same' if same else 'DIFFERENT'} results"
+        )
+        if not same:
+            mismatches.append(run)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark: citability scoring speed and score equivalence.
+
+Runs the deterministic corpus from corpus.py (short, optimal, long,
+stat-heavy, pronoun-heavy and multilingual passages) through:
+
+1. Golden check — every score must match fixtures/citability_golden.json.
+2. Equivalence — on English passages the frozen pre-optimization scorer
+   (legacy_citability.py) must return identical results.
+3. Throughput — passages/s before and after, overall and per category.
+4. Latency — p50/p99 microseconds per passage.
+5. Memory — peak traced allocation while scoring the corpus.
+6. Optionally, score_passages() throughput on a process pool (--workers).
+
+Exits non-zero if the golden or equivalence checks fail, so scorer
+performance work can prove both speed and unchanged scores.
+
+Usage:
+    python benchmarks/bench_citability.py [--per-category 200] [--seed 7]
+        [--workers 1 2 4] [--update-golden]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "scripts"))
+sys.path.insert(0, BENCH_DIR)
+
+import legacy_citability
+from citability_scorer import score_passage, score_passages
+from citability_rules import detect_language
+from corpus import CATEGORIES, build_corpus, corpus_digest
+
+GOLDEN_PATH = os.path.join(BENCH_DIR, "fixtures", "citability_golden.json")
+GOLDEN_PER_CATEGORY = 50
+GOLDEN_SEED = 7
+# The legacy scorer only knows English rules
+ENGLISH_CATEGORIES = tuple(c for c in CATEGORIES if c != "multilingual")
+
+
+def golden_record(result: dict) -> list:
+    """The parts of a score that must never change silently."""
+    breakdown = [result["breakdown"][k] for k in sorted(result["breakdown"])]
+    return [result["language"], result["total_score"], result["grade"], breakdown]
+
+
+def without_language(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "language"}
+
+
+def update_golden() -> None:
+    corpus = build_corpus(GOLDEN_PER_CATEGORY, GOLDEN_SEED)
+    fixture = {
+        "per_category": GOLDEN_PER_CATEGORY,
+        "seed": GOLDEN_SEED,
+        "corpus_sha256": corpus_digest(corpus),
+        "scores": {p["id"]: golden_record(score_passage(p["text"], p["heading"])) for p in corpus},
+    }
+    with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+        json.dump(fixture, f, indent=0, sort_keys=True)
+        f.write("\n")
+    print(f"Wrote {len(fixture['scores'])} golden scores to {GOLDEN_PATH}")
+
+
+def check_golden() -> list:
+    """Return a list of problems with the golden fixture (empty if all match)."""
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        fixture = json.load(f)
+    corpus = build_corpus(fixture["per_category"], fixture["seed"])
+    if corpus_digest(corpus) != fixture["corpus_sha256"]:
+        return ["corpus generator changed; golden scores no longer apply (re-run with --update-golden)"]
+    problems = []
+    for passage in corpus:
+        expected = fixture["scores"][passage["id"]]
+        actual = golden_record(score_passage(passage["text"], passage["heading"]))
+        if actual != expected:
+            problems.append(f"{passage['id']}: expected {expected}, got {actual}")
+    return problems
+
+
+def time_passages(scorer, passages: list) -> list:
+    """Return per-passage wall times in nanoseconds."""
+    timings = []
+    clock = time.perf_counter_ns
+    for passage in passages:
+        start = clock()
+        scorer(passage["text"], passage["heading"])
+        timings.append(clock() - start)
+    return timings
+
+
+def percentile(values: list, p: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def rate(timings: list) -> float:
+    return len(timings) / (sum(timings) / 1e9)
+
+
+def peak_memory(scorer, passages: list) -> int:
+    tracemalloc.start()
+    for passage in passages:
+        scorer(passage["text"], passage["heading"])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--per-category", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, nargs="*", default=[])
+    parser.add_argument("--update-golden", action="store_true", help="rewrite the golden fixture from the current scorer")
+    args = parser.parse_args()
+
+    if args.update_golden:
+        update_golden()
+        return
+
+    failed = False
+    problems = check_golden()
+    print(f"golden:     {'ok' if not problems else f'{len(problems)} MISMATCHES'}")
+    for problem in problems[:10]:
+        print(f"  {problem}")
+    failed |= bool(problems)
+
+    corpus = build_corpus(args.per_category, args.seed)
+    mismatches = [
+        p["id"]
+        for p in corpus
+        if p["category"] in ENGLISH_CATEGORIES
+        and legacy_citability.score_passage(p["text"], p["heading"])
+        != without_language(score_passage(p["text"], p["heading"]))
+    ]
+    print(f"equivalent: {'yes' if not mismatches else f'NO ({len(mismatches)} mismatches, e.g. {mismatches[0]})'}")
+    failed |= bool(mismatches)
+
+    before = time_passages(legacy_citability.score_passage, corpus)
+    after = time_passages(score_passage, corpus)
+
+    print(f"\npassages:   {len(corpus)} ({args.per_category} per category, seed {args.seed})")
+    print(f"{'':14} {'passages/s':>12} {'p50 us':>9} {'p99 us':>9}")
+    for label, timings in (("before", before), ("after", after)):
+        print(
+            f"{label:14} {rate(timings):>12,.0f} {percentile(timings, 50) / 1000:>9.1f} "
+            f"{percentile(timings, 99) / 1000:>9.1f}"
+        )
+    print(f"{'speedup':14} {rate(after) / rate(before):>11.2f}x")
+
+    print(f"\n{'category':14} {'before/s':>12} {'after/s':>12} {'speedup':>8} {'mean us':>9}")
+    for category in CATEGORIES:
+        indexes = [i for i, p in enumerate(corpus) if p["category"] == category]
+        b = [before[i] for i in indexes]
+        a = [after[i] for i in indexes]
+        print(
+            f"{category:14} {rate(b):>12,.0f} {rate(a):>12,.0f} {rate(a) / rate(b):>7.2f}x "
+            f"{statistics.mean(a) / 1000:>9.1f}"
+        )
+
+    english = [p for p in corpus if p["category"] in ENGLISH_CATEGORIES]
+    detect = time_passages(lambda text, heading: detect_language(text), corpus)
+    print(
+        f"\nlanguage detection: {percentile(detect, 50) / 1000:.1f} us p50, "
+        f"{sum(detect) / sum(after):.1%} of scoring time; "
+        f"english-only {rate(time_passages(score_passage, english)):,.0f} passages/s"
+    )
+
+    print(
+        f"\npeak memory: before {peak_memory(legacy_citability.score_passage, corpus) / 1024:,.0f} KiB, "
+        f"after {peak_memory(score_passage, corpus) / 1024:,.0f} KiB"
+    )
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        count = sum(1 for _ in score_passages(([p["text"], p["heading"]] for p in corpus), workers=workers))
+        pool_rate = count / (time.perf_counter() - start)
+        print(f"workers={workers:<3} {pool_rate:,.0f} passages/s  ({pool_rate / rate(after):.2f}x single-process)")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
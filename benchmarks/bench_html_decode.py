@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML decode + parse cost and output on large pages.
+
+Compares the old path (response.text, which runs charset detection over the
+whole body when the server omits a charset, then parses the decoded string)
+against fetch_page.parse_response(), which hands raw bytes to lxml with the
+declared or sniffed charset. Pages are UTF-8, windows-1251, windows-1252 and
+Shift_JIS, with and without a declared charset.
+
+This is a parity check, not a speedup claim: with charset_normalizer doing
+the detection, both paths take about the same time (ratios near 1.0x) even
+on charset-less non-UTF-8 pages. Where they differ is the text: UTF-8
+served as text/html without a charset comes out of response.text as
+ISO-8859-1 mojibake. The check is that the byte path costs no more and
+decodes each page to its true text wherever the old path does; it exits
+non-zero if only the byte path gets the text wrong.
+
+Usage:
+    python benchmarks/bench_html_decode.py [--size-mb 4] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import requests
+from bs4 import BeautifulSoup
+
+from fetch_page import parse_response
+
+PARAGRAPHS = {
+    "utf-8": (
+        "<p>Generative engines cite passages that are self-contained — "
+        "naïve summaries rarely qualify. Straße, café, São Paulo, Zürich, "
+        "and 42% of 1,200 sites were analyzed in 2025.</p>\n"
+    ),
+    "windows-1251": (
+        "<p>Генеративни претраживачи цитирају пасусе који су самостални, "
+        "а 42% од 1.200 сајтова анализирано је 2025. године.</p>\n"
+    ),
+    "windows-1252": (
+        "<p>Les moteurs génératifs citent des passages autonomes — résumés "
+        "naïfs, café, Zürich, 42 % de 1 200 sites analysés en 2025.</p>\n"
+    ),
+    "shift_jis": "<p>生成エンジンは自己完結した文章を引用します。二〇二五年に千二百のサイトが分析されました。</p>\n",
+}
+
+
+def build_page(size_mb: float, meta_charset: bool, encoding: str = "utf-8") -> bytes:
+    """Build a synthetic page of roughly size_mb megabytes in encoding."""
+    head = f'<meta charset="{encoding}">' if meta_charset else ""
+    body = []
+    target = int(size_mb * 1024 * 1024)
+    total = 0
+    i = 0
+    while total < target:
+        chunk = f"<h2>Section {i}</h2>\n" + PARAGRAPHS[encoding] * 20
+        body.append(chunk)
+        total += len(chunk.encode(encoding))
+        i += 1
+    html = f"<!DOCTYPE html><html><head>{head}<title>Bench</title></head><body>{''.join(body)}</body></html>"
+    return html.encode(encoding)
+
+
+def make_response(content: bytes, content_type) -> requests.Response:
+    """Build a requests.Response around a pre-downloaded body."""
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    if content_type:
+        response.headers["Content-Type"] = content_type
+    # What requests' HTTPAdapter does; without it .text always runs detection
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def time_call(fn, repeat: int) -> float:
+    """Return the best wall time of fn() over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_parse(content: bytes, content_type):
+    return BeautifulSoup(make_response(content, content_type).text, "lxml")
+
+
+def fast_parse(content: bytes, content_type):
+    return parse_response(make_response(content, content_type))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [
+        ("utf-8, no charset, no header", "utf-8", build_page(args.size_mb, False), None),
+        ("utf-8, no charset, text/html", "utf-8", build_page(args.size_mb, False), "text/html"),
+        ("utf-8, <meta charset>", "utf-8", build_page(args.size_mb, True), None),
+        ("utf-8, header charset", "utf-8", build_page(args.size_mb, False), "text/html; charset=utf-8"),
+    ]
+    for encoding in ("windows-1251", "windows-1252", "shift_jis"):
+        content = build_page(args.size_mb, False, encoding)
+        cases.append((f"{encoding}, no charset", encoding, content, None))
+        cases.append((f"{encoding}, header charset", encoding, content, f"text/html; charset={encoding}"))
+
+    wrong = []
+    print(f"{'case':<34} {'size':>8} {'legacy':>10} {'bytes':>10} {'ratio':>7} {'text right (legacy/bytes)':>26}")
+    for name, encoding, content, content_type in cases:
+        legacy = time_call(lambda: legacy_parse(content, content_type), args.repeat)
+        fast = time_call(lambda: fast_parse(content, content_type), args.repeat)
+        truth = BeautifulSoup(content.decode(encoding), "lxml").get_text()
+        legacy_right = legacy_parse(content, content_type).get_text() == truth
+        fast_right = fast_parse(content, content_type).get_text() == truth
+        if legacy_right and not fast_right:
+            wrong.append(name)
+        size = f"{len(content) / 1024 / 1024:.1f}MB"
+        right = f"{'yes' if legacy_right else 'no'}/{'yes' if fast_right else 'no'}"
+        print(f"{name:<34} {size:>8} {legacy:>9.3f}s {fast:>9.3f}s {legacy / fast:>6.1f}x {right:>26}")
+    if wrong:
+        print(f"byte path decodes wrongly where response.text is right: {', '.join(wrong)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
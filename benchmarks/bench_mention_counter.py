@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark: brand mention counting over a local corpus.
+
+Writes --mb megabytes of prose from corpus.py into --files files, with
+brand mentions planted at random (different case, possessives, legal
+suffixes, accents, punctuation inside multi-word names, near misses that
+must not count), then counts them with mention_counter.count_mentions():
+
+1. Exact — per-file counts must equal the planted ones, in file mode,
+   in line mode and with tiny read blocks (mentions cut by block edges).
+2. Throughput — MB/s with a few brands and with hundreds, against one
+   case-insensitive \\b regex per brand over decoded text, and on a
+   process pool when there is more than one CPU.
+
+Usage:
+    python benchmarks/bench_mention_counter.py [--mb 100] [--files 50] [--brands 500] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "scripts"))
+
+import mention_counter
+from corpus import build_corpus
+from mention_counter import MentionCounter, count_mentions
+
+# brand -> aliases; none of these words occur in corpus.py prose
+BRANDS = {
+    "Zorvex Inc.": ["Zorvex"],
+    "Quillon Labs": ["Quillon"],
+    "Brightmoor Analytics": [],
+    "Škodrava": [],
+    "Kestrelio": ["KSTR"],
+    "Halvard & Finch": ["Halvard and Finch"],
+}
+# (text planted, brand it counts for, or None for a near miss)
+PLANTED = [
+    ("Zorvex", "Zorvex Inc."),
+    ("ZORVEX", "Zorvex Inc."),
+    ("Zorvex's", "Zorvex Inc."),
+    ("Zorvex Inc.", "Zorvex Inc."),
+    ("zorvex.", "Zorvex Inc."),
+    ("Zorvexa", None),
+    ("prezorvex", None),
+    ("Quillon Labs", "Quillon Labs"),
+    ("Quillon-Labs", "Quillon Labs"),
+    ("quillon", "Quillon Labs"),
+    ("Quillons", None),
+    ("Brightmoor Analytics", "Brightmoor Analytics"),
+    ("Brightmoor\nAnalytics", "Brightmoor Analytics"),  # not in line mode: the name spans two documents
+    ("Brightmoor", None),
+    ("Škodrava", "Škodrava"),
+    ("ŠKODRAVA", "Škodrava"),
+    ("Skodrava", "Škodrava"),
+    ("“Škodrava”", "Škodrava"),
+    ("Kestrelio", "Kestrelio"),
+    ("KSTR", "Kestrelio"),
+    ("kstrs", None),
+    ("Halvard & Finch", "Halvard & Finch"),
+    ("Halvard and Finch", "Halvard & Finch"),
+    ("Halvard", None),
+]
+
+
+def pseudo_brand(rng: random.Random) -> str:
+    letters = "bcdfghjklmnprstvz"
+    return "".join(rng.choice(letters) + rng.choice("aeiou") for _ in range(rng.randint(2, 4))).title() + "ex"
+
+
+def write_corpus(directory: str, megabytes: float, files: int, seed: int) -> dict:
+    """Write the corpus; returns {path: {brand: planted count}} for file mode."""
+    rng = random.Random(seed)
+    passages = [p["text"] for p in build_corpus(per_category=100, seed=seed)]
+    per_file = int(megabytes * 1e6 / files)
+    planted = {}
+    for i in range(files):
+        path = os.path.join(directory, f"page-{i:04d}.txt")
+        counts = {}
+        parts = []
+        size = 0
+        while size < per_file:
+            text = rng.choice(passages)
+            if rng.random() < 0.3:
+                plant, brand = rng.choice(PLANTED)
+                words = text.split(" ")
+                words.insert(rng.randrange(len(words) + 1), plant)
+                text = " ".join(words)
+                if brand:
+                    counts[brand] = counts.get(brand, 0) + 1
+            parts.append(text)
+            size += len(text.encode("utf-8")) + 1
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(parts) + "\n")
+        planted[path] = counts
+    return planted
+
+
+def file_counts(report: dict) -> dict:
+    """{path: {brand: count}}, folding line documents ("path:line") into their file."""
+    counts = {}
+    for document, brands in report["documents"].items():
+        path = document if document.endswith(".txt") else document.rsplit(":", 1)[0]
+        merged = counts.setdefault(path, {})
+        for brand, count in brands.items():
+            merged[brand] = merged.get(brand, 0) + count
+    return counts
+
+
+def regex_baseline(paths: list, brands: dict) -> float:
+    """Seconds to count brands one case-insensitive regex at a time."""
+    patterns = [
+        re.compile(r"\b(?:" + "|".join(re.escape(name) for name in [brand, *aliases]) + r")\b", re.IGNORECASE)
+        for brand, aliases in brands.items()
+    ]
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        for pattern in patterns:
+            sum(1 for _ in pattern.finditer(text))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mb", type=float, default=100)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--brands", type=int, default=500, help="brands in the many-brands run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp()
+    failures = []
+    try:
+        planted = write_corpus(work, args.mb, args.files, args.seed)
+        paths = sorted(planted)
+        megabytes = sum(os.path.getsize(path) for path in paths) / 1e6
+        expected = {path: counts for path, counts in planted.items() if counts}
+
+        # Line mode splits "Brightmoor\nAnalytics" into two documents
+        line_expected = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            split = text.count("Brightmoor\nAnalytics")
+            counts = dict(planted[path])
+            if split:
+                counts["Brightmoor Analytics"] -= split
+                counts = {brand: count for brand, count in counts.items() if count}
+            if counts:
+                line_expected[path] = counts
+
+        report = count_mentions([work], BRANDS)
+        if file_counts(report) != expected:
+            failures.append("file mode counts differ from planted mentions")
+        lines_report = count_mentions([work], BRANDS, lines=True)
+        if file_counts(lines_report) != line_expected:
+            failures.append("line mode counts differ from planted mentions")
+        block_bytes = mention_counter.BLOCK_BYTES
+        mention_counter.BLOCK_BYTES = 4096
+        try:
+            small = MentionCounter(BRANDS).scan_file(paths[0])
+        finally:
+            mention_counter.BLOCK_BYTES = block_bytes
+        if small["mentions"] != planted[paths[0]]:
+            failures.append("4 KB blocks lose or double-count mentions")
+        print(f"corpus:      {len(paths)} files, {megabytes:.1f} MB, {report['total_mentions']} mentions planted")
+        print(f"exact:       {'yes' if not failures else 'NO'} (file mode, line mode, 4 KB blocks)")
+        share = ", ".join(f"{brand} {entry['share_of_voice']:.0%}" for brand, entry in report["brands"].items())
+        print(f"share:       {share}")
+
+        rng = random.Random(args.seed)
+        many = dict(BRANDS)
+        while len(many) < args.brands:
+            many.setdefault(pseudo_brand(rng), [])
+        for label, brands in ((f"{len(BRANDS)} brands", BRANDS), (f"{len(many)} brands", many)):
+            start = time.perf_counter()
+            result = count_mentions([work], brands)
+            elapsed = time.perf_counter() - start
+            if file_counts(result) != expected:
+                failures.append(f"{label}: counts differ")
+            sample = paths[:1]
+            baseline = regex_baseline(sample, brands)
+            sample_mb = sum(os.path.getsize(path) for path in sample) / 1e6
+            print(
+                f"{label + ':':<12} {megabytes / elapsed:,.0f} MB/s "
+                f"(regex per brand: {sample_mb / baseline:,.1f} MB/s)"
+            )
+        if (os.cpu_count() or 1) > 1:
+            start = time.perf_counter()
+            count_mentions([work], many, workers=None)
+            print(f"processes:   {megabytes / (time.perf_counter() - start):,.0f} MB/s on {os.cpu_count()} CPUs")
+    finally:
+        shutil.rmtree(work)
+    for line in failures:
+        print(f"  {line}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: llms.txt section classification at sitemap scale.
+
+Classifies synthetic URL paths with path_classifier.PathClassifier and with
+the keyword scans generate_llmstxt() used before, checks that both put
+every path in the same section, and reports throughput.
+
+Usage:
+    python benchmarks/bench_path_classifier.py [--paths 100000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from path_classifier import DEFAULT_RULES, PathClassifier
+
+
+def legacy_classify(path: str) -> str:
+    """Section choice as generate_llmstxt() made it before the classifier."""
+    for section in DEFAULT_RULES["sections"]:
+        if any(kw in path for kw in section["keywords"]):
+            return section["name"]
+    return DEFAULT_RULES["default_section"]
+
+
+def build_paths(count: int, seed: int) -> list:
+    """Paths mixing rule keywords, near misses and unrelated segments."""
+    rng = random.Random(seed)
+    keywords = [kw for section in DEFAULT_RULES["sections"] for kw in section["keywords"]]
+    noise = ["/en", "/de", "/2025", "/category", "/tag", "/Blog", "/DOCS", "/prod", "/doc", "/teams", "/x-y"]
+    segments = keywords + noise
+    paths = []
+    for i in range(count):
+        path = "".join(rng.choice(segments) for _ in range(rng.randint(0, 4)))
+        paths.append(path + rng.choice(["", "/", f"/post-{i}", f"/item-{i}.html"]))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paths", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    paths = build_paths(args.paths, args.seed)
+    classifier = PathClassifier()
+
+    start = time.perf_counter()
+    legacy = [legacy_classify(path.lower()) for path in paths]
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = [classifier.classify(path) for path in paths]
+    after = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, current) if a != b)
+
+    print(f"paths:      {len(paths)}")
+    print(f"before:     {before:.3f}s ({len(paths) / before:,.0f} paths/s)")
+    print(f"after:      {after:.3f}s ({len(paths) / after:,.0f} paths/s, {before / after:.1f}x)")
+    print(f"equivalent: {'yes' if not mismatches else f'NO ({mismatches} mismatches)'}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDF report import time and per-report startup.
+
+Each measurement runs in a fresh Python process, so font registration is
+never already cached:
+
+1. Import — importing generate_pdf_report, and importing it followed by
+   register_fonts(), which is what every import used to do.
+2. First report — import plus the first generate_report() for each
+   language, fonts registered lazily versus all eight up front; "fonts"
+   is how many TTF files were parsed.
+3. Same output — the lazily and eagerly generated PDFs embed the same
+   fonts.
+
+Usage:
+    python benchmarks/bench_pdf_report.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS = os.path.join(HERE, "..", "scripts")
+
+SAMPLE = {
+    "url": "https://example.com",
+    "brand_name": "Example Company",
+    "date": "2026-02-18",
+    "geo_score": 58,
+    "scores": {"ai_citability": 45, "brand_authority": 62, "content_eeat": 70, "technical": 55},
+    "platforms": {"Google AI Overviews": 65, "ChatGPT": 52, "Perplexity": 48},
+    "executive_summary": "Šta je GEO? ما هو تحسين محركات البحث؟ The site scored 58/100.",
+    "findings": [{"severity": "high", "title": "Missing llms.txt", "description": "No llms.txt file exists."}],
+    "quick_wins": ["Allow all Tier 1 AI crawlers in robots.txt"],
+}
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import generate_pdf_report as g
+imported = time.perf_counter()
+if {eager}:
+    g.register_fonts()
+registered = time.perf_counter()
+if {lang!r}:
+    g.generate_report(json.loads(sys.argv[1]), sys.argv[2], {lang!r})
+done = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "registered": registered - start,
+    "report": done - start,
+    "fonts": sum(1 for font in g._registered_fonts.values() if font is not None),
+}}))
+"""
+
+
+def run_child(lang: str, eager: bool, output: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(lang=lang, eager=eager), json.dumps(SAMPLE), output],
+        cwd=SCRIPTS,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def embedded_fonts(path: str) -> set:
+    with open(path, "rb") as f:
+        return set(re.findall(rb"/BaseFont /(?:[A-Z]{6}\+)?([\w-]+)", f.read()))
+
+
+def median_ms(samples: list, key: str) -> float:
+    return statistics.median(sample[key] for sample in samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per measurement")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp()
+    failures = []
+    try:
+        output = os.path.join(work, "report.pdf")
+        lazy = [run_child("", False, output) for _ in range(args.runs)]
+        eager = [run_child("", True, output) for _ in range(args.runs)]
+        print(f"import:        {median_ms(lazy, 'import'):.0f} ms (was {median_ms(eager, 'registered'):.0f} ms)")
+
+        for lang in ("en", "sr", "ar"):
+            lazy_pdf = os.path.join(work, f"lazy-{lang}.pdf")
+            eager_pdf = os.path.join(work, f"eager-{lang}.pdf")
+            lazy = [run_child(lang, False, lazy_pdf) for _ in range(args.runs)]
+            eager = [run_child(lang, True, eager_pdf) for _ in range(args.runs)]
+            same = embedded_fonts(lazy_pdf) == embedded_fonts(eager_pdf)
+            if not same:
+                failures.append(f"{lang}: embedded fonts differ")
+            print(
+                f"first report:  {lang} {median_ms(lazy, 'report'):.0f} ms, {lazy[0]['fonts']} fonts "
+                f"(was {median_ms(eager, 'report'):.0f} ms, {eager[0]['fonts']} fonts), "
+                f"same fonts embedded: {'yes' if same else 'NO'}"
+            )
+    finally:
+        for name in os.listdir(work):
+            os.remove(os.path.join(work, name))
+        os.rmdir(work)
+    for line in failures:
+        print(f"  {line}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: passage re-segmentation speed and optimality.
+
+Times passage_optimizer.segment_paragraphs() on synthetic sections, and
+checks it against an exhaustive O(n^2) dynamic program with no passage
+length cap. The windowed program must find the same minimum penalty
+whenever the exhaustive optimum uses no passage over MAX_PASSAGE_WORDS.
+
+Usage:
+    python benchmarks/bench_resegment.py [--sections 20000] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from passage_optimizer import MAX_PASSAGE_WORDS, length_penalty, segment_paragraphs
+
+
+def exhaustive_segments(word_counts: list) -> tuple:
+    """Reference DP over every paragraph range; returns (cost, segments)."""
+    n = len(word_counts)
+    prefix = [0]
+    for count in word_counts:
+        prefix.append(prefix[-1] + count)
+    best = [0] + [None] * n
+    cut = [0] * (n + 1)
+    for end in range(1, n + 1):
+        for begin in range(end):
+            cost = best[begin] + length_penalty(prefix[end] - prefix[begin])
+            if best[end] is None or cost < best[end]:
+                best[end] = cost
+                cut[end] = begin
+    segments = []
+    end = n
+    while end > 0:
+        segments.append((cut[end], end))
+        end = cut[end]
+    return best[n], segments[::-1]
+
+
+def cost_of(word_counts: list, segments: list) -> int:
+    return sum(length_penalty(sum(word_counts[begin:end])) for begin, end in segments)
+
+
+def build_sections(count: int, seed: int) -> list:
+    """Sections of 1-40 paragraphs, mostly short, some long."""
+    rng = random.Random(seed)
+    sections = []
+    for _ in range(count):
+        paragraphs = rng.choice([1, 2, 3, 4, 6, 8, 12, 20, 40])
+        sections.append([rng.choice([rng.randint(5, 40), rng.randint(40, 120), rng.randint(120, 260)]) for _ in range(paragraphs)])
+    return sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sections = build_sections(args.sections, args.seed)
+    paragraphs = sum(len(s) for s in sections)
+
+    start = time.perf_counter()
+    results = [segment_paragraphs(s) for s in sections]
+    windowed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    references = [exhaustive_segments(s) for s in sections]
+    exhaustive = time.perf_counter() - start
+
+    mismatches = 0
+    comparable = 0
+    for section, segments, (reference_cost, reference_segments) in zip(sections, results, references):
+        if any(end - begin > 1 and sum(section[begin:end]) > MAX_PASSAGE_WORDS for begin, end in reference_segments):
+            continue
+        comparable += 1
+        if cost_of(section, segments) != reference_cost:
+            mismatches += 1
+
+    long_run = [random.Random(args.seed).randint(5, 200) for _ in range(200000)]
+    start = time.perf_counter()
+    segment_paragraphs(long_run)
+    long_elapsed = time.perf_counter() - start
+
+    print(f"sections:    {len(sections)} ({paragraphs} paragraphs)")
+    print(f"windowed:    {windowed:.3f}s ({paragraphs / windowed:,.0f} paragraphs/s)")
+    print(f"exhaustive:  {exhaustive:.3f}s ({exhaustive / windowed:.1f}x slower)")
+    print(f"optimal:     {'yes' if not mismatches else f'NO ({mismatches} mismatches)'} on {comparable} comparable sections")
+    print(f"200k-paragraph run: {long_elapsed:.3f}s")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: offline Wikidata index build and lookups.
+
+Builds wikidata_index indexes from the fixture dump in
+fixtures/wikidata-sample.json (as plain, gzip and bzip2 files) and checks
+the expected entities come back. It then streams a synthetic dump of
+--entities items to a .json.gz file, builds an index from it with small
+sort chunks, and reports build throughput, peak memory, index size and
+lookup latency.
+
+Usage:
+    python benchmarks/bench_wikidata_index.py [--entities 200000] [--lookups 100000] [--seed 7]
+"""
+
+import argparse
+import bz2
+import gzip
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "scripts"))
+
+from wikidata_index import WikidataIndex, build_index
+
+FIXTURE = os.path.join(HERE, "fixtures", "wikidata-sample.json")
+
+# name -> expected best entity id (None: not found)
+EXPECTED = {
+    "Apple Inc.": "Q312",
+    "apple": "Q89",
+    "AAPL": "Q312",
+    "  google   llc ": "Q95",
+    "Facebook, Inc.": "Q380",
+    "Amazon": "Q3884",
+    "Amazon River": "Q3783",
+    "Škoda": "Q1200001",
+    "skoda": "Q1200001",
+    "acme analytics ltd": "Q1200002",
+    "Брендовац": None,  # Serbian label only
+    "instance of": None,  # a property, not an item
+    "Unknown Brand": None,
+}
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write_synthetic_dump(path: str, count: int, seed: int) -> list:
+    """Stream count items shaped like dump entities; returns (name, id) samples."""
+    rng = random.Random(seed)
+    words = "acme nova vertex lumen orbit pixel quantum summit harbor atlas cobalt ember".split()
+    suffixes = ["Inc.", "Labs", "Group", "GmbH", "Ltd", "Systems", "Media", ""]
+    samples = []
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=1) as f:
+        f.write("[\n")
+        for i in range(count):
+            label = f"{rng.choice(words).title()} {rng.choice(words).title()} {i} {rng.choice(suffixes)}".strip()
+            alias = f"{label.split()[0]}{i}"
+            entity = {
+                "type": "item",
+                "id": f"Q{i + 1}",
+                "labels": {"en": {"language": "en", "value": label}, "de": {"language": "de", "value": label}},
+                "descriptions": {"en": {"language": "en", "value": f"synthetic company {i}"}},
+                "aliases": {"en": [{"language": "en", "value": alias}]},
+                "claims": {"P31": [{"mainsnak": {"datavalue": {"value": {"id": "Q4830453"}}}}] * rng.randint(1, 6)},
+                "sitelinks": {"enwiki": {"site": "enwiki", "title": label}} if i % 3 else {},
+            }
+            f.write(json.dumps(entity, separators=(",", ":")))
+            f.write(",\n" if i < count - 1 else "\n")
+            if i % max(1, count // 1000) == 0:
+                samples.append((label, entity["id"]))
+                samples.append((alias, entity["id"]))
+        f.write("]\n")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entities", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp()
+    failures = []
+    try:
+        # Fixture: same answers whichever compression the dump uses
+        dumps = {"json": FIXTURE, "json.gz": os.path.join(work, "sample.json.gz")}
+        dumps["json.bz2"] = os.path.join(work, "sample.json.bz2")
+        with open(FIXTURE, "rb") as src, gzip.open(dumps["json.gz"], "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        with open(FIXTURE, "rb") as src, bz2.open(dumps["json.bz2"], "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        for kind, dump in dumps.items():
+            index_path = os.path.join(work, f"sample-{kind}.idx")
+            build_index(dump, index_path, chunk_entries=4)
+            with WikidataIndex(index_path) as index:
+                for name, expected in EXPECTED.items():
+                    best = index.best(name)
+                    if (best["id"] if best else None) != expected:
+                        failures.append(f"{kind}: {name!r} -> {best and best['id']}, expected {expected}")
+        print(f"fixture:     {len(EXPECTED)} names x {len(dumps)} dump formats, {'ok' if not failures else 'FAILED'}")
+
+        # Scale: constant-memory build and lookup latency
+        dump = os.path.join(work, "synthetic.json.gz")
+        samples = write_synthetic_dump(dump, args.entities, args.seed)
+        dump_mb = os.path.getsize(dump) / 1e6
+        rss_before = peak_rss_mb()
+        index_path = os.path.join(work, "synthetic.idx")
+        start = time.perf_counter()
+        stats = build_index(dump, index_path, chunk_entries=50000)
+        build = time.perf_counter() - start
+        rss_after = peak_rss_mb()
+
+        rng = random.Random(args.seed)
+        names = [rng.choice(samples)[0] if rng.random() < 0.8 else f"missing brand {i}" for i in range(args.lookups)]
+        with WikidataIndex(index_path) as index:
+            for name, qid in samples:
+                best = index.best(name)
+                if best is None or best["id"] != qid:
+                    failures.append(f"synthetic: {name!r} -> {best and best['id']}, expected {qid}")
+            start = time.perf_counter()
+            found = sum(1 for name in names if index.lookup(name))
+            lookup = time.perf_counter() - start
+
+        print(f"dump:        {args.entities} entities, {dump_mb:.1f} MB gzipped")
+        print(f"build:       {build:.2f}s ({stats['entities_read'] / build:,.0f} entities/s), {stats['keys']} keys")
+        print(f"memory:      peak RSS {rss_after:.0f} MB (+{max(0.0, rss_after - rss_before):.0f} MB during build)")
+        print(f"index:       {stats['index_bytes'] / 1e6:.1f} MB")
+        print(f"lookups:     {len(names)} in {lookup:.3f}s ({lookup / len(names) * 1e6:.1f} µs each, {found} found)")
+        print(f"correct:     {'yes' if not failures else f'NO ({len(failures)} failures)'}")
+        for line in failures[:10]:
+            print(f"  {line}")
+    finally:
+        shutil.rmtree(work)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
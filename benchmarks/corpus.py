@@ -0,0 +1,149 @@
+"""
+Deterministic synthetic passage corpus for citability benchmarks.
+
+Every passage is generated from a seeded random.Random, so the same
+(per_category, seed) always produces byte-identical text. Categories cover
+the shapes the scorer treats differently:
+
+- short:          10-60 words, mostly navigation-like fragments
+- optimal:        134-167 words of definition/answer style prose
+- long:           250-600 words of loosely structured prose
+- stat_heavy:     percentages, dollar amounts, years and named sources
+- pronoun_heavy:  context-dependent prose full of it/they/this/that
+- multilingual:   Serbian (Latin), Arabic and mixed-language passages
+"""
+
+import hashlib
+import random
+
+CATEGORIES = ("short", "optimal", "long", "stat_heavy", "pronoun_heavy", "multilingual")
+
+ENGLISH_WORDS = (
+    "search engine optimization content passage citation model answer structure "
+    "page website brand authority signal crawler index ranking query result "
+    "visibility platform audience strategy measurement research analysis team "
+    "product service customer workflow integration documentation guide example"
+).split()
+CONNECTORS = "the a an of to in for with on by and or from as at".split()
+VERBS = "is are was were means refers improves reduces increases shows indicates helps".split()
+PRONOUNS = "it they them their this that these those he she his her".split()
+PROPER_NOUNS = ["Google", "OpenAI", "Anthropic", "Gartner", "McKinsey", "Stanford", "Perplexity", "Microsoft Bing", "New York"]
+STAT_FRAGMENTS = [
+    "{n}%", "{n}.{m}%", "${n},{m:03d}", "${n}.{m} million", "{n} users", "{n} customers",
+    "{n},{m:03d} pages", "{n} times", "20{yy}", "({name} 20{yy})", "according to {name}",
+]
+STRUCTURE_PHRASES = [
+    "For example,", "First,", "Second,", "Finally,", "Moreover,", "In practice,",
+    "Research shows that", "Our study found that", "We analyzed", "Step {n}:", "{n}.",
+]
+HEADINGS = [
+    None, "Introduction", "What is generative engine optimization?", "How does AI citation work?",
+    "Pricing", "Key findings", "Frequently asked questions", "Overview",
+]
+
+SERBIAN_WORDS = (
+    "pretraživač optimizacija sadržaj odgovor model citat struktura stranica sajt "
+    "brend autoritet signal istraživanje analiza korisnik proizvod usluga vodič "
+    "je su bio bila znači odnosi na prema podacima naše studije pokazuje"
+).split()
+SERBIAN_CONNECTORS = "i u na za sa od do da se kao što ili ali".split()
+ARABIC_WORDS = (
+    "محرك البحث تحسين المحتوى الإجابة النموذج الاقتباس البنية الصفحة الموقع "
+    "العلامة التجارية السلطة الإشارة البحث التحليل المستخدم المنتج الخدمة الدليل "
+    "هو هي يعني وفقا دراسة تظهر البيانات"
+).split()
+ARABIC_CONNECTORS = "في من إلى على مع عن أو و ثم".split()
+
+
+def _sentence(rng: random.Random, words: list, connectors: list, length: int, capitalize: bool = True) -> str:
+    tokens = []
+    for i in range(length):
+        pool = connectors if i % 3 == 1 else words
+        tokens.append(rng.choice(pool))
+    if capitalize and tokens[0][:1].isascii():
+        tokens[0] = tokens[0].capitalize()
+    return " ".join(tokens) + rng.choice([".", ".", ".", "?", "!"])
+
+
+def _english_prose(rng: random.Random, target_words: int, extras: list, extra_rate: float) -> str:
+    sentences = []
+    total = 0
+    while total < target_words:
+        length = min(rng.randint(6, 24), max(target_words - total, 3))
+        sentence = _sentence(rng, ENGLISH_WORDS + VERBS, CONNECTORS, length)
+        if rng.random() < extra_rate:
+            sentence = f"{rng.choice(extras)} {sentence[0].lower()}{sentence[1:]}"
+        sentences.append(sentence)
+        total += len(sentence.split())
+    return " ".join(sentences)
+
+
+def _fill(rng: random.Random, template: str) -> str:
+    return template.format(
+        n=rng.randint(2, 950), m=rng.randint(0, 999), yy=rng.randint(10, 29), name=rng.choice(PROPER_NOUNS)
+    )
+
+
+def _passage(category: str, rng: random.Random) -> str:
+    if category == "short":
+        return _english_prose(rng, rng.randint(10, 60), PROPER_NOUNS, 0.3)
+    if category == "optimal":
+        subject = rng.choice(PROPER_NOUNS)
+        lead = f"{subject} is a {rng.choice(ENGLISH_WORDS)} {rng.choice(ENGLISH_WORDS)} that {rng.choice(VERBS)} {rng.choice(ENGLISH_WORDS)}."
+        body = _english_prose(rng, rng.randint(125, 155), [_fill(rng, p) for p in STRUCTURE_PHRASES], 0.35)
+        return f"{lead} {body}"
+    if category == "long":
+        paragraphs = [
+            _english_prose(rng, rng.randint(60, 150), [_fill(rng, p) for p in STRUCTURE_PHRASES], 0.2)
+            for _ in range(rng.randint(3, 5))
+        ]
+        return "\n".join(paragraphs)
+    if category == "stat_heavy":
+        stats = [_fill(rng, rng.choice(STAT_FRAGMENTS)) for _ in range(12)]
+        return _english_prose(rng, rng.randint(90, 180), stats, 0.7)
+    if category == "pronoun_heavy":
+        return _english_prose(rng, rng.randint(60, 200), [p.capitalize() for p in PRONOUNS] + PRONOUNS, 0.8)
+    if category == "multilingual":
+        language = rng.choice(["sr", "ar", "mixed"])
+        length = rng.randint(40, 200)
+        sentences = []
+        total = 0
+        while total < length:
+            n = rng.randint(6, 20)
+            if language == "sr" or (language == "mixed" and rng.random() < 0.5):
+                sentence = _sentence(rng, SERBIAN_WORDS, SERBIAN_CONNECTORS, n)
+            elif language == "ar" or rng.random() < 0.5:
+                sentence = _sentence(rng, ARABIC_WORDS, ARABIC_CONNECTORS, n, capitalize=False)
+            else:
+                sentence = _sentence(rng, ENGLISH_WORDS + VERBS, CONNECTORS, n)
+            if rng.random() < 0.2:
+                sentence += f" {_fill(rng, rng.choice(STAT_FRAGMENTS))}"
+            sentences.append(sentence)
+            total += len(sentence.split())
+        return " ".join(sentences)
+    raise ValueError(f"Unknown category: {category}")
+
+
+def build_corpus(per_category: int = 200, seed: int = 7) -> list:
+    """Return [{"id", "category", "text", "heading"}, ...] in a fixed order."""
+    corpus = []
+    for category in CATEGORIES:
+        rng = random.Random(f"{seed}:{category}")
+        for i in range(per_category):
+            corpus.append(
+                {
+                    "id": f"{category}-{i:04d}",
+                    "category": category,
+                    "text": _passage(category, rng),
+                    "heading": rng.choice(HEADINGS),
+                }
+            )
+    return corpus
+
+
+def corpus_digest(corpus: list) -> str:
+    """Hash of every passage and heading, to detect generator drift."""
+    digest = hashlib.sha256()
+    for passage in corpus:
+        digest.update(f"{passage['id']}\x1f{passage['heading']!r}\x1f{passage['text']}\x1e".encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,155 @@
+"""
+Local stand-in for the Wikipedia and Wikidata APIs used by brand_scanner.
+
+Serves /wikipedia/w/api.php and /wikidata/w/api.php on 127.0.0.1 from a
+small in-memory brand list, with a configurable delay per API so timing
+and timeout behaviour can be measured without touching the real
+services. It answers the calls brand_scanner makes: full-text search,
+batched title lookups (with normalization, redirects and disambiguation
+pages), wbsearchentities and batched wbgetentities. Every request is
+counted per API and per action.
+
+    with WikiStandin(delays={"wikidata": 0.5}) as api:
+        generate_brand_report("Acme", wikipedia_api=api.wikipedia, wikidata_api=api.wikidata)
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# (Wikipedia article title, Wikidata id, Wikidata description)
+BRANDS = [
+    ("Acme Corporation", "Q1", "fictional company"),
+    ("Globex", "Q2", "multinational conglomerate"),
+    ("Initech", "Q3", "software company"),
+    ("Umbrella Corporation", "Q4", "pharmaceutical company"),
+    ("Stark Industries", "Q5", "defense contractor"),
+]
+REDIRECTS = {"Acme": "Acme Corporation", "Initech Inc.": "Initech"}
+DISAMBIGUATION = {"Umbrella"}
+
+
+def synthetic_brands(count: int, start: int = 100) -> list:
+    """count extra brands with ids from Q<start>, for scale tests."""
+    return [(f"Brand {i:05d} Labs", f"Q{start + i}", f"company number {i}") for i in range(count)]
+
+
+def _normalize_title(title: str) -> str:
+    title = " ".join(title.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+
+def _wikipedia(brands: list, params: dict) -> dict:
+    if "titles" in params:
+        by_title = {title: qid for title, qid, _ in brands}
+        query = {"normalized": [], "redirects": [], "pages": []}
+        for title in params["titles"].split("|"):
+            target = _normalize_title(title)
+            if target != title:
+                query["normalized"].append({"from": title, "to": target})
+            if target in REDIRECTS:
+                query["redirects"].append({"from": target, "to": REDIRECTS[target]})
+                target = REDIRECTS[target]
+            if target in by_title:
+                query["pages"].append({"pageid": 1, "title": target, "pageprops": {"wikibase_item": by_title[target]}})
+            elif target in DISAMBIGUATION:
+                query["pages"].append({"pageid": 2, "title": target, "pageprops": {"disambiguation": ""}})
+            else:
+                query["pages"].append({"title": target, "missing": True})
+        return {"batchcomplete": True, "query": query}
+    search = params.get("srsearch", "").lower()
+    hits = [title for title, _, _ in brands if search in title.lower()]
+    return {"query": {"search": [{"title": title, "pageid": i} for i, title in enumerate(hits, 1)]}}
+
+
+def _wikidata(brands: list, params: dict) -> dict:
+    if params.get("action") == "wbgetentities":
+        by_id = {qid: (title, desc) for title, qid, desc in brands}
+        entities = {}
+        for qid in params.get("ids", "").split("|"):
+            if qid not in by_id:
+                entities[qid] = {"id": qid, "missing": ""}
+                continue
+            title, desc = by_id[qid]
+            entities[qid] = {
+                "id": qid,
+                "labels": {"en": {"language": "en", "value": title}},
+                "descriptions": {"en": {"language": "en", "value": desc}},
+                "sitelinks": {"enwiki": {"site": "enwiki", "title": title}},
+            }
+        return {"entities": entities, "success": 1}
+    search = params.get("search", "").lower()
+    hits = [(title, qid, desc) for title, qid, desc in brands if search in title.lower()]
+    return {"search": [{"id": qid, "label": title, "description": desc} for title, qid, desc in hits]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        api = parts.path.strip("/").split("/", 1)[0]
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        server = self.server
+        with server.lock:
+            server.requests[api] += 1
+            # "search", "titles", "wbsearchentities" or "wbgetentities"
+            server.actions[params.get("list") or ("titles" if "titles" in params else params.get("action"))] += 1
+        time.sleep(server.delays.get(api, 0))
+        if api == "wikipedia":
+            body = _wikipedia(server.brands, params)
+        elif api == "wikidata":
+            body = _wikidata(server.brands, params)
+        else:
+            self.send_error(404)
+            return
+        payload = json.dumps(body).encode("utf-8")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except OSError:
+            # The client gave up waiting
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WikiStandin:
+    """Stand-in API server running on a background thread."""
+
+    def __init__(self, delays: dict = None, brands: list = None):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.brands = list(BRANDS if brands is None else brands)
+        self._server.actions = Counter()
+        self._server.delays = dict(delays or {})
+        self._server.requests = Counter()
+        self._server.lock = threading.Lock()
+        base = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.wikipedia = f"{base}/wikipedia/w/api.php"
+        self.wikidata = f"{base}/wikidata/w/api.php"
+
+    @property
+    def delays(self) -> dict:
+        return self._server.delays
+
+    @property
+    def requests(self) -> Counter:
+        return self._server.requests
+
+    @property
+    def actions(self) -> Counter:
+        return self._server.actions
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
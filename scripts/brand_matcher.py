@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Brand Matcher — Fuzzy brand-name matching against entity lists.
+
+"Acme Corp." and "ACME Corporation" are the same brand; "Meta" and
+"Metallica" are not. Names are normalized before comparison: accents
+folded, case folded, "&" read as "and", punctuation dropped, a leading
+"The", parenthesized qualifiers ("Amazon (company)"), domain endings
+("Salesforce.com") and trailing legal suffixes (Inc., Corp., GmbH,
+d.o.o., ...) removed.
+
+Similarity is the Dice coefficient over character trigrams of the
+normalized names. BrandMatcher keeps an inverted trigram index over every
+label and alias in an entity list. Two names scoring at least min_score
+have similar trigram counts and share a minimum number of trigrams, so
+with every name's trigrams ordered rarest first, they must share one
+among the first few of each (prefix filtering), at positions that still
+leave room for the rest of the overlap (positional filtering). Indexing
+one trigram more than that per name means a true match shares two in
+those extended prefixes, so names sharing only one, the bulk of what
+the plain prefix lets through, are dropped by counting before any score
+is computed. Only prefix trigrams are indexed, bucketed by name size and
+sorted by position, so a lookup is a handful of slices counted in C;
+common trigrams never produce candidates, and the few candidates are
+then scored exactly. A name whose exact form already fills the match
+limit only looks further for names scoring 1.0. Very short names only
+match exactly; at three or four letters, trigram overlap says little.
+"""
+
+import re
+import sys
+import json
+import math
+import bisect
+import argparse
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Optional
+
+# Lowest similarity that counts as the same brand
+MIN_SCORE = 0.8
+# Names this short (letters and digits) must match exactly
+SHORT_NAME_CHARS = 4
+# Prefix trigrams a candidate must share before it is scored (see above)
+PREFIX_OVERLAP = 2
+
+LEGAL_SUFFIXES = frozenset(
+    """
+    inc incorporated corp corporation co company cos llc llp lp ltd limited plc pllc
+    gmbh mbh ag kg kgaa ug se sa sas sarl sl srl spa sp bv nv ab as asa aps oy oyj
+    pty pvt kk doo ad dd sro zrt nyrt bhd sdn tbk
+    """.split()
+)
+
+_QUALIFIER_RE = re.compile(r"\s*\([^)]*\)")
+_DOMAIN_RE = re.compile(r"\.(?:com|net|org|io|ai|co)\b", re.IGNORECASE)
+_JOINED_RE = re.compile(r"(?<=\w)[.'’](?=\w)|[.'’](?=\s|$)")
+_PUNCT_RE = re.compile(r"[^\w\s]|_")
+
+
+def normalize_name(name: str) -> str:
+    """Comparable form of a brand name (see module docstring)."""
+    text = unicodedata.normalize("NFKD", _DOMAIN_RE.sub("", _QUALIFIER_RE.sub(" ", name)))
+    text = "".join(char for char in text if not unicodedata.combining(char)).casefold()
+    text = text.replace("&", " and ")
+    # "Inc." and "McDonald's" lose the mark without splitting the word
+    text = _PUNCT_RE.sub(" ", _JOINED_RE.sub("", text))
+    words = text.split()
+    if words and words[0] == "the" and len(words) > 1:
+        words = words[1:]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def name_grams(normalized: str) -> set:
+    """Character trigrams of a normalized name, padded so word edges count.
+
+    Grams are interned: an index holds one copy of each, and shared grams
+    compare by identity.
+    """
+    padded = f" {normalized} "
+    return {sys.intern(padded[i : i + 3]) for i in range(len(padded) - 2)}
+
+
+def _is_short(normalized: str) -> bool:
+    return sum(1 for char in normalized if char.isalnum()) <= SHORT_NAME_CHARS
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Similarity of two brand names, 0.0 to 1.0."""
+    a, b = normalize_name(a), normalize_name(b)
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    if _is_short(a) or _is_short(b):
+        return 0.0
+    grams_a, grams_b = name_grams(a), name_grams(b)
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+def same_brand(a: str, b: str, min_score: float = MIN_SCORE) -> bool:
+    return name_similarity(a, b) >= min_score
+
+
+class BrandMatcher:
+    """Trigram index over entity names for fast fuzzy brand resolution.
+
+    Entities are dicts; names come from their "label" and "aliases" (the
+    record shape wikidata_index produces), or are given to add().
+    """
+
+    def __init__(self, min_score: float = MIN_SCORE):
+        self.min_score = min_score
+        self._records = []
+        # (normalized name, record index, grams); a tuple of grams takes a fifth
+        # of a frozenset's memory, and scoring looks them up in the query's set
+        self._names = []
+        self._exact = {}
+        self._postings = {}
+        # Built on the first match after names are added:
+        # gram -> (name sizes ascending, [(positions, name indexes) per size]),
+        # flat arrays so a lookup reads contiguous memory however big the index
+        self._frequency = None
+        self._prefix_postings = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def from_records(cls, records, min_score: float = MIN_SCORE) -> "BrandMatcher":
+        matcher = cls(min_score)
+        for record in records:
+            matcher.add_record(record)
+        return matcher
+
+    def add_record(self, record: dict) -> None:
+        names = [record.get("label", ""), *record.get("aliases", [])]
+        self.add(names, record)
+
+    def add(self, names, record: Optional[dict] = None) -> None:
+        """Index a record under one name or a list of names."""
+        if isinstance(names, str):
+            names = [names]
+        record_index = len(self._records)
+        self._records.append(record if record is not None else {"label": names[0]})
+        for normalized in {normalize_name(name) for name in names if name}:
+            if not normalized:
+                continue
+            name_index = len(self._names)
+            # Very short names only match exactly, so they stay out of the trigram index
+            grams = () if _is_short(normalized) else tuple(name_grams(normalized))
+            self._names.append((normalized, record_index, grams))
+            self._exact.setdefault(normalized, []).append(name_index)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(name_index)
+        self._prefix_postings = None
+
+    def _ordered(self, grams) -> list:
+        """grams rarest first; ties broken by the gram so every name agrees."""
+        frequency = self._frequency
+        return sorted(grams, key=lambda gram: (frequency.get(gram, 0), gram))
+
+    def _compile(self) -> None:
+        self._frequency = {gram: len(ids) for gram, ids in self._postings.items()}
+        t = self.min_score
+        buckets = {}
+        for name_index, (_, _, grams) in enumerate(self._names):
+            if not grams:
+                continue
+            size = len(grams)
+            # Dice >= t with a name of any size forces t * size / (2 - t) shared grams
+            min_shared = max(1, math.ceil(t * size / (2 - t) - 1e-9))
+            for position, gram in enumerate(self._ordered(grams)[: size - min_shared + PREFIX_OVERLAP]):
+                buckets.setdefault(gram, {}).setdefault(size, []).append((position, name_index))
+        postings = {}
+        for gram, sizes in buckets.items():
+            ordered_sizes = sorted(sizes)
+            lists = []
+            for size in ordered_sizes:
+                entries = sorted(sizes[size])
+                positions = array("H", [position for position, _ in entries])
+                lists.append((positions, array("i", [name_index for _, name_index in entries])))
+            postings[gram] = (ordered_sizes, lists)
+        self._prefix_postings = postings
+
+    def _candidates(self, grams, min_score: float) -> set:
+        """Indexes of every name that could score min_score against grams."""
+        size = len(grams)
+        ordered = self._ordered(grams)
+        candidates = set()
+        if min_score < self.min_score:
+            # Indexed prefixes only hold for the matcher's own min_score
+            min_shared = max(1, math.ceil(min_score * size / (2 - min_score) - 1e-9))
+            for gram in ordered[: size - min_shared + 1]:
+                candidates.update(self._postings.get(gram, ()))
+            return candidates
+        low = size * min_score / (2 - min_score) - 1e-9
+        high = size * (2 - min_score) / min_score + 1e-9
+        # Shared grams each size needs, for sizes in [low, high]
+        needed = {
+            other_size: max(1, math.ceil(min_score * (size + other_size) / 2 - 1e-9))
+            for other_size in range(max(1, math.ceil(low)), math.floor(high) + 1)
+        }
+        if not needed:
+            return candidates
+        smallest, largest = min(needed), max(needed)
+        # Names sharing min_shared grams share their first `overlap` within the
+        # first size - min_shared + overlap grams of each
+        overlap = min(PREFIX_OVERLAP, needed[smallest])
+        postings = self._prefix_postings
+        hits = []
+        for position, gram in enumerate(ordered[: size - needed[smallest] + overlap]):
+            entry = postings.get(gram)
+            if entry is None:
+                continue
+            sizes, lists = entry
+            for k in range(bisect.bisect_left(sizes, smallest), bisect.bisect_right(sizes, largest)):
+                other_size = sizes[k]
+                min_shared = needed[other_size]
+                # Bigger names need more shared grams: none of them has room left either
+                if position >= size - min_shared + overlap:
+                    break
+                positions, name_indexes = lists[k]
+                hits.extend(name_indexes[: bisect.bisect_left(positions, other_size - min_shared + overlap)])
+        if overlap == 1:
+            return set(hits)
+        return {name_index for name_index, count in Counter(hits).items() if count >= overlap}
+
+    def match(self, name: str, limit: int = 5, min_score: Optional[float] = None) -> list:
+        """Records matching name, best first, each with "score" and "matched_name"."""
+        min_score = self.min_score if min_score is None else min_score
+        key = normalize_name(name)
+        if not key:
+            return []
+        scores = {name_index: 1.0 for name_index in self._exact.get(key, ())}
+        if len({self._names[name_index][1] for name_index in scores}) >= limit:
+            # Exact names fill the limit; only another name scoring 1.0 could still place
+            min_score = 1.0
+        if not _is_short(key):
+            if self._prefix_postings is None:
+                self._compile()
+            grams = name_grams(key)
+            size = len(grams)
+            names = self._names
+            for name_index in self._candidates(grams, min_score):
+                if name_index in scores:
+                    continue
+                other = names[name_index][2]
+                score = 2 * len(grams.intersection(other)) / (size + len(other))
+                if score >= min_score:
+                    scores[name_index] = score
+
+        # Ties go to the first-added record and name, however candidates were found
+        best = {}
+        for name_index, score in sorted(scores.items()):
+            normalized, record_index, _ = self._names[name_index]
+            if record_index not in best or score > best[record_index][0]:
+                best[record_index] = (score, normalized)
+        ranked = sorted(
+            best.items(), key=lambda item: (-item[1][0], -self._records[item[0]].get("sitelinks", 0), item[0])
+        )
+        return [
+            dict(self._records[record_index], score=round(score, 3), matched_name=normalized)
+            for record_index, (score, normalized) in ranked[:limit]
+        ]
+
+    def best(self, name: str) -> Optional[dict]:
+        """The best-matching record for name, or None."""
+        matches = self.match(name, limit=1)
+        return matches[0] if matches else None
+
+
+def load_records(path: str) -> list:
+    """Entity records from a JSON list, JSON lines, or plain lines of names."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        return [r if isinstance(r, dict) else {"label": str(r)} for r in json.loads(stripped)]
+    records = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        records.append(json.loads(line) if line.startswith("{") else {"label": line})
+    return records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match brand names against an entity list. Returns JSON.")
+    parser.add_argument("names", nargs="+", metavar="name", help="brand names to resolve")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--entities", metavar="PATH", help="JSON list, JSON lines or one name per line")
+    source.add_argument("--wikidata-index", metavar="PATH", help="index built by wikidata_index.py")
+    source.add_argument("--cache", metavar="PATH", help="brand_scanner entity cache (its Wikidata entities)")
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE, help=f"default: {MIN_SCORE}")
+    parser.add_argument("--limit", type=int, default=3, help="matches per name (default: 3)")
+    args = parser.parse_args()
+
+    if args.wikidata_index:
+        from wikidata_index import WikidataIndex
+
+        with WikidataIndex(args.wikidata_index) as index:
+            matcher = BrandMatcher.from_records(index.iter_records(), args.min_score)
+    elif args.cache:
+        from entity_cache import EntityCache
+
+        with EntityCache(args.cache) as cache:
+            matcher = BrandMatcher.from_records(cache.entity_records(), args.min_score)
+    else:
+        matcher = BrandMatcher.from_records(load_records(args.entities), args.min_score)
+    output = {name: matcher.match(name, args.limit) for name in args.names}
+    print(json.dumps(output, indent=2, ensure_ascii=False))
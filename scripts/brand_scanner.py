@@ -16,6 +16,12 @@ Platform importance for AI citations:
 import sys
 import json
 import re
+import time
+import argparse
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Optional, Union
 from urllib.parse import quote_plus
 
 try:
@@ -25,12 +31,55 @@ except ImportError:
     print("ERROR: Required packages not installed. Run: pip install requests beautifulsoup4")
     sys.exit(1)
 
+from brand_matcher import MIN_SCORE, BrandMatcher, load_records, name_similarity
+from entity_cache import EntityCache, normalize_brand
+from wikidata_index import WikidataIndex
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# API endpoints; point these at a local stand-in server for testing
+WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
+WIKIDATA_API = "https://www.wikidata.org/w/api.php"
+
+# Seconds a whole brand report may take; platform checks run concurrently
+# and their HTTP calls share this budget
+REPORT_DEADLINE = 20
+DEADLINE_GRACE = 0.5
+
+# Multi-brand scans: API requests per second across all brands, brands
+# looked up at once, and the most titles or ids one API call accepts
+RATE_LIMIT = 10
+SCAN_WORKERS = 8
+API_BATCH_SIZE = 50
+# Wikipedia search results compared with the brand name
+SEARCH_MATCH_RESULTS = 3
+
+# Offline entity lookups: an exact index, or a fuzzy matcher over entity records
+EntitySource = Union[WikidataIndex, BrandMatcher]
+
+PLATFORM_NAMES = {
+    "youtube": "YouTube",
+    "reddit": "Reddit",
+    "wikipedia": "Wikipedia",
+    "linkedin": "LinkedIn",
+    "other": "Other Platforms",
+}
+
+OVERALL_RECOMMENDATIONS = [
+    "Priority 1: YouTube — highest correlation (0.737) with AI citations. Create educational content.",
+    "Priority 2: Reddit — build authentic presence in industry subreddits. No marketing speak.",
+    "Priority 3: Wikipedia — establish notability through press coverage, then create/improve entry.",
+    "Priority 4: LinkedIn — thought leadership content from founders and employees.",
+    "Priority 5: Review platforms — G2, Trustpilot, Capterra for social proof signals.",
+    "Cross-platform: Ensure consistent NAP (Name, Address, Phone) across all platforms.",
+    "Schema markup: Add sameAs property linking to ALL platform profiles.",
+    "Monitor: Set up brand mention alerts across all platforms.",
+]
+
 
 def check_youtube_presence(brand_name: str) -> dict:
     """Check brand presence on YouTube."""
@@ -101,9 +150,219 @@ def check_reddit_presence(brand_name: str) -> dict:
     return result
 
 
-def check_wikipedia_presence(brand_name: str) -> dict:
-    """Check brand/entity presence on Wikipedia and Wikidata."""
-    result = {
+def _timed(check, *args) -> tuple:
+    """Run check(*args); return (its result, {"status", "elapsed_ms"[, "error"]})."""
+    started = time.monotonic()
+    try:
+        found = check(*args)
+        status = {"status": "ok"}
+    except Exception as e:
+        found = {}
+        status = {"status": "error", "error": str(e)}
+    status["elapsed_ms"] = round((time.monotonic() - started) * 1000)
+    return found, status
+
+
+class ApiClient:
+    """JSON GETs against the Wikipedia/Wikidata APIs, shared across threads.
+
+    Identical queries are sent once: later and concurrent callers get the
+    first answer (or its error). With rate_limit set, requests from all
+    threads together are spaced to at most that many per second. With an
+    EntityCache attached, lookup() answers from it while entries are fresh
+    and falls back to expired entries when the API fails; offline=True
+    sends no requests at all.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 15,
+        rate_limit: Optional[float] = None,
+        cache: Optional[EntityCache] = None,
+        offline: bool = False,
+    ):
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self._interval = 1 / rate_limit if rate_limit else 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        self._queries = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def _wait_turn(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        time.sleep(slot - now)
+
+    def get(self, api: str, params: dict) -> dict:
+        if self.offline:
+            raise ConnectionError("offline: lookup not in the entity cache")
+        key = (api, tuple(sorted(params.items())))
+        with self._lock:
+            future = self._queries.get(key)
+            owner = future is None
+            if owner:
+                future = self._queries[key] = Future()
+                self.requests += 1
+            else:
+                self.coalesced += 1
+        if owner:
+            try:
+                self._wait_turn()
+                response = requests.get(
+                    api, params={**params, "format": "json"}, headers=DEFAULT_HEADERS, timeout=self.timeout
+                )
+                response.raise_for_status()
+                future.set_result(response.json())
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    def cached(self, kind: str, api: str, key: str) -> Optional[dict]:
+        """Fresh cached value for a lookup, or None (also when no cache is attached)."""
+        return self.cache.get(kind, api, key) if self.cache is not None else None
+
+    def stale(self, kind: str, api: str, key: str) -> Optional[dict]:
+        """Cached value for a lookup however old, for when the API call failed."""
+        return self.cache.get(kind, api, key, stale=True) if self.cache is not None else None
+
+    def remember(self, kind: str, api: str, key: str, value: dict) -> None:
+        if self.cache is not None:
+            self.cache.put(kind, api, key, value)
+
+    def lookup(self, kind: str, api: str, key: str, fetch) -> dict:
+        """fetch() through the entity cache; {} means nothing was found."""
+        value = self.cached(kind, api, key)
+        if value is not None:
+            return value
+        try:
+            value = fetch()
+        except Exception:
+            value = self.stale(kind, api, key)
+            if value is None:
+                raise
+            return value
+        self.remember(kind, api, key, value)
+        return value
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "coalesced": self.coalesced}
+
+
+def _search_wikipedia(client: ApiClient, brand_name: str, api: str) -> dict:
+    def fetch():
+        data = client.get(api, {"action": "query", "list": "search", "srsearch": brand_name})
+        titles = [result.get("title", "") for result in data.get("query", {}).get("search", [])]
+        return {"titles": titles} if titles else {}
+
+    # The cache keeps the search results; matching is redone on every run
+    titles = client.lookup("wikipedia_search", api, normalize_brand(brand_name), fetch).get("titles", [])
+    found = {}
+    if titles:
+        found["wikipedia_search_results"] = len(titles)
+        # The brand has a page if a top result is the same name, give or
+        # take legal suffixes, punctuation and accents
+        score, title = max((name_similarity(brand_name, title), title) for title in titles[:SEARCH_MATCH_RESULTS])
+        if score >= MIN_SCORE:
+            found["has_wikipedia_page"] = True
+            found["wikipedia_title"] = title
+            found["match_score"] = round(score, 3)
+    return found
+
+
+def _search_wikidata(client: ApiClient, brand_name: str, api: str) -> dict:
+    def fetch():
+        data = client.get(api, {"action": "wbsearchentities", "search": brand_name, "language": "en"})
+        found = {}
+        entities = data.get("search", [])
+        if entities:
+            found["has_wikidata_entry"] = True
+            found["wikidata_id"] = entities[0].get("id", "")
+            found["wikidata_description"] = entities[0].get("description", "")
+        return found
+
+    return client.lookup("wikidata_search", api, normalize_brand(brand_name), fetch)
+
+
+def _lookup_titles(client: ApiClient, titles: list, api: str) -> dict:
+    """Articles titled exactly as each of titles (one request, up to API_BATCH_SIZE).
+
+    Follows the API's title normalization and redirects; disambiguation
+    pages don't count. Returns {title: {"title", "wikidata_id"}} for hits.
+    """
+    data = client.get(
+        api,
+        {
+            "action": "query",
+            "titles": "|".join(titles),
+            "redirects": "1",
+            "prop": "pageprops",
+            "ppprop": "wikibase_item|disambiguation",
+            "formatversion": "2",
+        },
+    )
+    query = data.get("query", {})
+    normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+    redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+    pages = {
+        page["title"]: page
+        for page in query.get("pages", [])
+        if not page.get("missing") and not page.get("invalid") and "disambiguation" not in page.get("pageprops", {})
+    }
+    found = {}
+    for title in titles:
+        target = normalized.get(title, title)
+        page = pages.get(redirects.get(target, target))
+        if page:
+            found[title] = {"title": page["title"], "wikidata_id": page.get("pageprops", {}).get("wikibase_item", "")}
+    return found
+
+
+def _get_entities(client: ApiClient, ids: list, api: str) -> dict:
+    """Wikidata entities for ids (one request, up to API_BATCH_SIZE), keyed by id."""
+    data = client.get(
+        api,
+        {
+            "action": "wbgetentities",
+            "ids": "|".join(ids),
+            "props": "labels|descriptions|sitelinks",
+            "languages": "en",
+            "sitefilter": "enwiki",
+        },
+    )
+    return {qid: entity for qid, entity in data.get("entities", {}).items() if "missing" not in entity}
+
+
+def _batches(items: list, size: int = API_BATCH_SIZE) -> list:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _index_presence(index: EntitySource, brand_name: str) -> dict:
+    """Presence fields for a brand from an offline entity source."""
+    entity = index.best(brand_name)
+    if entity is None:
+        return {}
+    found = {
+        "has_wikidata_entry": bool(entity.get("id")),
+        "wikidata_id": entity.get("id", ""),
+        "wikidata_description": entity.get("description", ""),
+    }
+    if entity.get("wikipedia_title"):
+        found["has_wikipedia_page"] = True
+        found["wikipedia_title"] = entity["wikipedia_title"]
+    if "score" in entity:
+        found["match_score"] = entity["score"]
+    return found
+
+
+def _wikipedia_platform(brand_name: str) -> dict:
+    return {
         "platform": "Wikipedia",
         "correlation": "High",
         "weight": "20%",
@@ -112,51 +371,211 @@ def check_wikipedia_presence(brand_name: str) -> dict:
         "cited_in_articles": False,
         "search_url": f"https://en.wikipedia.org/wiki/Special:Search?search={quote_plus(brand_name)}",
         "wikidata_url": f"https://www.wikidata.org/w/index.php?search={quote_plus(brand_name)}",
-        "recommendations": [],
+        "recommendations": [
+            "If eligible, create a Wikipedia article (requires notability criteria)",
+            "Ensure Wikidata entry exists with complete structured data",
+            "Add sameAs links in schema markup pointing to Wikipedia/Wikidata",
+            "Get cited in existing Wikipedia articles as a source",
+            "Build notability through press coverage and independent reviews",
+            "Note: Wikipedia has strict notability guidelines — PR coverage helps establish this",
+        ],
     }
 
-    # Check Wikipedia API
-    try:
-        api_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={quote_plus(brand_name)}&format=json"
-        response = requests.get(api_url, headers=DEFAULT_HEADERS, timeout=15)
-        if response.status_code == 200:
-            data = response.json()
-            search_results = data.get("query", {}).get("search", [])
-            if search_results:
-                # Check if top result is about the brand
-                top_title = search_results[0].get("title", "").lower()
-                if brand_name.lower() in top_title:
-                    result["has_wikipedia_page"] = True
-                result["wikipedia_search_results"] = len(search_results)
-    except Exception:
-        pass
-
-    # Check Wikidata
-    try:
-        wikidata_url = f"https://www.wikidata.org/w/api.php?action=wbsearchentities&search={quote_plus(brand_name)}&language=en&format=json"
-        response = requests.get(wikidata_url, headers=DEFAULT_HEADERS, timeout=15)
-        if response.status_code == 200:
-            data = response.json()
-            entities = data.get("search", [])
-            if entities:
-                result["has_wikidata_entry"] = True
-                result["wikidata_id"] = entities[0].get("id", "")
-                result["wikidata_description"] = entities[0].get("description", "")
-    except Exception:
-        pass
 
-    result["recommendations"] = [
-        "If eligible, create a Wikipedia article (requires notability criteria)",
-        "Ensure Wikidata entry exists with complete structured data",
-        "Add sameAs links in schema markup pointing to Wikipedia/Wikidata",
-        "Get cited in existing Wikipedia articles as a source",
-        "Build notability through press coverage and independent reviews",
-        "Note: Wikipedia has strict notability guidelines — PR coverage helps establish this",
-    ]
+def check_wikipedia_presence(
+    brand_name: str,
+    timeout: float = 15,
+    wikipedia_api: str = WIKIPEDIA_API,
+    wikidata_api: str = WIKIDATA_API,
+    cache: Optional[EntityCache] = None,
+    offline: bool = False,
+    index: Optional[EntitySource] = None,
+) -> dict:
+    """Check brand/entity presence on Wikipedia and Wikidata.
+
+    Both API calls run concurrently and the check returns within timeout
+    seconds; "lookups" records each call's status and time. Lookups found
+    fresh in cache make no API call; offline=True answers from cache only.
+    With an entity source (a WikidataIndex, or a BrandMatcher for fuzzy
+    matching) no API is called: its best match for the brand, and that
+    entity's English Wikipedia sitelink, decide presence.
+    """
+    result = _wikipedia_platform(brand_name)
+    if index is not None:
+        found, status = _timed(_index_presence, index, brand_name)
+        result.update(found)
+        result["lookups"] = {"wikidata_index": status}
+        return result
+
+    client = ApiClient(timeout=timeout, cache=cache, offline=offline)
+
+    # Wikipedia search and Wikidata entity lookup run side by side
+    lookups = {
+        "wikipedia": (_search_wikipedia, wikipedia_api),
+        "wikidata": (_search_wikidata, wikidata_api),
+    }
+    pool = ThreadPoolExecutor(max_workers=len(lookups))
+    futures = {
+        name: pool.submit(_timed, search, client, brand_name, api) for name, (search, api) in lookups.items()
+    }
+    done, _ = wait(futures.values(), timeout=timeout)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    result["lookups"] = {}
+    for name, future in futures.items():
+        if future not in done:
+            result["lookups"][name] = {"status": "timeout", "elapsed_ms": round(timeout * 1000)}
+            continue
+        found, status = future.result()
+        result.update(found)
+        result["lookups"][name] = status
 
     return result
 
 
+def check_wikipedia_presence_many(
+    brand_names: list,
+    client: ApiClient,
+    wikipedia_api: str = WIKIPEDIA_API,
+    wikidata_api: str = WIKIDATA_API,
+    workers: int = SCAN_WORKERS,
+    index: Optional[EntitySource] = None,
+) -> dict:
+    """Wikipedia/Wikidata presence for many brands with batched API calls.
+
+    Brands are first looked up as exact article titles, API_BATCH_SIZE per
+    request; the article's Wikidata id comes back with it. Brands without
+    an article fall back to the per-brand searches check_wikipedia_presence()
+    makes. All Wikidata ids are then fetched with wbgetentities,
+    API_BATCH_SIZE per request. Returns {brand_name: platform result};
+    "matched_by" says whether the brand resolved by "title" or "search".
+    With an entity source every brand is looked up there instead
+    ("matched_by": "index") and no API is called.
+    """
+    results = {name: _wikipedia_platform(name) for name in brand_names}
+    for result in results.values():
+        result["matched_by"] = None
+        result["errors"] = []
+    if index is not None:
+        for name, result in results.items():
+            found, status = _timed(_index_presence, index, name)
+            result.update(found)
+            if found:
+                result["matched_by"] = "index"
+            if status["status"] == "error":
+                result["errors"].append(status["error"])
+            else:
+                del result["errors"]
+        return results
+    titles = {}
+    searches = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # Round 1: exact titles; "|" separates titles, so such names are searched
+        uncached = []
+        for name in brand_names:
+            if "|" in name:
+                continue
+            hit = client.cached("wikipedia_title", wikipedia_api, normalize_brand(name))
+            if hit is None:
+                uncached.append(name)
+            elif hit:
+                titles[name] = hit
+        batches = _batches(uncached)
+        for batch, future in [(batch, pool.submit(_lookup_titles, client, batch, wikipedia_api)) for batch in batches]:
+            try:
+                found = future.result()
+            except Exception as e:
+                for name in batch:
+                    hit = client.stale("wikipedia_title", wikipedia_api, normalize_brand(name))
+                    if hit:
+                        titles[name] = hit
+                    elif hit is None:
+                        results[name]["errors"].append(f"Wikipedia title lookup failed: {e}")
+                continue
+            titles.update(found)
+            for name in batch:
+                client.remember("wikipedia_title", wikipedia_api, normalize_brand(name), found.get(name, {}))
+
+        # Round 2: brands without an article, searched one by one
+        misses = [name for name in brand_names if name not in titles]
+        futures = {
+            name: (
+                pool.submit(_timed, _search_wikipedia, client, name, wikipedia_api),
+                pool.submit(_timed, _search_wikidata, client, name, wikidata_api),
+            )
+            for name in misses
+        }
+        for name, pair in futures.items():
+            searches[name] = {}
+            for future in pair:
+                found, status = future.result()
+                searches[name].update(found)
+                if status["status"] == "error":
+                    results[name]["errors"].append(status["error"])
+
+        # Round 3: every Wikidata id found, fetched in batches
+        ids = sorted(
+            {hit["wikidata_id"] for hit in titles.values() if hit["wikidata_id"]}
+            | {found["wikidata_id"] for found in searches.values() if found.get("wikidata_id")}
+        )
+        entities = {}
+        uncached = []
+        for qid in ids:
+            entity = client.cached("wikidata_entity", wikidata_api, qid)
+            if entity is None:
+                uncached.append(qid)
+            elif entity:
+                entities[qid] = entity
+        batches = _batches(uncached)
+        for batch, future in [(batch, pool.submit(_get_entities, client, batch, wikidata_api)) for batch in batches]:
+            try:
+                found = future.result()
+            except Exception as e:
+                unavailable = set()
+                for qid in batch:
+                    entity = client.stale("wikidata_entity", wikidata_api, qid)
+                    if entity:
+                        entities[qid] = entity
+                    elif entity is None:
+                        unavailable.add(qid)
+                for name in brand_names:
+                    if titles.get(name, searches.get(name, {})).get("wikidata_id") in unavailable:
+                        results[name]["errors"].append(f"Wikidata entity lookup failed: {e}")
+                continue
+            entities.update(found)
+            for qid in batch:
+                client.remember("wikidata_entity", wikidata_api, qid, found.get(qid, {}))
+
+    for name, result in results.items():
+        if name in titles:
+            hit = titles[name]
+            result.update(has_wikipedia_page=True, wikipedia_title=hit["title"], matched_by="title")
+            qid = hit["wikidata_id"]
+        elif searches.get(name):
+            result.update(searches[name])
+            result["matched_by"] = "search"
+            qid = searches[name].get("wikidata_id")
+        else:
+            qid = None
+        entity = entities.get(qid)
+        if entity:
+            result["has_wikidata_entry"] = True
+            result["wikidata_id"] = qid
+            result["wikidata_description"] = entity.get("descriptions", {}).get("en", {}).get(
+                "value", result.get("wikidata_description", "")
+            )
+            sitelink = entity.get("sitelinks", {}).get("enwiki", {}).get("title")
+            if sitelink and result["has_wikipedia_page"]:
+                result.setdefault("wikipedia_title", sitelink)
+        elif qid and name in titles:
+            # The article names an id whose entity couldn't be fetched
+            result["wikidata_id"] = qid
+        if not result["errors"]:
+            del result["errors"]
+    return results
+
+
 def check_linkedin_presence(brand_name: str) -> dict:
     """Check brand presence on LinkedIn."""
     result = {
@@ -230,8 +649,25 @@ def check_other_platforms(brand_name: str) -> dict:
     return result
 
 
-def generate_brand_report(brand_name: str, domain: str = None) -> dict:
-    """Generate a comprehensive brand mention report."""
+def generate_brand_report(
+    brand_name: str,
+    domain: str = None,
+    deadline: float = REPORT_DEADLINE,
+    wikipedia_api: str = WIKIPEDIA_API,
+    wikidata_api: str = WIKIDATA_API,
+    cache: Optional[EntityCache] = None,
+    offline: bool = False,
+    index: Optional[EntitySource] = None,
+) -> dict:
+    """Generate a comprehensive brand mention report.
+
+    All platform checks run concurrently and share one deadline, so the
+    report takes as long as the slowest platform, never more than about
+    deadline seconds. "platform_checks" records each platform's status
+    (ok, error or timeout) and time. With an EntityCache, Wikipedia and
+    Wikidata lookups are reused between runs and "entity_cache" reports
+    its hit counts; with an entity source they come from it instead.
+    """
     report = {
         "brand_name": brand_name,
         "domain": domain,
@@ -241,36 +677,215 @@ def generate_brand_report(brand_name: str, domain: str = None) -> dict:
         "overall_recommendations": [],
     }
 
-    # Check all platforms
-    report["platforms"]["youtube"] = check_youtube_presence(brand_name)
-    report["platforms"]["reddit"] = check_reddit_presence(brand_name)
-    report["platforms"]["wikipedia"] = check_wikipedia_presence(brand_name)
-    report["platforms"]["linkedin"] = check_linkedin_presence(brand_name)
-    report["platforms"]["other"] = check_other_platforms(brand_name)
+    # Check all platforms at once
+    checks = {
+        "youtube": (check_youtube_presence, (brand_name,)),
+        "reddit": (check_reddit_presence, (brand_name,)),
+        "wikipedia": (
+            check_wikipedia_presence,
+            (brand_name, deadline, wikipedia_api, wikidata_api, cache, offline, index),
+        ),
+        "linkedin": (check_linkedin_presence, (brand_name,)),
+        "other": (check_other_platforms, (brand_name,)),
+    }
+    started = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=len(checks))
+    futures = {key: pool.submit(_timed, check, *args) for key, (check, args) in checks.items()}
+    # Checks enforce the deadline themselves; the grace covers thread handoff
+    done, _ = wait(futures.values(), timeout=deadline + DEADLINE_GRACE)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    report["platform_checks"] = {}
+    for key, future in futures.items():
+        if future in done:
+            platform, status = future.result()
+            # A platform is only as healthy as its slowest or failed HTTP call
+            lookups = [lookup["status"] for lookup in platform.get("lookups", {}).values()]
+            if "timeout" in lookups:
+                status["status"] = "timeout"
+            elif "error" in lookups:
+                status["status"] = "error"
+            report["platforms"][key] = platform or {"platform": PLATFORM_NAMES[key], "error": status["error"]}
+        else:
+            report["platforms"][key] = {"platform": PLATFORM_NAMES[key], "error": f"Timed out after {deadline}s"}
+            status = {"status": "timeout", "elapsed_ms": round((time.monotonic() - started) * 1000)}
+        report["platform_checks"][key] = status
+    report["elapsed_ms"] = round((time.monotonic() - started) * 1000)
+    if cache is not None:
+        report["entity_cache"] = cache.stats()
 
     # Overall recommendations
-    report["overall_recommendations"] = [
-        "Priority 1: YouTube — highest correlation (0.737) with AI citations. Create educational content.",
-        "Priority 2: Reddit — build authentic presence in industry subreddits. No marketing speak.",
-        "Priority 3: Wikipedia — establish notability through press coverage, then create/improve entry.",
-        "Priority 4: LinkedIn — thought leadership content from founders and employees.",
-        "Priority 5: Review platforms — G2, Trustpilot, Capterra for social proof signals.",
-        "Cross-platform: Ensure consistent NAP (Name, Address, Phone) across all platforms.",
-        "Schema markup: Add sameAs property linking to ALL platform profiles.",
-        "Monitor: Set up brand mention alerts across all platforms.",
-    ]
+    report["overall_recommendations"] = list(OVERALL_RECOMMENDATIONS)
 
     return report
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python brand_scanner.py <brand_name> [domain]")
-        print("Example: python brand_scanner.py 'Acme Corp' acmecorp.com")
-        sys.exit(1)
+def load_brands(path: str) -> list:
+    """Brand names from a text file, one per line; blank lines and # comments are skipped."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def scan_brands(
+    brand_names: list,
+    wikipedia_api: str = WIKIPEDIA_API,
+    wikidata_api: str = WIKIDATA_API,
+    rate_limit: Optional[float] = RATE_LIMIT,
+    workers: int = SCAN_WORKERS,
+    timeout: float = 15,
+    cache: Optional[EntityCache] = None,
+    offline: bool = False,
+    index: Optional[EntitySource] = None,
+) -> dict:
+    """Brand presence report for a set of brands, e.g. a client and its competitors.
+
+    Names differing only in case or spacing are scanned once. Wikipedia and
+    Wikidata are queried in batches (check_wikipedia_presence_many) through
+    one ApiClient, so identical queries are sent once and all requests stay
+    under rate_limit per second. "api" reports requests sent and coalesced;
+    with an EntityCache, cached lookups skip the API and "entity_cache"
+    reports hit counts. offline=True answers from cache only; with an
+    entity source the APIs aren't used at all.
+    """
+    started = time.monotonic()
+    unique = {}
+    for name in brand_names:
+        name = " ".join(name.split())
+        if name:
+            unique.setdefault(normalize_brand(name), name)
+    names = list(unique.values())
+
+    client = ApiClient(timeout=timeout, rate_limit=rate_limit, cache=cache, offline=offline)
+    wikipedia = check_wikipedia_presence_many(names, client, wikipedia_api, wikidata_api, workers, index)
+
+    brands = []
+    for name in names:
+        brands.append(
+            {
+                "brand_name": name,
+                "platforms": {
+                    "youtube": check_youtube_presence(name),
+                    "reddit": check_reddit_presence(name),
+                    "wikipedia": wikipedia[name],
+                    "linkedin": check_linkedin_presence(name),
+                    "other": check_other_platforms(name),
+                },
+            }
+        )
+
+    report = {
+        "analysis_date": "Generated by GEO-SEO Claude Tool",
+        "key_insight": "Brand mentions correlate 3x more strongly with AI visibility than backlinks (Ahrefs Dec 2025, 75K brands)",
+        "brands_requested": len(brand_names),
+        "brands_scanned": len(names),
+        "brands": brands,
+        "api": client.stats(),
+        "elapsed_ms": round((time.monotonic() - started) * 1000),
+        "overall_recommendations": list(OVERALL_RECOMMENDATIONS),
+    }
+    if cache is not None:
+        report["entity_cache"] = cache.stats()
+    return report
 
-    brand = sys.argv[1]
-    domain = sys.argv[2] if len(sys.argv) > 2 else None
 
-    result = generate_brand_report(brand, domain)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check brand presence across AI-cited platforms. Returns JSON.",
+        epilog="Examples: python brand_scanner.py 'Acme Corp' acmecorp.com\n"
+        "          python brand_scanner.py --brands Acme Globex Initech --brands-file competitors.txt",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("brand_name", nargs="?", help="brand to check")
+    parser.add_argument("domain", nargs="?", help="brand's domain")
+    parser.add_argument("--brands", nargs="+", default=[], metavar="NAME", help="scan several brands in one run")
+    parser.add_argument("--brands-file", metavar="PATH", help="text file of brands to scan, one per line")
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=REPORT_DEADLINE,
+        help=f"seconds a single-brand report may take (default: {REPORT_DEADLINE})",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=RATE_LIMIT,
+        help=f"API requests per second in a multi-brand scan (default: {RATE_LIMIT})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCAN_WORKERS,
+        help=f"concurrent lookups in a multi-brand scan (default: {SCAN_WORKERS})",
+    )
+    parser.add_argument("--wikipedia-api", default=WIKIPEDIA_API, help="Wikipedia API endpoint")
+    parser.add_argument("--wikidata-api", default=WIKIDATA_API, help="Wikidata API endpoint")
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite file that keeps Wikipedia/Wikidata lookups between runs",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="answer Wikipedia/Wikidata lookups from --cache only, without API calls",
+    )
+    parser.add_argument(
+        "--wikidata-index",
+        metavar="PATH",
+        help="offline index built by wikidata_index.py; replaces the Wikipedia/Wikidata APIs",
+    )
+    parser.add_argument(
+        "--entities",
+        metavar="PATH",
+        help="entity list (JSON list, JSON lines or one name per line) to match brands against instead",
+    )
+    parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="match --wikidata-index names fuzzily (loads all its names into memory)",
+    )
+    args = parser.parse_args()
+    if args.offline and not args.cache:
+        parser.error("--offline needs --cache")
+    if args.fuzzy and not args.wikidata_index:
+        parser.error("--fuzzy needs --wikidata-index")
+    cache = EntityCache(args.cache) if args.cache else nullcontext()
+    if args.entities:
+        index = nullcontext(BrandMatcher.from_records(load_records(args.entities)))
+    elif args.fuzzy:
+        with WikidataIndex(args.wikidata_index) as wikidata:
+            index = nullcontext(BrandMatcher.from_records(wikidata.iter_records()))
+    elif args.wikidata_index:
+        index = WikidataIndex(args.wikidata_index)
+    else:
+        index = nullcontext()
+
+    with cache as entity_cache, index as wikidata_index:
+        if args.brands or args.brands_file:
+            brands = ([args.brand_name] if args.brand_name else []) + args.brands
+            if args.brands_file:
+                brands += load_brands(args.brands_file)
+            result = scan_brands(
+                brands,
+                wikipedia_api=args.wikipedia_api,
+                wikidata_api=args.wikidata_api,
+                rate_limit=args.rate_limit,
+                workers=args.workers,
+                cache=entity_cache,
+                offline=args.offline,
+                index=wikidata_index,
+            )
+        elif args.brand_name:
+            result = generate_brand_report(
+                args.brand_name,
+                args.domain,
+                deadline=args.deadline,
+                wikipedia_api=args.wikipedia_api,
+                wikidata_api=args.wikidata_api,
+                cache=entity_cache,
+                offline=args.offline,
+                index=wikidata_index,
+            )
+        else:
+            parser.error("give a brand name, --brands or --brands-file")
     print(json.dumps(result, indent=2, default=str))
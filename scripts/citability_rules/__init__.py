@@ -0,0 +1,131 @@
+"""
+Per-language rule packs for citability scoring.
+Supports: English (en), Serbian (sr), Arabic (ar).
+
+Each language module holds a plain RULES dict of pattern strings; a pack is
+compiled the first time a passage in that language is scored and cached
+for the life of the process.
+"""
+
+import re
+import importlib
+
+# Bump whenever scoring rules change so persistent score caches are invalidated.
+# Kept here, away from the scorer's dependencies, so tools that only tag
+# caches with it (llmstxt_generator) don't import the scoring stack.
+SCORER_VERSION = "2"
+
+LANGUAGES = ("en", "sr", "ar")
+DEFAULT_LANGUAGE = "en"
+
+# Patterns compiled from each RULES dict
+PATTERN_KEYS = (
+    "definition_verb",
+    "definition_phrase",
+    "early_answer",
+    "quotable_claim",
+    "sentence_split",
+    "pronoun",
+    "proper_noun",
+    "list_like",
+    "numbered_item",
+    "percent",
+    "currency",
+    "context_number",
+    "year",
+    "original_data",
+    "example",
+    "tool_mention",
+)
+
+# Characters that mark a passage as possibly non-English
+_SCRIPT_HINT_RE = re.compile(
+    r"[\u0400-\u04ff\u0600-\u06ff\u0750-\u077f"  # Cyrillic, Arabic
+    r"\u010c\u010d\u0106\u0107\u0160\u0161\u017d\u017e\u0110\u0111]"  # Serbian Latin letters
+)
+_ARABIC_RE = re.compile(r"[\u0600-\u06ff\u0750-\u077f]")
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04ff]")
+_SERBIAN_LATIN_LETTERS = "\u010d\u0107\u0161\u017e\u0111\u010c\u0106\u0160\u017d\u0110"
+_SERBIAN_WORD_RE = re.compile(r"\b(?:je|su|i|u|na|za|se|da|od|kao|što|ili|ali|sa|koji|koja|koje|nije)\b")
+_ENGLISH_WORD_RE = re.compile(r"\b(?:the|and|of|to|is|are|in|for|with|that|on|by)\b")
+
+# Characters of a passage looked at by detect_language()
+DETECT_SAMPLE_CHARS = 600
+
+_packs = {}
+
+
+class RulePack:
+    """Compiled citability patterns for one language."""
+
+    def __init__(self, lang: str, rules: dict):
+        self.lang = lang
+        for key in PATTERN_KEYS:
+            setattr(self, key, re.compile(rules[key]))
+        self.sources = tuple(re.compile(pattern) for pattern in rules["sources"])
+        self.percent_hints = rules.get("percent_hints")
+        self.currency_hints = rules.get("currency_hints")
+        self.year_hints = rules.get("year_hints")
+        # Character rewrites (e.g. transliteration) applied before matching.
+        # A regex sub only touches the characters present, which is several
+        # times faster than str.translate on non-ASCII text.
+        translate = {char: value or "" for char, value in (rules.get("translate") or {}).items()}
+        self._translate = translate.__getitem__
+        self._translate_re = re.compile("[" + re.escape("".join(translate)) + "]") if translate else None
+
+    def normalize(self, text: str) -> str:
+        """Rewrite text into the script and spelling the patterns are written in."""
+        if self._translate_re is None or text.isascii():
+            return text
+        return self._translate_re.sub(lambda match: self._translate(match.group()), text)
+
+
+def get_rules(lang: str = DEFAULT_LANGUAGE) -> RulePack:
+    """Return the compiled pack for lang, falling back to English."""
+    pack = _packs.get(lang)
+    if pack is None:
+        name = lang if lang in LANGUAGES else DEFAULT_LANGUAGE
+        pack = _packs.get(name)
+        if pack is None:
+            module = importlib.import_module(f"{__name__}.{name}")
+            pack = RulePack(name, module.RULES)
+            _packs[name] = pack
+        _packs[lang] = pack
+    return pack
+
+
+def detect_language(text: str) -> str:
+    """Guess a passage's language from the script and letters of its start.
+
+    Passages with no Arabic, Cyrillic or Serbian Latin letters are English
+    after a single regex scan, so English-only sites pay almost nothing.
+    Only passages with a few Serbian letters fall back to counting
+    function words.
+    """
+    sample = text[:DETECT_SAMPLE_CHARS]
+    if sample.isascii() or _SCRIPT_HINT_RE.search(sample) is None:
+        return DEFAULT_LANGUAGE
+
+    visible = len(sample) - sample.count(" ")
+    # Arabic and Cyrillic letters take two bytes in UTF-8, ASCII one
+    wide = len(sample.encode("utf-8", "surrogatepass")) - len(sample)
+    if wide * 2 > visible:
+        arabic = _ARABIC_RE.search(sample) is not None
+        cyrillic = _CYRILLIC_RE.search(sample) is not None
+        if arabic and cyrillic:
+            arabic = len(_ARABIC_RE.findall(sample)) >= len(_CYRILLIC_RE.findall(sample))
+        if arabic:
+            return "ar"
+        if cyrillic:
+            return "sr"
+
+    serbian = 0
+    for letter in _SERBIAN_LATIN_LETTERS:
+        serbian += sample.count(letter)
+    if serbian >= max(3, visible // 100):
+        return "sr"
+    if serbian:
+        lowered = sample.lower()
+        if len(_SERBIAN_WORD_RE.findall(lowered)) > len(_ENGLISH_WORD_RE.findall(lowered)):
+            return "sr"
+    return DEFAULT_LANGUAGE
@@ -0,0 +1,69 @@
+"""Arabic citability rules.
+
+Passages are normalized before matching: harakat and tatweel are removed
+and hamza-carrying alef forms become a bare alef, so patterns are written
+without diacritics ("الى", "اولا"). \\d also matches Arabic-Indic digits.
+"""
+
+_NORMALIZE = {chr(c): None for c in range(0x064B, 0x0660)}  # harakat
+_NORMALIZE.update({"ٰ": None, "ـ": None})  # superscript alef, tatweel
+_NORMALIZE.update({"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا"})
+
+_ARABIC_WORD = r"[ء-ي]+"
+
+RULES = {
+    "translate": _NORMALIZE,
+
+    # Answer block quality (folded). "X هو/هي ..." is the copular definition.
+    "definition_verb": (
+        r"\s+(?:(?:هو|هي)\s|يعني\s|تعني\s|[يت]شير\s+الى\s|يعرف\s+بانه\s|تعرف\s+بانها\s|عبارة\s+عن\s)"
+    ),
+    "definition_phrase": r"(?:بعبارة\s+اخرى|بمعنى\s+اخر|ببساطة)\s*[،,]",
+    "early_answer": "|".join(
+        [
+            r"\b(?:هو|هي|يعني|تعني|كان|كانت)\b",
+            r"\d+\s?[%٪]",
+            r"\$[\d,]+",
+            r"\d+\s+(?:مليون|مليار|الف|الاف)",
+        ]
+    ),
+    "quotable_claim": (
+        r"(?:وفقا\s*ل|بحسب|[تا]ظهر[ت]?\s+(?:الابحاث|الدراسات|الدراسة|البيانات)|تشير\s+(?:البيانات|الدراسات))"
+    ),
+    "sentence_split": r"[.!?؟]+",
+
+    # Self-containment. Arabic has no capitals; Latin-script names still count.
+    "pronoun": r"\b(?:هو|هي|هم|هن|هما|هذا|هذه|ذلك|تلك|هؤلاء|اولئك)\b",
+    "proper_noun": r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+
+    # Structural readability (folded)
+    "list_like": r"(?:اولا|ثانيا|ثالثا|اخيرا|بالاضافة\s+الى|علاوة\s+على)",
+    "numbered_item": r"(?:\d+[\.\)\-]\s|(?:الخطوة|خطوة|نصيحة|النقطة)\s+\d+)",
+
+    # Statistical density
+    "percent": r"\d+(?:[.,٫]\d+)?\s?[%٪]",
+    "percent_hints": ("%", "٪"),
+    "currency": (
+        r"(?:\$\s?[\d,]+(?:\.\d+)?|\d[\d,٬.٫]*\s*(?:مليون\s+|مليار\s+)?(?:دولار|ريال|درهم|جنيه|دينار|يورو))"
+    ),
+    "currency_hints": ("$", "دولار", "ريال", "درهم", "جنيه", "دينار", "يورو"),
+    "context_number": (  # folded, must start at a word boundary
+        r"\d+(?:[,٬]\d{3})*(?:[.٫]\d+)?\s+(?:مستخدم|عميل|عملاء|صفحة|صفحات|موقع|مواقع|شركة|شركات"
+        r"|شخص|اشخاص|مرة|مرات|بالمئة|بالمائة)"
+    ),
+    "year": r"\b(?:20(?:2[3-6]|1\d)|٢٠(?:٢[٣-٦]|١[٠-٩]))\b",
+    "year_hints": ("20", "٢٠"),
+    "sources": (
+        r"(?:وفقا\s*ل|بحسب|نقلا\s+عن|المصدر\s*:)\s*[^\s\d]",
+        r"(?:Gartner|Forrester|McKinsey|Harvard|Stanford|MIT|Google|Microsoft|OpenAI|Anthropic"
+        r"|جارتنر|غارتنر|ماكينزي|هارفارد|ستانفورد|جوجل|غوغل|مايكروسوفت)",
+        rf"\((?:[A-Z][a-z]+|{_ARABIC_WORD})(?:\s+\d{{4}})?\)",
+    ),
+
+    # Uniqueness signals
+    "original_data": (  # folded
+        r"(?:ابحاثنا|دراستنا|بياناتنا|تحليلنا|استطلاعنا|نتائجنا|وجدنا|اكتشفنا|حللنا|قمنا\s+بتحليل|قسنا)"
+    ),
+    "example": r"(?:دراسة\s+حالة|على\s+سبيل\s+المثال|مثلا|في\s+الواقع\s+العملي|عمليا)",  # folded
+    "tool_mention": r"(?:باستخدام|عبر|من\s+خلال|بواسطة)\s+[A-Z][a-z]+",
+}
@@ -0,0 +1,59 @@
+"""English citability rules.
+
+Patterns marked "folded" are matched case-sensitively against folded
+(lower-cased) text; see citability_rules for how a pack is compiled.
+"""
+
+RULES = {
+    # Answer block quality
+    # Definition patterns ("X is...", "X refers to...", "X means..."). The
+    # "X" word is checked by the scanner as "preceded by a word character",
+    # so the pattern starts at the whitespace before the verb. (folded)
+    "definition_verb": r"\s+(?:is\s+(?:a|an|the)\s|refers?\s+to\s|means?\s|(?:can be |are )?defined\s+as\s)",
+    "definition_phrase": r"\bin\s+(?:simple|other)\s+(?:terms|words)\s*,",  # folded
+    "early_answer": "|".join(  # folded
+        [
+            r"\b(?:is|are|was|were|means?|refers?)\b",
+            r"\d+%",
+            r"\$[\d,]+",
+            r"\d+\s+(?:million|billion|thousand)",
+        ]
+    ),
+    "quotable_claim": (  # folded
+        r"(?:according to|research shows|studies? (?:show|indicate|suggest|found)|data (?:shows|indicates|suggests))"
+    ),
+    "sentence_split": r"[.!?]+",
+
+    # Self-containment
+    "pronoun": r"\b(?:it|they|them|their|this|that|these|those|he|she|his|her)\b",  # folded
+    "proper_noun": r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+
+    # Structural readability (folded)
+    "list_like": r"(?:first|second|third|finally|additionally|moreover|furthermore)",
+    "numbered_item": r"(?:\d+[\.\)]\s|\b(?:step|tip|point)\s+\d+)",
+
+    # Statistical density. *_hints are substrings a match can't do without;
+    # the pattern is skipped when none of them occur in the passage.
+    "percent": r"\d+(?:\.\d+)?%",
+    "percent_hints": ("%",),
+    "currency": r"\$[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|M|B|K))?",
+    "currency_hints": ("$",),
+    # Must start at a word boundary (folded)
+    "context_number": (
+        r"\d+(?:,\d{3})*(?:\.\d+)?\s+(?:users|customers|pages|sites|companies|businesses|people|percent|times|x\b)"
+    ),
+    "year": r"\b20(?:2[3-6]|1\d)\b",
+    "year_hints": ("20",),
+    "sources": (
+        r"(?:according to|per|from|by)\s+[A-Z]",
+        r"(?:Gartner|Forrester|McKinsey|Harvard|Stanford|MIT|Google|Microsoft|OpenAI|Anthropic)",
+        r"\([A-Z][a-z]+(?:\s+\d{4})?\)",
+    ),
+
+    # Uniqueness signals
+    "original_data": (  # folded
+        r"(?:our (?:research|study|data|analysis|survey|findings)|we (?:found|discovered|analyzed|surveyed|measured))"
+    ),
+    "example": r"(?:case study|for example|for instance|in practice|real-world|hands-on)",  # folded
+    "tool_mention": r"(?:using|with|via|through)\s+[A-Z][a-z]+",
+}
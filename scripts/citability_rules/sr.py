@@ -0,0 +1,81 @@
+"""Serbian citability rules.
+
+Patterns are written in Latin script; Cyrillic passages are transliterated
+before matching. Patterns marked "folded" see lower-cased text.
+"""
+
+_UPPER = "A-ZČĆŠŽĐ"
+_LOWER = "a-zčćšžđ"
+
+_CYRILLIC_TO_LATIN = {
+    "А": "A", "Б": "B", "В": "V", "Г": "G", "Д": "D", "Ђ": "Đ", "Е": "E", "Ж": "Ž", "З": "Z", "И": "I",
+    "Ј": "J", "К": "K", "Л": "L", "Љ": "Lj", "М": "M", "Н": "N", "Њ": "Nj", "О": "O", "П": "P", "Р": "R",
+    "С": "S", "Т": "T", "Ћ": "Ć", "У": "U", "Ф": "F", "Х": "H", "Ц": "C", "Ч": "Č", "Џ": "Dž", "Ш": "Š",
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "ђ": "đ", "е": "e", "ж": "ž", "з": "z", "и": "i",
+    "ј": "j", "к": "k", "л": "l", "љ": "lj", "м": "m", "н": "n", "њ": "nj", "о": "o", "п": "p", "р": "r",
+    "с": "s", "т": "t", "ћ": "ć", "у": "u", "ф": "f", "х": "h", "ц": "c", "ч": "č", "џ": "dž", "ш": "š",
+}
+
+RULES = {
+    "translate": _CYRILLIC_TO_LATIN,
+
+    # Answer block quality (folded). Serbian has no articles, so "X je ..."
+    # only counts as a definition when followed by a classifying noun.
+    "definition_verb": (
+        r"\s+(?:(?:je|su)\s+(?:jedan|jedna|jedno|vrsta|oblik|naziv|termin|pojam|proces|metoda?|alat|skup"
+        r"|način|tehnika|praksa)\s|odnosi\s+se\s+na\s|se\s+odnosi\s+na\s|označava(?:ju)?\s"
+        r"|znači\s|podrazumeva\s|(?:se\s+)?definiše\s+kao\s)"
+    ),
+    "definition_phrase": r"\b(?:drugim\s+rečima|jednostavno\s+rečeno|prostije\s+rečeno)\s*,",
+    "early_answer": "|".join(
+        [
+            r"\b(?:je|su|bio|bila|bilo|bili|znači|predstavlja)\b",
+            r"\d+\s?%",
+            r"\$[\d,.]+",
+            r"\d+\s+(?:miliona|milijardi|milijarde|hiljada|hiljade)",
+        ]
+    ),
+    "quotable_claim": (
+        r"(?:prema (?:podacima|istraživanju|izveštaju|rečima)|istraživanj[ae] (?:pokazuj[eu]|je pokazalo)"
+        r"|studij[ae] (?:pokazuj[eu]|ukazuj[eu]|je pokazala)|podaci (?:pokazuju|ukazuju))"
+    ),
+    "sentence_split": r"[.!?]+",
+
+    # Self-containment
+    "pronoun": (  # folded
+        r"\b(?:on|ona|ono|oni|one|njega|nje|njih|njegov|njegova|njihov|njihova|to|ovo|ovaj|taj|ta|ti|ovi|ove)\b"
+    ),
+    "proper_noun": rf"\b[{_UPPER}][{_LOWER}]+(?:\s+[{_UPPER}][{_LOWER}]+)*\b",
+
+    # Structural readability (folded)
+    "list_like": r"(?:prvo|drugo|treće|konačno|na kraju|dodatno|pored toga|osim toga)",
+    "numbered_item": r"(?:\d+[\.\)]\s|\b(?:korak|savet|tačka)\s+\d+)",
+
+    # Statistical density
+    "percent": r"\d+(?:[.,]\d+)?\s?%",
+    "percent_hints": ("%",),
+    "currency": (
+        r"(?:\$|€)\s?[\d.,]+(?:\s*(?:miliona|milijardi|hiljada))?"
+        r"|\d[\d.,]*\s*(?:miliona\s+|milijardi\s+|hiljada\s+)?(?:EUR|RSD|evra|dinara|din\b|€)"
+    ),
+    "currency_hints": ("$", "€", "EUR", "RSD", "evra", "din"),
+    "context_number": (  # folded, must start at a word boundary
+        r"\d+(?:\.\d{3})*(?:,\d+)?\s+(?:korisnika|kupaca|klijenata|stranica|sajtova|kompanija|preduzeća"
+        r"|firmi|ljudi|osoba|posto|procenata|puta)"
+    ),
+    "year": r"\b20(?:2[3-6]|1\d)\b",
+    "year_hints": ("20",),
+    "sources": (
+        rf"(?:prema|izvor:?)\s+[{_UPPER}]",
+        r"(?:Gartner|Forrester|McKinsey|Harvard|Stanford|MIT|Google|Microsoft|OpenAI|Anthropic|RZS|NBS)",
+        rf"\([{_UPPER}][{_LOWER}]+(?:\s+\d{{4}})?\)",
+    ),
+
+    # Uniqueness signals
+    "original_data": (  # folded
+        r"(?:naš[aeiu]? (?:istraživanj[ae]|studij[ae]|podaci|analiz[ae]|anket[ae])"
+        r"|(?:otkrili|analizirali|ispitali|izmerili|utvrdili) smo)"
+    ),
+    "example": r"(?:studija slučaja|na primer|primera radi|u praksi|iz prakse|praktičn[io])",  # folded
+    "tool_mention": rf"(?:koristeći|pomoću|preko|putem)\s+[{_UPPER}][{_LOWER}]+",
+}
@@ -11,9 +11,14 @@ Based on research showing optimal AI-cited passages are:
 """
 
 import sys
+import os
 import json
 import re
-from typing import Optional
+import argparse
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlparse
 
 try:
     import requests
@@ -22,11 +27,156 @@ except ImportError:
     print("ERROR: Required packages not installed. Run: pip install requests beautifulsoup4")
     sys.exit(1)
 
+from fetch_page import crawl_sitemap, element_text, fetch_soup, iter_elements, load_soup, read_sitemap
+from site_citability import BoilerplateDetector, SiteCitabilityAggregator, TopK
+from passage_cache import PassageScoreCache
+from citability_rules import SCORER_VERSION, RulePack, detect_language, get_rules
 
-def score_passage(text: str, heading: Optional[str] = None) -> dict:
-    """Score a single passage for AI citability (0-100)."""
+# Sections shorter than this are not scored
+MIN_BLOCK_WORDS = 20
+
+
+# ============================================================
+# SIGNAL PATTERNS
+# ============================================================
+# Language-specific patterns live in citability_rules/<lang>.py and are
+# compiled on first use. Patterns marked "folded" there are matched
+# case-sensitively against _fold(text), which gives exactly the same
+# matches as re.IGNORECASE on the original text but runs much faster.
+
+# Characters re.IGNORECASE folds to ASCII letters that str.lower() leaves alone
+_CASE_FOLD_EXTRAS = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"), ("\u212a", "k"))
+
+_DIGIT_RE = re.compile(r"\d")
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _fold(text: str) -> str:
+    """Lower-case text so that plain matching equals re.IGNORECASE matching.
+
+    str.lower() misses the four characters that re.IGNORECASE treats as ASCII
+    letters (dotted/dotless i, long s, Kelvin sign), so those are mapped
+    first. The result has the same length and the same \\w/\\s/\\d class at
+    every position as the original.
+    """
+    if not text.isascii():
+        for char, replacement in _CASE_FOLD_EXTRAS:
+            if char in text:
+                text = text.replace(char, replacement)
+    return text.lower()
+
+
+def _count(pattern: re.Pattern, text: str, limit: int) -> int:
+    """Count matches of pattern in text, stopping once limit is reached."""
+    count = 0
+    for _ in pattern.finditer(text):
+        count += 1
+        if count >= limit:
+            break
+    return count
+
+
+def _has_definition(folded: str, rules: RulePack) -> bool:
+    """Search folded for a definition ("X is a...", "in other words,").
+
+    The "X" word before a definition verb is checked as "preceded by a word
+    character", which equals a leading r"\b\w+\s+" in the pattern and avoids
+    backtracking over every word in the passage.
+    """
+    pos = 0
+    while True:
+        match = rules.definition_verb.search(folded, pos)
+        if match is None:
+            break
+        start = match.start()
+        if start and _WORD_CHAR_RE.match(folded, start - 1):
+            return True
+        pos = start + 1
+    return rules.definition_phrase.search(folded) is not None
+
+
+def _hinted(text: str, hints: Optional[tuple]) -> bool:
+    """False when a pattern needs one of hints and none occur in text."""
+    if hints is None:
+        return True
+    for hint in hints:
+        if hint in text:
+            return True
+    return False
+
+
+def _count_at_word_start(pattern: re.Pattern, text: str, limit: int) -> int:
+    """Count matches of r"\\b" + pattern, where pattern starts with \\w.
+
+    Candidates not at a word boundary are skipped one character at a time,
+    which reproduces re.findall's leftmost, non-overlapping matches.
+    """
+    count = 0
+    pos = 0
+    while count < limit:
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        start = match.start()
+        if start and _WORD_CHAR_RE.match(text, start - 1):
+            pos = start + 1
+            continue
+        count += 1
+        pos = match.end()
+    return count
+
+
+def scan_passage(text: str, rules: Optional[RulePack] = None) -> dict:
+    """Collect every signal score_passage() needs from one tokenization.
+
+    rules is the language pack to match with (default: detected from text).
+    Counts that only feed capped scores stop early once the cap is reached,
+    so they are lower bounds rather than exact totals.
+    """
+    if rules is None:
+        rules = get_rules(detect_language(text))
     words = text.split()
-    word_count = len(words)
+    normalized = rules.normalize(text)
+    lead_words = words[:60] if normalized is text else normalized.split()[:60]
+    text = normalized
+    folded = _fold(text)
+    sentences = rules.sentence_split.split(text)
+    has_digit = _DIGIT_RE.search(text) is not None
+
+    return {
+        "language": rules.lang,
+        "words": words,
+        "word_count": len(words),
+        "sentence_count": len(sentences),
+        "short_clear_sentences": sum(1 for s in sentences if 5 <= len(s.split()) <= 25),
+        "has_definition": _has_definition(folded, rules),
+        "early_answer": rules.early_answer.search(_fold(" ".join(lead_words))) is not None,
+        "has_quotable_claim": rules.quotable_claim.search(folded) is not None,
+        "pronoun_count": len(rules.pronoun.findall(folded)),
+        "proper_noun_count": _count(rules.proper_noun, text, 3),
+        "has_list_words": rules.list_like.search(folded) is not None,
+        "has_numbered_items": has_digit and rules.numbered_item.search(folded) is not None,
+        "has_line_breaks": "\n" in text,
+        "percent_count": _count(rules.percent, text, 2) if _hinted(text, rules.percent_hints) else 0,
+        "dollar_count": _count(rules.currency, text, 2) if _hinted(text, rules.currency_hints) else 0,
+        "context_number_count": _count_at_word_start(rules.context_number, folded, 2) if has_digit else 0,
+        "has_year": _hinted(text, rules.year_hints) and rules.year.search(text) is not None,
+        "source_matches": sum(1 for pattern in rules.sources if pattern.search(text)),
+        "has_original_data": rules.original_data.search(folded) is not None,
+        "has_example": rules.example.search(folded) is not None,
+        "has_tool_mention": rules.tool_mention.search(text) is not None,
+    }
+
+
+def score_passage(text: str, heading: Optional[str] = None, lang: Optional[str] = None) -> dict:
+    """Score a single passage for AI citability (0-100).
+
+    lang picks the rule pack ("en", "sr", "ar"); by default it is detected
+    from the passage.
+    """
+    signals = scan_passage(text, get_rules(lang) if lang else None)
+    words = signals["words"]
+    word_count = signals["word_count"]
 
     scores = {
         "answer_block_quality": 0,
@@ -39,30 +189,12 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
     # === 1. Answer Block Quality (30%) ===
     abq_score = 0
 
-    # Check for definition patterns ("X is...", "X refers to...", "X means...")
-    definition_patterns = [
-        r"\b\w+\s+is\s+(?:a|an|the)\s",
-        r"\b\w+\s+refers?\s+to\s",
-        r"\b\w+\s+means?\s",
-        r"\b\w+\s+(?:can be |are )?defined\s+as\s",
-        r"\bin\s+(?:simple|other)\s+(?:terms|words)\s*,",
-    ]
-    for pattern in definition_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            abq_score += 15
-            break
+    # Definition patterns ("X is...", "X refers to...", "X means...")
+    if signals["has_definition"]:
+        abq_score += 15
 
-    # Check if answer appears early (first 60 words)
-    first_60_words = " ".join(words[:60])
-    if any(
-        re.search(p, first_60_words, re.IGNORECASE)
-        for p in [
-            r"\b(?:is|are|was|were|means?|refers?)\b",
-            r"\d+%",
-            r"\$[\d,]+",
-            r"\d+\s+(?:million|billion|thousand)",
-        ]
-    ):
+    # Answer appears early (first 60 words)
+    if signals["early_answer"]:
         abq_score += 15
 
     # Question-based heading bonus
@@ -70,20 +202,13 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
         abq_score += 10
 
     # Clear, direct sentence structure
-    sentences = re.split(r"[.!?]+", text)
-    short_clear_sentences = sum(
-        1 for s in sentences if 5 <= len(s.split()) <= 25
-    )
-    if sentences:
-        clarity_ratio = short_clear_sentences / len(sentences)
+    sentence_count = signals["sentence_count"]
+    if sentence_count:
+        clarity_ratio = signals["short_clear_sentences"] / sentence_count
         abq_score += int(clarity_ratio * 10)
 
     # Has specific, quotable claim
-    if re.search(
-        r"(?:according to|research shows|studies? (?:show|indicate|suggest|found)|data (?:shows|indicates|suggests))",
-        text,
-        re.IGNORECASE,
-    ):
+    if signals["has_quotable_claim"]:
         abq_score += 10
 
     scores["answer_block_quality"] = min(abq_score, 30)
@@ -104,15 +229,8 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
         sc_score += 2
 
     # Low pronoun density (fewer pronouns = more self-contained)
-    pronoun_count = len(
-        re.findall(
-            r"\b(?:it|they|them|their|this|that|these|those|he|she|his|her)\b",
-            text,
-            re.IGNORECASE,
-        )
-    )
     if word_count > 0:
-        pronoun_ratio = pronoun_count / word_count
+        pronoun_ratio = signals["pronoun_count"] / word_count
         if pronoun_ratio < 0.02:
             sc_score += 8
         elif pronoun_ratio < 0.04:
@@ -121,7 +239,7 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
             sc_score += 3
 
     # Contains named entities (proper nouns, brands, specific terms)
-    proper_nouns = len(re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", text))
+    proper_nouns = signals["proper_noun_count"]
     if proper_nouns >= 3:
         sc_score += 7
     elif proper_nouns >= 1:
@@ -133,8 +251,8 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
     sr_score = 0
 
     # Sentence count and length distribution
-    if sentences:
-        avg_sentence_length = word_count / len(sentences)
+    if sentence_count:
+        avg_sentence_length = word_count / sentence_count
         if 10 <= avg_sentence_length <= 20:
             sr_score += 8
         elif 8 <= avg_sentence_length <= 25:
@@ -143,15 +261,15 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
             sr_score += 2
 
     # Contains list-like structures
-    if re.search(r"(?:first|second|third|finally|additionally|moreover|furthermore)", text, re.IGNORECASE):
+    if signals["has_list_words"]:
         sr_score += 4
 
     # Contains numbered items or bullet-like content
-    if re.search(r"(?:\d+[\.\)]\s|\b(?:step|tip|point)\s+\d+)", text, re.IGNORECASE):
+    if signals["has_numbered_items"]:
         sr_score += 4
 
     # Paragraph breaks (indicates structure)
-    if "\n" in text:
+    if signals["has_line_breaks"]:
         sr_score += 4
 
     scores["structural_readability"] = min(sr_score, 20)
@@ -160,31 +278,20 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
     sd_score = 0
 
     # Percentages
-    pct_count = len(re.findall(r"\d+(?:\.\d+)?%", text))
-    sd_score += min(pct_count * 3, 6)
+    sd_score += min(signals["percent_count"] * 3, 6)
 
     # Dollar amounts
-    dollar_count = len(re.findall(r"\$[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|M|B|K))?", text))
-    sd_score += min(dollar_count * 3, 5)
+    sd_score += min(signals["dollar_count"] * 3, 5)
 
     # Other numbers with context
-    number_count = len(re.findall(r"\b\d+(?:,\d{3})*(?:\.\d+)?\s+(?:users|customers|pages|sites|companies|businesses|people|percent|times|x\b)", text, re.IGNORECASE))
-    sd_score += min(number_count * 2, 4)
+    sd_score += min(signals["context_number_count"] * 2, 4)
 
     # Year references (indicates timeliness)
-    year_count = len(re.findall(r"\b20(?:2[3-6]|1\d)\b", text))
-    if year_count > 0:
+    if signals["has_year"]:
         sd_score += 2
 
     # Named sources
-    source_patterns = [
-        r"(?:according to|per|from|by)\s+[A-Z]",
-        r"(?:Gartner|Forrester|McKinsey|Harvard|Stanford|MIT|Google|Microsoft|OpenAI|Anthropic)",
-        r"\([A-Z][a-z]+(?:\s+\d{4})?\)",
-    ]
-    for pattern in source_patterns:
-        if re.search(pattern, text):
-            sd_score += 2
+    sd_score += 2 * signals["source_matches"]
 
     scores["statistical_density"] = min(sd_score, 15)
 
@@ -192,23 +299,15 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
     us_score = 0
 
     # Original data indicators
-    if re.search(
-        r"(?:our (?:research|study|data|analysis|survey|findings)|we (?:found|discovered|analyzed|surveyed|measured))",
-        text,
-        re.IGNORECASE,
-    ):
+    if signals["has_original_data"]:
         us_score += 5
 
     # Case study or example indicators
-    if re.search(
-        r"(?:case study|for example|for instance|in practice|real-world|hands-on)",
-        text,
-        re.IGNORECASE,
-    ):
+    if signals["has_example"]:
         us_score += 3
 
     # Specific tool/product mentions (shows practical experience)
-    if re.search(r"(?:using|with|via|through)\s+[A-Z][a-z]+", text):
+    if signals["has_tool_mention"]:
         us_score += 2
 
     scores["uniqueness_signals"] = min(us_score, 10)
@@ -235,6 +334,7 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
 
     return {
         "heading": heading,
+        "language": signals["language"],
         "word_count": word_count,
         "total_score": total,
         "grade": grade,
@@ -244,100 +344,574 @@ def score_passage(text: str, heading: Optional[str] = None) -> dict:
     }
 
 
-def analyze_page_citability(url: str) -> dict:
-    """Analyze all content blocks on a page for citability."""
-    try:
-        response = requests.get(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-    except Exception as e:
-        return {"error": f"Failed to fetch page: {str(e)}"}
-
-    soup = BeautifulSoup(response.text, "lxml")
-
-    # Remove non-content elements
-    for element in soup.find_all(
-        ["script", "style", "nav", "footer", "header", "aside", "form"]
-    ):
-        element.decompose()
+def _iter_passages(passages: Iterable) -> Iterator[tuple]:
+    """Normalize passages to (text, heading) tuples.
 
-    # Extract content blocks
-    blocks = []
+    Accepts plain strings, (text, heading) tuples and block dicts with
+    "content" and optional "heading" keys.
+    """
+    for passage in passages:
+        if isinstance(passage, str):
+            yield passage, None
+        elif isinstance(passage, dict):
+            yield passage["content"], passage.get("heading")
+        else:
+            text, heading = passage
+            yield text, heading
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most size items from iterable."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _score_chunk(chunk: list) -> list:
+    """Score a chunk of (text, heading) tuples. Runs in pool workers."""
+    return [score_passage(text, heading) for text, heading in chunk]
+
+
+def score_passages(
+    passages: Iterable,
+    workers: Optional[int] = 1,
+    chunksize: int = 256,
+    cache: Optional[PassageScoreCache] = None,
+) -> Iterator[dict]:
+    """Score many passages, yielding results in input order.
+
+    With workers > 1 (or None for one per CPU) passages are sent to a process
+    pool in chunks of chunksize. At most two chunks per worker are in flight,
+    so arbitrarily long iterables are streamed rather than materialized.
+
+    With a cache, lookups happen in the calling process and only passages
+    not seen before are scored, each distinct passage once.
+    """
+    items = _iter_passages(passages)
+    workers = workers or os.cpu_count() or 1
+    if cache is None and workers <= 1:
+        for text, heading in items:
+            yield score_passage(text, heading)
+        return
+    if cache is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in _chunked(items, chunksize):
+                pending.append(pool.submit(_score_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        return
+    if workers <= 1:
+        for text, heading in items:
+            yield score_cached(text, heading, cache)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        inflight = set()
+        for chunk in _chunked(items, chunksize):
+            slots = []
+            misses = {}
+            for text, heading in chunk:
+                key = cache.key(text, heading)
+                if key in inflight or key in misses:
+                    cache.count_hit()
+                    result = None
+                else:
+                    result = cache.get(key)
+                    if result is None:
+                        misses[key] = (text, heading)
+                slots.append((key, text, heading, result))
+            inflight.update(misses)
+            job = pool.submit(_score_chunk, list(misses.values())) if misses else None
+            pending.append((slots, list(misses), job))
+            if len(pending) >= workers * 2:
+                yield from _resolve_cached_chunk(pending.popleft(), cache, inflight)
+        while pending:
+            yield from _resolve_cached_chunk(pending.popleft(), cache, inflight)
+
+
+def _resolve_cached_chunk(entry: tuple, cache: PassageScoreCache, inflight: set) -> Iterator[dict]:
+    """Store a finished chunk's new scores and yield its results in order."""
+    slots, keys, job = entry
+    fresh = dict(zip(keys, job.result())) if job else {}
+    for key, result in fresh.items():
+        cache.put(key, result)
+        inflight.discard(key)
+    for key, text, heading, result in slots:
+        if result is None:
+            # Duplicates were counted as hits when queued; don't count them again
+            result = fresh.get(key) or cache.peek(key) or score_passage(text, heading)
+        yield result
+
+
+def score_cached(text: str, heading: Optional[str], cache: PassageScoreCache) -> dict:
+    """score_passage() through a PassageScoreCache."""
+    key = cache.key(text, heading)
+    result = cache.get(key)
+    if result is None:
+        result = score_passage(text, heading)
+        cache.put(key, result)
+    return result
+
+
+def extract_elements(source) -> list:
+    """List a page's headings and paragraph texts in document order.
+
+    Returns [{"tag", "text"}, ...], keeping headings and paragraphs (and
+    list/table texts) of at least 5 words. source is a URL, raw HTML bytes,
+    a parsed tree or a fetch_page(..., keep_tree=True) result; trees are
+    not modified.
+    """
+    soup = load_soup(source)
+    # Non-content elements
+    skip = ("script", "style", "nav", "footer", "header", "aside", "form")
+
+    elements = []
+    for element in iter_elements(soup, {"h1", "h2", "h3", "h4", "p", "ul", "ol", "table"}, skip):
+        text = element_text(element, skip)
+        if element.name.startswith("h") or (text and len(text.split()) >= 5):
+            elements.append({"tag": element.name, "text": text})
+    return elements
+
+
+def sections_from_elements(elements: list) -> list:
+    """Group extract_elements() output into heading-delimited sections.
+
+    Returns [{"heading", "paragraphs": [...]}, ...] in page order.
+    """
+    sections = []
     current_heading = "Introduction"
     current_paragraphs = []
 
-    for element in soup.find_all(["h1", "h2", "h3", "h4", "p", "ul", "ol", "table"]):
-        if element.name.startswith("h"):
+    for element in elements:
+        if element["tag"].startswith("h"):
             # Save previous section
             if current_paragraphs:
-                combined = " ".join(current_paragraphs)
-                if len(combined.split()) >= 20:
-                    blocks.append(
-                        {"heading": current_heading, "content": combined}
-                    )
-            current_heading = element.get_text(strip=True)
+                sections.append({"heading": current_heading, "paragraphs": current_paragraphs})
+            current_heading = element["text"]
             current_paragraphs = []
         else:
-            text = element.get_text(strip=True)
-            if text and len(text.split()) >= 5:
-                current_paragraphs.append(text)
+            current_paragraphs.append(element["text"])
 
-    # Last block
+    # Last section
     if current_paragraphs:
-        combined = " ".join(current_paragraphs)
-        if len(combined.split()) >= 20:
-            blocks.append({"heading": current_heading, "content": combined})
-
-    # Score each block
-    scored_blocks = []
-    for block in blocks:
-        score = score_passage(block["content"], block["heading"])
-        scored_blocks.append(score)
-
-    # Calculate page-level metrics
-    if scored_blocks:
-        avg_score = sum(b["total_score"] for b in scored_blocks) / len(scored_blocks)
-        top_blocks = sorted(scored_blocks, key=lambda x: x["total_score"], reverse=True)[:5]
-        bottom_blocks = sorted(scored_blocks, key=lambda x: x["total_score"])[:5]
+        sections.append({"heading": current_heading, "paragraphs": current_paragraphs})
+
+    return sections
 
-        # Optimal passage count (134-167 words)
-        optimal_count = sum(
-            1 for b in scored_blocks if 134 <= b["word_count"] <= 167
-        )
-    else:
-        avg_score = 0
-        top_blocks = []
-        bottom_blocks = []
-        optimal_count = 0
 
-    # Grade distribution
-    grade_dist = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+def extract_sections(source) -> list:
+    """Split a page into heading-delimited sections of paragraph texts."""
+    return sections_from_elements(extract_elements(source))
+
+
+def blocks_from_sections(sections: list) -> list:
+    """Join each section's paragraphs into one block, dropping short sections."""
+    blocks = []
+    for section in sections:
+        combined = " ".join(section["paragraphs"])
+        if len(combined.split()) >= MIN_BLOCK_WORDS:
+            blocks.append({"heading": section["heading"], "content": combined})
+    return blocks
+
+
+def extract_citability_blocks(source) -> list:
+    """Split a page into heading-delimited blocks worth scoring."""
+    return blocks_from_sections(extract_sections(source))
+
+
+class PageCitabilityAccumulator:
+    """Build a page-level citability report one scored block at a time.
+
+    Keeps running totals, grade and language counts, and the top/bottom
+    top_k blocks in heaps, so memory is O(top_k) per page unless
+    keep_blocks asks for every block in the report ("all_blocks").
+    """
+
+    def __init__(self, url: str, top_k: int = 5, keep_blocks: bool = True):
+        self.url = url
+        self.top_k = top_k
+        self.blocks = [] if keep_blocks else None
+        self.count = 0
+        self.score_sum = 0
+        self.optimal_count = 0
+        self.grades = {"A": 0, "B": 0, "C": 0, "D": 0, "F": 0}
+        self.languages = {}
+        self._top = TopK(top_k)
+        self._bottom = TopK(top_k)
+
+    def add(self, block: dict) -> None:
+        """Add one result from score_passage()."""
+        score = block["total_score"]
+        self.count += 1
+        self.score_sum += score
+        # Optimal passage count (134-167 words)
+        if 134 <= block["word_count"] <= 167:
+            self.optimal_count += 1
+        self.grades[block["grade"]] += 1
+        language = block.get("language", "en")
+        self.languages[language] = self.languages.get(language, 0) + 1
+        self._top.push(score, block)
+        self._bottom.push(-score, block)
+        if self.blocks is not None:
+            self.blocks.append(block)
+
+    def summary(self) -> dict:
+        report = {
+            "url": self.url,
+            "total_blocks_analyzed": self.count,
+            "average_citability_score": round(self.score_sum / self.count if self.count else 0, 1),
+            "optimal_length_passages": self.optimal_count,
+            "grade_distribution": dict(self.grades),
+            "languages": dict(self.languages),
+            f"top_{self.top_k}_citable": self._top.items(),
+            f"bottom_{self.top_k}_citable": self._bottom.items(),
+        }
+        if self.blocks is not None:
+            report["all_blocks"] = self.blocks
+        return report
+
+
+def summarize_page(url: str, scored_blocks: Iterable, keep_blocks: bool = True) -> dict:
+    """Build the page-level citability report from scored blocks."""
+    page = PageCitabilityAccumulator(url, keep_blocks=keep_blocks)
     for block in scored_blocks:
-        grade_dist[block["grade"]] += 1
+        page.add(block)
+    return page.summary()
+
+
+def analyze_page_citability(
+    source, cache: Optional[PassageScoreCache] = None, url: Optional[str] = None, keep_blocks: bool = True
+) -> dict:
+    """Analyze all content blocks on a page for citability.
+
+    source is a URL, raw HTML bytes, a parsed BeautifulSoup tree or a
+    fetch_page(..., keep_tree=True) result, so a page fetched once can feed
+    every analyzer. url labels the report when source isn't a URL. With
+    keep_blocks=False the report leaves out "all_blocks" and scored blocks
+    are dropped as soon as they are counted.
+    """
+    if isinstance(source, str):
+        url = url or source
+    elif isinstance(source, dict):
+        url = url or source.get("url")
 
-    return {
-        "url": url,
-        "total_blocks_analyzed": len(scored_blocks),
-        "average_citability_score": round(avg_score, 1),
-        "optimal_length_passages": optimal_count,
-        "grade_distribution": grade_dist,
-        "top_5_citable": top_blocks,
-        "bottom_5_citable": bottom_blocks,
-        "all_blocks": scored_blocks,
-    }
+    try:
+        soup = load_soup(source)
+    except Exception as e:
+        return {"error": f"Failed to fetch page: {str(e)}"}
+
+    blocks = extract_citability_blocks(soup)
+    return summarize_page(url, score_passages(blocks, cache=cache), keep_blocks)
+
+
+def _fetch_page_elements(url: str) -> list:
+    return extract_elements(fetch_soup(url))
+
+
+def _fetched_pages(urls: list, fetch_workers: int) -> Iterator[tuple]:
+    """Fetch pages on a thread pool, yielding (index, url, elements, error) as each completes."""
+    with ThreadPoolExecutor(max_workers=max(1, fetch_workers)) as fetcher:
+        futures = {fetcher.submit(_fetch_page_elements, url): (i, url) for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            index, url = futures[future]
+            try:
+                yield index, url, future.result(), None
+            except Exception as e:
+                yield index, url, [], f"Failed to fetch page: {str(e)}"
+
+
+def _after_sample(pages: Iterator[tuple], boilerplate: BoilerplateDetector) -> Iterator[tuple]:
+    """Feed the first fetched pages to boilerplate, then pass every page on.
+
+    Pages are held back only until boilerplate.sample_pages have been
+    added, so the wait before the first report and the elements kept in
+    memory are bounded by the sample, not by the crawl.
+    """
+    held = []
+    for page in pages:
+        held.append(page)
+        if not page[3]:
+            boilerplate.add_page(page[2])
+            if boilerplate.pages >= boilerplate.sample_pages:
+                break
+    yield from held
+    held.clear()
+    yield from pages
+
+
+def _submit_chunk(pool: Optional[ProcessPoolExecutor], chunk: list) -> Future:
+    """Score a chunk on the pool, or right away when there is no pool."""
+    if pool is not None:
+        return pool.submit(_score_chunk, chunk)
+    future = Future()
+    future.set_result(_score_chunk(chunk))
+    return future
+
+
+def _iter_pages(
+    urls: list,
+    workers: Optional[int],
+    fetch_workers: int,
+    cache: Optional[PassageScoreCache],
+    boilerplate: Optional[BoilerplateDetector],
+    keep_blocks: bool = True,
+    site: Optional[SiteCitabilityAggregator] = None,
+) -> Iterator[tuple]:
+    """Yield (index, page_report) for every URL as soon as its scores are in."""
+    workers = workers or os.cpu_count() or 1
+    if cache is None:
+        cache = PassageScoreCache(namespace=SCORER_VERSION)
+    pages = _fetched_pages(urls, fetch_workers)
+    if boilerplate is not None:
+        pages = _after_sample(pages, boilerplate)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        pending = deque()
+        inflight = set()
+        for index, url, elements, error in pages:
+            if error:
+                page = {"url": url, "error": error}
+                if site is not None:
+                    site.add_page_result(page)
+                yield index, page
+                continue
+            template_count = None
+            if boilerplate is not None:
+                # Template elements go before sections are built, so they never
+                # end up inside an article's blocks
+                elements, template = boilerplate.split(elements)
+                template_count = len(template)
+            blocks = blocks_from_sections(sections_from_elements(elements))
+
+            slots = []
+            misses = {}
+            for text, heading in _iter_passages(blocks):
+                key = cache.key(text, heading)
+                if key in inflight or key in misses:
+                    cache.count_hit()
+                    result = None
+                else:
+                    result = cache.get(key)
+                    if result is None:
+                        misses[key] = (text, heading)
+                slots.append((key, text, heading, result))
+            inflight.update(misses)
+            job = _submit_chunk(pool, list(misses.values())) if misses else None
+            pending.append((index, url, template_count, (slots, list(misses), job)))
+
+            # Pages are finished in submission order; emit those already done
+            while pending and (len(pending) >= workers * 2 or _page_done(pending[0])):
+                yield _finish_page(pending.popleft(), cache, inflight, keep_blocks, site)
+        while pending:
+            yield _finish_page(pending.popleft(), cache, inflight, keep_blocks, site)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _page_done(entry: tuple) -> bool:
+    job = entry[3][2]
+    return job is None or job.done()
+
+
+def _finish_page(
+    entry: tuple,
+    cache: PassageScoreCache,
+    inflight: set,
+    keep_blocks: bool,
+    site: Optional[SiteCitabilityAggregator],
+) -> tuple:
+    index, url, template_count, chunk = entry
+    scored_blocks = list(_resolve_cached_chunk(chunk, cache, inflight))
+    if site is not None:
+        site.add_page(url, scored_blocks)
+    page = summarize_page(url, scored_blocks, keep_blocks)
+    if template_count is not None:
+        page["template_elements_excluded"] = template_count
+    return index, page
+
+
+def iter_pages_citability(
+    urls: list,
+    workers: Optional[int] = None,
+    fetch_workers: int = 8,
+    cache: Optional[PassageScoreCache] = None,
+    boilerplate: Optional[BoilerplateDetector] = None,
+    keep_blocks: bool = True,
+    site: Optional[SiteCitabilityAggregator] = None,
+) -> Iterator[dict]:
+    """Analyze several pages, yielding each page report as soon as it is ready.
+
+    Pages are fetched concurrently on fetch_workers threads and their blocks
+    scored on a pool of workers processes while later pages are still
+    downloading, so reports arrive roughly in fetch-completion order. Each
+    distinct passage is scored once per run (once ever with a persistent
+    cache). With a BoilerplateDetector the first sample_pages pages fetched
+    are held until their template paragraphs are known; paragraphs repeated
+    across most of the sample are then dropped from every page before
+    blocks are built and counted per page as template_elements_excluded.
+
+    keep_blocks=False leaves "all_blocks" out of the reports. Pass a
+    SiteCitabilityAggregator as site to have every page's blocks added to it
+    as they are scored, which works with or without keep_blocks.
+    """
+    for _, page in _iter_pages(urls, workers, fetch_workers, cache, boilerplate, keep_blocks, site):
+        yield page
+
+
+def analyze_pages_citability(
+    urls: list,
+    workers: Optional[int] = None,
+    cache: Optional[PassageScoreCache] = None,
+    boilerplate: Optional[BoilerplateDetector] = None,
+    fetch_workers: int = 8,
+    keep_blocks: bool = True,
+    site: Optional[SiteCitabilityAggregator] = None,
+) -> list:
+    """Like iter_pages_citability(), but return every report in input order."""
+    results = [None] * len(urls)
+    for index, page in _iter_pages(urls, workers, fetch_workers, cache, boilerplate, keep_blocks, site):
+        results[index] = page
+    return results
+
+
+def read_url_file(path: str) -> list:
+    """Read URLs from a file (or "-" for stdin), one per line; # starts a comment."""
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        return [line.split("#", 1)[0].strip() for line in stream if line.split("#", 1)[0].strip()]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def sitemap_pages(url: str, max_pages: int) -> list:
+    """Page URLs from a sitemap URL, or from a site's standard sitemap locations."""
+    if urlparse(url).path.rstrip("/").endswith(".xml"):
+        return read_sitemap(url, max_pages=max_pages)
+    return crawl_sitemap(url, max_pages=max_pages)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python citability_scorer.py <url>")
-        print("Returns JSON with citability analysis for all content blocks.")
-        sys.exit(1)
-
-    url = sys.argv[1]
-    result = analyze_page_citability(url)
-    print(json.dumps(result, indent=2, default=str))
+    parser = argparse.ArgumentParser(
+        description="Score page content blocks for AI citation readiness. "
+        "Returns JSON with citability analysis for all content blocks."
+    )
+    parser.add_argument("urls", nargs="*", metavar="url", help="page URL(s) to analyze")
+    parser.add_argument(
+        "--url-file",
+        metavar="PATH",
+        help='file with one URL per line ("-" reads stdin)',
+    )
+    parser.add_argument(
+        "--sitemap",
+        metavar="URL",
+        help="analyze pages listed in this sitemap.xml (or a site's default sitemap)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=50,
+        help="page limit when reading a sitemap (default: 50)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="print one JSON line per page as it completes, then a summary line",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="scoring processes for multi-URL runs (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=8,
+        help="concurrent page downloads for multi-URL runs (default: 8)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite file that keeps passage scores between runs",
+    )
+    parser.add_argument(
+        "--boilerplate-threshold",
+        type=float,
+        default=0.5,
+        metavar="SHARE",
+        help="drop paragraphs found on more than this share of pages (multi-URL runs; 0 disables)",
+    )
+    parser.add_argument(
+        "--boilerplate-sample",
+        type=int,
+        default=20,
+        metavar="PAGES",
+        help="pages fetched before scoring starts to learn template paragraphs from (default: 20)",
+    )
+    parser.add_argument(
+        "--no-blocks",
+        action="store_true",
+        help='leave "all_blocks" out of page reports (keeps only the top/bottom 5)',
+    )
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.url_file:
+        urls.extend(read_url_file(args.url_file))
+    if args.sitemap:
+        try:
+            urls.extend(sitemap_pages(args.sitemap, args.max_pages))
+        except Exception as e:
+            print(json.dumps({"error": f"Failed to read sitemap: {str(e)}"}, indent=2))
+            sys.exit(1)
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        parser.error("no URLs given (pass URLs, --url-file or --sitemap)")
+
+    cache = PassageScoreCache(path=args.cache, namespace=SCORER_VERSION)
+    if len(urls) == 1 and not args.stream:
+        result = analyze_page_citability(urls[0], cache=cache, keep_blocks=not args.no_blocks)
+    else:
+        boilerplate = None
+        if args.boilerplate_threshold:
+            boilerplate = BoilerplateDetector(args.boilerplate_threshold, sample_pages=args.boilerplate_sample)
+        site = SiteCitabilityAggregator()
+        pages = []
+        results = iter_pages_citability(
+            urls,
+            workers=args.workers,
+            fetch_workers=args.fetch_workers,
+            cache=cache,
+            boilerplate=boilerplate,
+            keep_blocks=not args.no_blocks,
+            site=site,
+        )
+        for page in results:
+            if args.stream:
+                print(json.dumps(page, default=str), flush=True)
+            else:
+                pages.append(page)
+        if args.stream:
+            result = {"site_summary": site.summary()}
+        else:
+            order = {url: i for i, url in enumerate(urls)}
+            pages.sort(key=lambda page: order[page["url"]])
+            result = {"pages": pages, "site_summary": site.summary()}
+        if boilerplate is not None:
+            result["boilerplate"] = boilerplate.summary()
+    if args.cache or len(urls) > 1 or args.stream:
+        result["score_cache"] = cache.stats()
+    cache.close()
+    print(json.dumps(result, default=str) if args.stream else json.dumps(result, indent=2, default=str))
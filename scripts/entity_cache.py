@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Entity Cache — Keeps Wikipedia and Wikidata lookups between brand scans.
+
+Every brand_scanner run used to ask the APIs again about brands checked
+minutes earlier. Lookups are stored in a single SQLite file keyed by
+(lookup kind, API endpoint, normalized brand or entity id), so repeat
+scans answer from disk and keep working with the network down.
+
+Each source has its own time-to-live; lookups that found nothing are
+cached too, for a shorter time, so a brand without a Wikipedia page is
+not searched again on every run. Expired entries are refetched, but are
+still served when the API can't be reached.
+"""
+
+import json
+import time
+import sqlite3
+import argparse
+import threading
+from typing import Optional
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# How long a lookup stays fresh, per source, in seconds
+DEFAULT_TTLS = {
+    "wikipedia": 7 * DAY,
+    "wikidata": 30 * DAY,
+}
+# Lookups that found nothing are rechecked sooner: pages get created
+MISS_TTL = DAY
+
+# Lookup kinds and the source whose TTL applies
+KIND_SOURCES = {
+    "wikipedia_search": "wikipedia",
+    "wikipedia_title": "wikipedia",
+    "wikidata_search": "wikidata",
+    "wikidata_entity": "wikidata",
+}
+
+
+def normalize_brand(name: str) -> str:
+    """Cache key form of a brand name: case-folded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
+
+
+class EntityCache:
+    """SQLite-backed TTL cache of entity lookups, safe to share between threads.
+
+    Values are JSON-serializable dicts; an empty dict records a lookup
+    that found nothing.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[dict] = None,
+        miss_ttl: float = MISS_TTL,
+        commit_every: int = 100,
+    ):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.miss_ttl = miss_ttl
+        self.commit_every = commit_every
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.expired = 0
+        self.misses = 0
+        self.stale_served = 0
+        self.stored = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entity_lookups ("
+            "kind TEXT NOT NULL, endpoint TEXT NOT NULL, key TEXT NOT NULL, "
+            "value TEXT NOT NULL, found INTEGER NOT NULL, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (kind, endpoint, key))"
+        )
+
+    def ttl(self, kind: str, found: bool) -> float:
+        """Seconds a lookup of this kind stays fresh."""
+        return self.ttls[KIND_SOURCES[kind]] if found else self.miss_ttl
+
+    def get(self, kind: str, endpoint: str, key: str, stale: bool = False) -> Optional[dict]:
+        """The cached value, or None when absent or expired.
+
+        With stale=True an expired value is returned too (and counted as
+        served stale); use it when the API call has failed. A closed cache
+        always misses.
+        """
+        with self._lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, found, fetched_at FROM entity_lookups WHERE kind = ? AND endpoint = ? AND key = ?",
+                (kind, endpoint, key),
+            ).fetchone()
+            if row is None:
+                if not stale:
+                    self.misses += 1
+                return None
+            value, found, fetched_at = row
+            if time.time() - fetched_at > self.ttl(kind, bool(found)):
+                if not stale:
+                    self.expired += 1
+                    return None
+                self.stale_served += 1
+            elif found:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+            return json.loads(value)
+
+    def put(self, kind: str, endpoint: str, key: str, value: dict) -> None:
+        """Store a fresh lookup result ({} for nothing found).
+
+        Does nothing once the cache is closed: a lookup that outlived its
+        deadline may finish after the caller is done with the cache.
+        """
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO entity_lookups (kind, endpoint, key, value, found, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, endpoint, key, json.dumps(value), 1 if value else 0, time.time()),
+            )
+            self.stored += 1
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self._db.commit()
+                self._uncommitted = 0
+
+    def purge_expired(self) -> int:
+        """Delete entries past their TTL; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for kind, source in KIND_SOURCES.items():
+                removed += self._db.execute(
+                    "DELETE FROM entity_lookups WHERE kind = ? AND "
+                    "((found = 1 AND fetched_at < ?) OR (found = 0 AND fetched_at < ?))",
+                    (kind, now - self.ttls[source], now - self.miss_ttl),
+                ).rowcount
+            self._db.commit()
+        return removed
+
+    def entity_records(self, language: str = "en") -> list:
+        """Cached Wikidata entities, fresh or not, as wikidata_index-style records."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT value FROM entity_lookups WHERE kind = 'wikidata_entity' AND found = 1"
+            ).fetchall()
+        records = []
+        for (value,) in rows:
+            entity = json.loads(value)
+            sitelinks = entity.get("sitelinks", {})
+            records.append(
+                {
+                    "id": entity.get("id", ""),
+                    "label": entity.get("labels", {}).get(language, {}).get("value", ""),
+                    "description": entity.get("descriptions", {}).get(language, {}).get("value", ""),
+                    "aliases": [a["value"] for a in entity.get("aliases", {}).get(language, []) if a.get("value")],
+                    "sitelinks": len(sitelinks),
+                    "wikipedia_title": sitelinks.get(f"{language}wiki", {}).get("title", ""),
+                }
+            )
+        return records
+
+    def entries_by_kind(self) -> dict:
+        """{kind: {"entries", "found"}} over everything stored, fresh or not."""
+        with self._lock:
+            rows = self._db.execute("SELECT kind, COUNT(*), SUM(found) FROM entity_lookups GROUP BY kind").fetchall()
+        return {kind: {"entries": count, "found": found} for kind, count, found in rows}
+
+    def stats(self) -> dict:
+        """Hit/miss counters for the report."""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.expired + self.misses
+            entries = self._db.execute("SELECT COUNT(*) FROM entity_lookups").fetchone()[0]
+        return {
+            "lookups": lookups,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "expired": self.expired,
+            "misses": self.misses,
+            "stale_served": self.stale_served,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 3) if lookups else 0.0,
+            "stored": self.stored,
+            "entries_in_store": entries,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or prune a brand_scanner entity cache. Returns JSON.")
+    parser.add_argument("path", help="SQLite cache file")
+    parser.add_argument("--purge", action="store_true", help="delete expired entries first")
+    args = parser.parse_args()
+
+    with EntityCache(args.path) as cache:
+        output = {"purged": cache.purge_expired()} if args.purge else {}
+        output.update(cache.stats())
+        output["by_kind"] = cache.entries_by_kind()
+    print(json.dumps(output, indent=2))
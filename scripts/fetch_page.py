@@ -7,14 +7,19 @@ Extracts HTML, text content, meta tags, headers, and structured data.
 import sys
 import json
 import re
+import codecs
+import gzip
+import warnings
 from urllib.parse import urljoin, urlparse
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.compat import chardet
+    from bs4 import BeautifulSoup, NavigableString, Tag, XMLParsedAsHTMLWarning
+    from lxml import etree
 except ImportError:
-    print("ERROR: Required packages not installed. Run: pip install requests beautifulsoup4")
+    print("ERROR: Required packages not installed. Run: pip install requests beautifulsoup4 lxml")
     sys.exit(1)
 
 # Common AI crawler user agents for testing
@@ -33,9 +38,353 @@ DEFAULT_HEADERS = {
     "Accept-Encoding": "gzip, deflate",
 }
 
+# Page chrome left out of text content, links and images
+PAGE_CHROME_TAGS = ("script", "style", "nav", "footer", "header")
+
+# Head-only reads stop at </head>, or after this many bytes for pages whose
+# head never ends (or is enormous)
+HEAD_MAX_BYTES = 256 * 1024
+HEAD_CHUNK_BYTES = 16 * 1024
+# An opening <body> also ends the head, for pages that omit </head>
+_HEAD_END_RE = re.compile(rb"</head\s*>|<body[\s>]", re.I)
+
+# Streamed text files (llms.txt, llms-full.txt) are decoded chunk by chunk
+TEXT_CHUNK_BYTES = 64 * 1024
+TEXT_LINE_MAX_CHARS = 64 * 1024
+
+# The HTML spec requires <meta charset> within the first 1024 bytes; allow
+# some slack for pages that put long comments or scripts ahead of it.
+CHARSET_SNIFF_BYTES = 4096
+# Charset detection is a last resort and only ever looks at the page head.
+CHARSET_DETECT_BYTES = 64 * 1024
+
+_HEADER_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(
+    rb"<meta[^>]+?charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I
+)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    """Return the canonical codec name, or None if Python doesn't know it."""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip().strip("\"'")).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(content: bytes, content_type: Optional[str] = None) -> str:
+    """Pick the charset for raw HTML bytes without scanning the whole body.
+
+    Checks, in order: the Content-Type charset, a byte order mark, a
+    <meta charset> / http-equiv declaration near the top of the document,
+    and finally charset detection over a bounded sample of the head.
+    Falls back to UTF-8.
+    """
+    if content_type:
+        match = _HEADER_CHARSET_RE.search(content_type)
+        encoding = _known_encoding(match.group(1)) if match else None
+        if encoding:
+            return encoding
+
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    match = _META_CHARSET_RE.search(content[:CHARSET_SNIFF_BYTES])
+    if match:
+        encoding = _known_encoding(match.group(1).decode("ascii", "ignore"))
+        if encoding:
+            return encoding
+
+    sample = content[:CHARSET_DETECT_BYTES]
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # A multi-byte sequence cut off by the sample boundary is still UTF-8
+        if e.start >= len(sample) - 3 and e.reason == "unexpected end of data":
+            return "utf-8"
+
+    if len(content) > len(sample):
+        # End the sample on a tag so it doesn't cut a multi-byte character in
+        # half; "<" is never a trail byte in Shift_JIS, GBK or Big5, and a cut
+        # character makes detection give up
+        cut = sample.rfind(b"<")
+        if cut > 0:
+            sample = sample[:cut]
+    detected = chardet.detect(sample) if chardet else None
+    encoding = _known_encoding(detected.get("encoding")) if detected else None
+    return encoding or "utf-8"
+
+
+def parse_html(markup, content_type: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML into a BeautifulSoup tree.
+
+    Bytes are handed straight to lxml together with the charset picked by
+    detect_encoding(), so the body is decoded once, in C, and never run
+    through full-document charset sniffing.
+    """
+    if isinstance(markup, str):
+        return BeautifulSoup(markup, "lxml")
+    return BeautifulSoup(
+        markup, "lxml", from_encoding=detect_encoding(markup, content_type)
+    )
+
+
+def parse_response(response) -> BeautifulSoup:
+    """Parse a requests response body without touching response.text."""
+    return parse_html(response.content, response.headers.get("Content-Type"))
+
+
+def fetch_soup(url: str, timeout: int = 30) -> BeautifulSoup:
+    """Download a page and parse it. Raises on network or HTTP errors."""
+    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    return parse_response(response)
+
+
+def read_head(response, max_bytes: int = HEAD_MAX_BYTES) -> bytes:
+    """Read a streamed response up to the end of its <head>, then close it.
+
+    The response must come from requests.get(..., stream=True). Reading
+    stops at </head> (or an opening <body>) or after max_bytes, so the rest
+    of the page is never downloaded.
+    """
+    buffer = bytearray()
+    try:
+        for chunk in response.iter_content(HEAD_CHUNK_BYTES):
+            # Look back a little so a tag split across chunks is still found
+            search_from = max(0, len(buffer) - 16)
+            buffer += chunk
+            match = _HEAD_END_RE.search(buffer, search_from)
+            if match:
+                end = match.end() if match.group().startswith(b"</") else match.start()
+                return bytes(buffer[:end])
+            if len(buffer) >= max_bytes:
+                break
+    finally:
+        response.close()
+    return bytes(buffer[:max_bytes])
+
+
+def fetch_head(url: str, timeout: int = 30, max_bytes: int = HEAD_MAX_BYTES) -> BeautifulSoup:
+    """Download and parse only a page's <head>. Raises on network or HTTP errors."""
+    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout, stream=True)
+    if not response.ok:
+        response.close()
+        response.raise_for_status()
+    return parse_html(read_head(response, max_bytes), response.headers.get("Content-Type"))
+
+
+def load_soup(source, timeout: int = 30) -> BeautifulSoup:
+    """Turn any page source the analyzers accept into a parsed tree.
+
+    source may be a URL, raw HTML bytes, a BeautifulSoup tree, or a
+    fetch_page(..., keep_tree=True) result. Trees are never modified by the
+    analyzers, so one parse can feed all of them.
+    """
+    if isinstance(source, BeautifulSoup):
+        return source
+    if isinstance(source, dict):
+        if source.get("soup") is not None:
+            return source["soup"]
+        if source.get("html") is not None:
+            return parse_html(source["html"], source.get("headers", {}).get("Content-Type"))
+        raise ValueError("fetch_page result has no HTML; call fetch_page(url, keep_tree=True)")
+    if isinstance(source, (bytes, bytearray)):
+        return parse_html(bytes(source))
+    return fetch_soup(source, timeout=timeout)
+
+
+def iter_elements(root, names, skip=()) -> Iterator[Tag]:
+    """Yield tags named in names under root, in document order.
+
+    Subtrees of tags named in skip are not entered. This gives the same
+    elements as decomposing the skip tags and calling find_all(names), but
+    leaves the tree intact for other analyzers.
+    """
+    stack = [iter(root.children)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag) and node.name not in skip:
+                if node.name in names:
+                    yield node
+                stack.append(iter(node.children))
+                break
+        else:
+            stack.pop()
+
+
+def element_text(element, skip=(), separator: str = "", strip: bool = True) -> str:
+    """get_text() for element, ignoring anything inside tags named in skip."""
+    types = element.interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+    if isinstance(types, type):
+        types = {types}
+    strings = []
+    stack = [iter(element.children)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag):
+                if node.name not in skip:
+                    stack.append(iter(node.children))
+                    break
+            elif isinstance(node, NavigableString) and type(node) in types:
+                text = node.strip() if strip else node
+                if text:
+                    strings.append(text)
+        else:
+            stack.pop()
+    return separator.join(strings)
+
+
+def response_text(response) -> str:
+    """Decode a text response (robots.txt, llms.txt) with bounded sniffing."""
+    content = response.content
+    encoding = detect_encoding(content, response.headers.get("Content-Type"))
+    return content.decode(encoding, errors="replace")
+
+
+def iter_response_lines(response, max_line_chars: int = TEXT_LINE_MAX_CHARS) -> Iterator[str]:
+    """Yield the lines of a streamed text response without holding the body.
+
+    The response must come from requests.get(..., stream=True). The charset
+    is picked from the first chunk the same way response_text() picks it,
+    and the body is decoded incrementally, so memory stays flat however
+    large the file is. Lines longer than max_line_chars come out in pieces.
+    """
+    decoder = None
+    pending = ""
+    try:
+        for chunk in response.iter_content(TEXT_CHUNK_BYTES):
+            if decoder is None:
+                encoding = detect_encoding(chunk, response.headers.get("Content-Type"))
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            pending += decoder.decode(chunk)
+            lines = pending.split("\n")
+            pending = lines.pop()
+            yield from lines
+            while len(pending) > max_line_chars:
+                yield pending[:max_line_chars]
+                pending = pending[max_line_chars:]
+        if decoder is not None:
+            pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+    finally:
+        response.close()
+
+
+def read_meta_tags(soup, result: dict) -> dict:
+    """Fill result's title, meta_tags, description and canonical from soup."""
+    title_tag = soup.find("title")
+    result["title"] = title_tag.get_text(strip=True) if title_tag else None
+
+    for meta in soup.find_all("meta"):
+        name = meta.get("name", meta.get("property", ""))
+        content = meta.get("content", "")
+        if name and content:
+            result["meta_tags"][name.lower()] = content
+            if name.lower() == "description":
+                result["description"] = content
+
+    canonical = soup.find("link", rel="canonical")
+    result["canonical"] = canonical.get("href") if canonical else None
+    return result
+
+
+def fetch_page_head(url: str, timeout: int = 30, max_bytes: int = HEAD_MAX_BYTES) -> dict:
+    """Fetch only a page's <head> and return its metadata.
+
+    The body is streamed until </head> (or an opening <body>, or max_bytes)
+    and the connection is then closed, so metadata sweeps over many pages
+    skip downloading and parsing page bodies. head_bytes is the size of the
+    head that was parsed; head_truncated means max_bytes was reached first.
+    """
+    result = {
+        "url": url,
+        "status_code": None,
+        "redirect_chain": [],
+        "headers": {},
+        "meta_tags": {},
+        "title": None,
+        "description": None,
+        "canonical": None,
+        "robots": None,
+        "x_robots_tag": None,
+        "hreflang": [],
+        "structured_data": [],
+        "head_bytes": 0,
+        "head_truncated": False,
+        "errors": [],
+    }
+
+    try:
+        response = requests.get(
+            url,
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            allow_redirects=True,
+            stream=True,
+        )
+
+        if response.history:
+            result["redirect_chain"] = [
+                {"url": r.url, "status": r.status_code} for r in response.history
+            ]
+        result["status_code"] = response.status_code
+        result["headers"] = dict(response.headers)
+        result["x_robots_tag"] = response.headers.get("X-Robots-Tag")
+
+        head = read_head(response, max_bytes)
+        result["head_bytes"] = len(head)
+        result["head_truncated"] = len(head) >= max_bytes
+        soup = parse_html(head, response.headers.get("Content-Type"))
+
+        read_meta_tags(soup, result)
+        result["robots"] = result["meta_tags"].get("robots")
+
+        for link in soup.find_all("link", hreflang=True):
+            if "alternate" in (link.get("rel") or []):
+                result["hreflang"].append(
+                    {"hreflang": link["hreflang"], "href": urljoin(response.url, link.get("href", ""))}
+                )
+
+        for script in soup.find_all("script", type="application/ld+json"):
+            try:
+                result["structured_data"].append(json.loads(script.string))
+            except (json.JSONDecodeError, TypeError):
+                result["errors"].append("Invalid JSON-LD detected")
+
+    except requests.exceptions.Timeout:
+        result["errors"].append(f"Timeout after {timeout} seconds")
+    except requests.exceptions.ConnectionError as e:
+        result["errors"].append(f"Connection error: {str(e)}")
+    except Exception as e:
+        result["errors"].append(f"Unexpected error: {str(e)}")
+
+    return result
+
+
+def fetch_page(url: str, timeout: int = 30, keep_tree: bool = False, head_only: bool = False) -> dict:
+    """Fetch a page and return structured analysis data.
+
+    With keep_tree=True the result also carries the raw body ("html") and
+    the parsed tree ("soup"), so citability, content-block and llms.txt
+    analysis can reuse this fetch instead of downloading the page again.
+    With head_only=True only the <head> is downloaded; see fetch_page_head().
+    """
+    if head_only:
+        return fetch_page_head(url, timeout=timeout)
 
-def fetch_page(url: str, timeout: int = 30) -> dict:
-    """Fetch a page and return structured analysis data."""
     result = {
         "url": url,
         "status_code": None,
@@ -88,24 +437,10 @@ def fetch_page(url: str, timeout: int = 30) -> dict:
             result["security_headers"][header] = response.headers.get(header, None)
 
         # Parse HTML
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # Title
-        title_tag = soup.find("title")
-        result["title"] = title_tag.get_text(strip=True) if title_tag else None
-
-        # Meta tags
-        for meta in soup.find_all("meta"):
-            name = meta.get("name", meta.get("property", ""))
-            content = meta.get("content", "")
-            if name and content:
-                result["meta_tags"][name.lower()] = content
-                if name.lower() == "description":
-                    result["description"] = content
+        soup = parse_response(response)
 
-        # Canonical
-        canonical = soup.find("link", rel="canonical")
-        result["canonical"] = canonical.get("href") if canonical else None
+        # Title, meta tags and canonical
+        read_meta_tags(soup, result)
 
         # Headings
         for level in range(1, 7):
@@ -115,17 +450,38 @@ def fetch_page(url: str, timeout: int = 30) -> dict:
                 if level == 1:
                     result["h1_tags"].append(text)
 
-        # Text content
-        for element in soup.find_all(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        text = soup.get_text(separator=" ", strip=True)
+        # Structured data (JSON-LD)
+        for script in soup.find_all("script", type="application/ld+json"):
+            try:
+                data = json.loads(script.string)
+                result["structured_data"].append(data)
+            except (json.JSONDecodeError, TypeError):
+                result["errors"].append("Invalid JSON-LD detected")
+
+        # SSR check — look for signs of client-side only rendering
+        js_app_roots = soup.find_all(id=re.compile(r"(app|root|__next|__nuxt)", re.I))
+
+        if js_app_roots:
+            # Check if the app root has meaningful content
+            for root in js_app_roots:
+                inner_text = root.get_text(strip=True)
+                if len(inner_text) < 50:
+                    result["has_ssr_content"] = False
+                    result["errors"].append(
+                        f"Possible client-side only rendering detected: #{root.get('id', 'unknown')} has minimal server-rendered content"
+                    )
+
+        # Text content (nav, header and footer are left out, not removed)
+        text = element_text(soup, PAGE_CHROME_TAGS, separator=" ")
         result["text_content"] = text
         result["word_count"] = len(text.split())
 
         # Links
         parsed_url = urlparse(url)
         base_domain = parsed_url.netloc
-        for link in soup.find_all("a", href=True):
+        for link in iter_elements(soup, {"a"}, PAGE_CHROME_TAGS):
+            if link.get("href") is None:
+                continue
             href = urljoin(url, link["href"])
             link_text = link.get_text(strip=True)
             parsed_href = urlparse(href)
@@ -135,7 +491,7 @@ def fetch_page(url: str, timeout: int = 30) -> dict:
                 result["external_links"].append({"url": href, "text": link_text})
 
         # Images
-        for img in soup.find_all("img"):
+        for img in iter_elements(soup, {"img"}, PAGE_CHROME_TAGS):
             img_data = {
                 "src": img.get("src", ""),
                 "alt": img.get("alt", ""),
@@ -145,31 +501,9 @@ def fetch_page(url: str, timeout: int = 30) -> dict:
             }
             result["images"].append(img_data)
 
-        # Structured data (JSON-LD)
-        for script in BeautifulSoup(response.text, "lxml").find_all(
-            "script", type="application/ld+json"
-        ):
-            try:
-                data = json.loads(script.string)
-                result["structured_data"].append(data)
-            except (json.JSONDecodeError, TypeError):
-                result["errors"].append("Invalid JSON-LD detected")
-
-        # SSR check — look for signs of client-side only rendering
-        noscript_tags = BeautifulSoup(response.text, "lxml").find_all("noscript")
-        js_app_roots = BeautifulSoup(response.text, "lxml").find_all(
-            id=re.compile(r"(app|root|__next|__nuxt)", re.I)
-        )
-
-        if js_app_roots:
-            # Check if the app root has meaningful content
-            for root in js_app_roots:
-                inner_text = root.get_text(strip=True)
-                if len(inner_text) < 50:
-                    result["has_ssr_content"] = False
-                    result["errors"].append(
-                        f"Possible client-side only rendering detected: #{root.get('id', 'unknown')} has minimal server-rendered content"
-                    )
+        if keep_tree:
+            result["html"] = response.content
+            result["soup"] = soup
 
     except requests.exceptions.Timeout:
         result["errors"].append(f"Timeout after {timeout} seconds")
@@ -217,10 +551,10 @@ def fetch_robots_txt(url: str, timeout: int = 15) -> dict:
 
         if response.status_code == 200:
             result["exists"] = True
-            result["content"] = response.text
+            result["content"] = response_text(response)
 
             # Parse for each AI crawler
-            lines = response.text.split("\n")
+            lines = result["content"].split("\n")
             current_agent = None
             agent_rules = {}
 
@@ -308,30 +642,33 @@ def fetch_llms_txt(url: str, timeout: int = 15) -> dict:
             )
             if response.status_code == 200:
                 result[key]["exists"] = True
-                result[key]["content"] = response.text
+                result[key]["content"] = response_text(response)
         except Exception as e:
             result["errors"].append(f"Error checking {check_url}: {str(e)}")
 
     return result
 
 
-def extract_content_blocks(html: str) -> list:
-    """Extract content blocks for citability analysis."""
-    soup = BeautifulSoup(html, "lxml")
+def extract_content_blocks(html) -> list:
+    """Extract content blocks for citability analysis.
 
-    # Remove non-content elements
-    for element in soup.find_all(
-        ["script", "style", "nav", "footer", "header", "aside"]
-    ):
-        element.decompose()
+    Accepts HTML as str or raw bytes, a parsed BeautifulSoup tree, or a
+    fetch_page(..., keep_tree=True) result. The tree is not modified.
+    """
+    soup = parse_html(html) if isinstance(html, str) else load_soup(html)
+    skip = ("script", "style", "nav", "footer", "header", "aside")
 
     blocks = []
     # Extract content sections (between headings)
     current_heading = None
     current_content = []
+    # Content tag names seen so far (what find_all_previous would report)
+    seen_tag_types = set()
 
-    for element in soup.find_all(
-        ["h1", "h2", "h3", "h4", "h5", "h6", "p", "ul", "ol", "table", "blockquote"]
+    for element in iter_elements(
+        soup,
+        {"h1", "h2", "h3", "h4", "h5", "h6", "p", "ul", "ol", "table", "blockquote"},
+        skip,
     ):
         tag = element.name
 
@@ -345,22 +682,15 @@ def extract_content_blocks(html: str) -> list:
                         "heading": current_heading,
                         "content": text,
                         "word_count": word_count,
-                        "tag_types": list(
-                            set(
-                                [
-                                    e.name
-                                    for e in element.find_all_previous(
-                                        ["p", "ul", "ol", "table"]
-                                    )
-                                ]
-                            )
-                        ),
+                        "tag_types": list(seen_tag_types),
                     }
                 )
-            current_heading = element.get_text(strip=True)
+            current_heading = element_text(element, skip)
             current_content = []
         else:
-            text = element.get_text(strip=True)
+            if tag != "blockquote":
+                seen_tag_types.add(tag)
+            text = element_text(element, skip)
             if text:
                 current_content.append(text)
 
@@ -378,6 +708,104 @@ def extract_content_blocks(html: str) -> list:
     return blocks
 
 
+def read_sitemap(sitemap_url: str, max_pages: int = 50, timeout: int = 15) -> list:
+    """Return page URLs listed in one sitemap, in document order.
+
+    Sitemap indexes are followed one level down; child sitemaps that fail
+    to load are skipped. Errors fetching sitemap_url itself are raised.
+    """
+    with warnings.catch_warnings():
+        # Sitemaps go through the lenient HTML parser on purpose
+        warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+        return _read_sitemap(sitemap_url, max_pages, timeout)
+
+
+def _read_sitemap(sitemap_url: str, max_pages: int, timeout: int) -> list:
+    response = requests.get(sitemap_url, headers=DEFAULT_HEADERS, timeout=timeout)
+    response.raise_for_status()
+    soup = parse_response(response)
+
+    discovered_pages = {}
+
+    # Check for sitemap index
+    for sitemap in soup.find_all("sitemap"):
+        if len(discovered_pages) >= max_pages:
+            break
+        loc = sitemap.find("loc")
+        if loc:
+            # Fetch child sitemap
+            try:
+                child_resp = requests.get(loc.text.strip(), headers=DEFAULT_HEADERS, timeout=timeout)
+                if child_resp.status_code == 200:
+                    for url_tag in parse_response(child_resp).find_all("url"):
+                        loc_tag = url_tag.find("loc")
+                        if loc_tag:
+                            discovered_pages.setdefault(loc_tag.text.strip(), None)
+                        if len(discovered_pages) >= max_pages:
+                            break
+            except Exception:
+                pass
+
+    # Direct URL entries
+    for url_tag in soup.find_all("url"):
+        if len(discovered_pages) >= max_pages:
+            break
+        loc = url_tag.find("loc")
+        if loc:
+            discovered_pages.setdefault(loc.text.strip(), None)
+
+    return list(discovered_pages)[:max_pages]
+
+
+def iter_sitemap(sitemap_url: str, timeout: int = 15, follow_index: bool = True) -> Iterator[dict]:
+    """Stream {"loc", "lastmod"} entries from a sitemap, in document order.
+
+    The XML is parsed incrementally as it downloads and each entry is
+    discarded once yielded, so sitemaps with tens of thousands of URLs use
+    constant memory. Gzipped sitemaps (.xml.gz) are supported. Sitemap
+    indexes are followed one level down; child sitemaps that fail to load
+    are skipped. Errors fetching sitemap_url itself are raised.
+    """
+    response = requests.get(sitemap_url, headers=DEFAULT_HEADERS, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        source = response.raw
+        content_type = response.headers.get("Content-Type", "")
+        if urlparse(response.url).path.endswith(".gz") or "gzip" in content_type:
+            source = gzip.GzipFile(fileobj=source)
+
+        entry = {}
+        for _, element in etree.iterparse(
+            source, events=("end",), recover=True, huge_tree=True, resolve_entities=False, no_network=True
+        ):
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            tag = tag.rpartition("}")[2]
+            if tag in ("loc", "lastmod"):
+                # Skip image:loc, video:loc and other extension fields
+                parent = element.getparent()
+                if parent is not None and parent.tag.rpartition("}")[2] in ("url", "sitemap"):
+                    entry[tag] = (element.text or "").strip()
+                continue
+            if tag == "url" and entry.get("loc"):
+                yield {"loc": entry["loc"], "lastmod": entry.get("lastmod") or None}
+            elif tag == "sitemap" and entry.get("loc") and follow_index:
+                try:
+                    yield from iter_sitemap(entry["loc"], timeout, follow_index=False)
+                except Exception:
+                    pass
+            if tag in ("url", "sitemap"):
+                entry = {}
+                # Drop finished entries so the tree never grows
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+    finally:
+        response.close()
+
+
 def crawl_sitemap(url: str, max_pages: int = 50, timeout: int = 15) -> list:
     """Crawl sitemap.xml to discover pages."""
     parsed = urlparse(url)
@@ -387,61 +815,21 @@ def crawl_sitemap(url: str, max_pages: int = 50, timeout: int = 15) -> list:
         f"{parsed.scheme}://{parsed.netloc}/sitemap/",
     ]
 
-    discovered_pages = set()
-
     for sitemap_url in sitemap_urls:
         try:
-            response = requests.get(
-                sitemap_url, headers=DEFAULT_HEADERS, timeout=timeout
-            )
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Check for sitemap index
-                for sitemap in soup.find_all("sitemap"):
-                    loc = sitemap.find("loc")
-                    if loc:
-                        # Fetch child sitemap
-                        try:
-                            child_resp = requests.get(
-                                loc.text.strip(),
-                                headers=DEFAULT_HEADERS,
-                                timeout=timeout,
-                            )
-                            if child_resp.status_code == 200:
-                                child_soup = BeautifulSoup(child_resp.text, "lxml")
-                                for url_tag in child_soup.find_all("url"):
-                                    loc_tag = url_tag.find("loc")
-                                    if loc_tag:
-                                        discovered_pages.add(loc_tag.text.strip())
-                                    if len(discovered_pages) >= max_pages:
-                                        break
-                        except Exception:
-                            pass
-                    if len(discovered_pages) >= max_pages:
-                        break
-
-                # Direct URL entries
-                for url_tag in soup.find_all("url"):
-                    loc = url_tag.find("loc")
-                    if loc:
-                        discovered_pages.add(loc.text.strip())
-                    if len(discovered_pages) >= max_pages:
-                        break
-
-                if discovered_pages:
-                    break
-
+            discovered_pages = read_sitemap(sitemap_url, max_pages, timeout)
         except Exception:
             continue
+        if discovered_pages:
+            return discovered_pages
 
-    return list(discovered_pages)[:max_pages]
+    return []
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python fetch_page.py <url> [mode]")
-        print("Modes: page (default), robots, llms, sitemap, blocks, full")
+        print("Modes: page (default), head, robots, llms, sitemap, blocks, full")
         sys.exit(1)
 
     target_url = sys.argv[1]
@@ -449,6 +837,8 @@ if __name__ == "__main__":
 
     if mode == "page":
         data = fetch_page(target_url)
+    elif mode == "head":
+        data = fetch_page_head(target_url)
     elif mode == "robots":
         data = fetch_robots_txt(target_url)
     elif mode == "llms":
@@ -457,15 +847,22 @@ if __name__ == "__main__":
         pages = crawl_sitemap(target_url)
         data = {"pages": pages, "count": len(pages)}
     elif mode == "blocks":
-        response = requests.get(target_url, headers=DEFAULT_HEADERS, timeout=30)
-        data = extract_content_blocks(response.text)
+        try:
+            data = extract_content_blocks(fetch_soup(target_url))
+        except Exception as e:
+            data = {"error": f"Failed to fetch page: {str(e)}"}
     elif mode == "full":
+        # One download and one parse feed both the page and block analysis
+        page = fetch_page(target_url, keep_tree=True)
         data = {
-            "page": fetch_page(target_url),
+            "page": page,
+            "blocks": extract_content_blocks(page) if "soup" in page else [],
             "robots": fetch_robots_txt(target_url),
             "llms": fetch_llms_txt(target_url),
             "sitemap": crawl_sitemap(target_url),
         }
+        page.pop("soup", None)
+        page.pop("html", None)
     else:
         print(f"Unknown mode: {mode}")
         sys.exit(1)
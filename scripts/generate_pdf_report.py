@@ -24,6 +24,7 @@ Or pipe JSON data from stdin:
 import sys
 import json
 import os
+import threading
 from datetime import datetime
 
 try:
@@ -55,35 +56,66 @@ except ImportError:
 # ============================================================
 FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
 
+FONT_FILES = {
+    "NotoSans": "NotoSans-Regular.ttf",
+    "NotoSans-Bold": "NotoSans-Bold.ttf",
+    "NotoSans-Italic": "NotoSans-Italic.ttf",
+    "NotoSans-BoldItalic": "NotoSans-BoldItalic.ttf",
+    "Amiri": "Amiri-Regular.ttf",
+    "Amiri-Bold": "Amiri-Bold.ttf",
+    "Amiri-Italic": "Amiri-Italic.ttf",
+    "Amiri-BoldItalic": "Amiri-BoldItalic.ttf",
+}
+# Font family per report language; others use Noto Sans (covers all Latin chars)
+LANGUAGE_FONTS = {"en": "NotoSans", "sr": "NotoSans", "ar": "Amiri"}
+FONT_WEIGHTS = {"normal": "", "bold": "-Bold", "italic": "-Italic", "bolditalic": "-BoldItalic"}
+
+# Parsed fonts by name (None when the file is missing), kept for the process
+_registered_fonts = {}
+_font_lock = threading.Lock()
+
+
+def register_font(name):
+    """Register one bundled TTF font the first time it is needed; returns name.
+
+    Parsing a TTF file is the slow part of starting a report, so each font
+    is parsed at most once per process and only when a report uses it.
+    Names that aren't bundled fonts (e.g. Helvetica) are returned as is.
+    """
+    if name in _registered_fonts or name not in FONT_FILES:
+        return name
+    with _font_lock:
+        if name not in _registered_fonts:
+            path = os.path.join(FONTS_DIR, FONT_FILES[name])
+            font = None
+            if os.path.exists(path):
+                font = TTFont(name, path)
+                pdfmetrics.registerFont(font)
+            _registered_fonts[name] = font
+    return name
+
+
 def register_fonts():
-    """Register Noto Sans and Amiri TTF fonts for full Unicode support."""
-    font_map = {
-        "NotoSans": "NotoSans-Regular.ttf",
-        "NotoSans-Bold": "NotoSans-Bold.ttf",
-        "NotoSans-Italic": "NotoSans-Italic.ttf",
-        "NotoSans-BoldItalic": "NotoSans-BoldItalic.ttf",
-        "Amiri": "Amiri-Regular.ttf",
-        "Amiri-Bold": "Amiri-Bold.ttf",
-        "Amiri-Italic": "Amiri-Italic.ttf",
-        "Amiri-BoldItalic": "Amiri-BoldItalic.ttf",
-    }
-    for name, filename in font_map.items():
-        path = os.path.join(FONTS_DIR, filename)
-        if os.path.exists(path):
-            pdfmetrics.registerFont(TTFont(name, path))
+    """Register every bundled Noto Sans and Amiri font up front."""
+    for name in FONT_FILES:
+        register_font(name)
+
+
+class _LazyFonts(dict):
+    """Font names by weight; each font is registered when first looked up."""
+
+    def __getitem__(self, weight):
+        return register_font(super().__getitem__(weight))
 
-# Register on import
-register_fonts()
 
 def get_fonts(lang="en"):
-    """Return font family names for the given language."""
-    if lang == "ar":
-        return {"normal": "Amiri", "bold": "Amiri-Bold", "italic": "Amiri-Italic", "bolditalic": "Amiri-BoldItalic"}
-    elif lang == "sr":
-        return {"normal": "NotoSans", "bold": "NotoSans-Bold", "italic": "NotoSans-Italic", "bolditalic": "NotoSans-BoldItalic"}
-    else:
-        # English: use Noto Sans too for consistency (supports all Latin chars)
-        return {"normal": "NotoSans", "bold": "NotoSans-Bold", "italic": "NotoSans-Italic", "bolditalic": "NotoSans-BoldItalic"}
+    """Return font family names for the given language.
+
+    Fonts are registered lazily: only the weights a report actually looks
+    up are parsed.
+    """
+    family = LANGUAGE_FONTS.get(lang, "NotoSans")
+    return _LazyFonts({weight: family + suffix for weight, suffix in FONT_WEIGHTS.items()})
 
 
 # ============================================================
@@ -309,6 +341,8 @@ def get_score_label(score, lang="en"):
 
 def create_score_gauge(score, width=120, height=120, font_bold='NotoSans-Bold', font_normal='NotoSans'):
     """Create a visual score gauge."""
+    register_font(font_bold)
+    register_font(font_normal)
     d = Drawing(width, height)
 
     # Background circle
@@ -336,6 +370,7 @@ def create_score_gauge(score, width=120, height=120, font_bold='NotoSans-Bold',
 
 def create_bar_chart(data, labels, width=400, height=200, font_normal='NotoSans'):
     """Create a horizontal bar chart for scores."""
+    register_font(font_normal)
     d = Drawing(width, height)
 
     chart = VerticalBarChart()
@@ -366,6 +401,8 @@ def create_bar_chart(data, labels, width=400, height=200, font_normal='NotoSans'
 
 def create_platform_chart(platforms, width=450, height=180, font_normal='NotoSans', font_bold='NotoSans-Bold'):
     """Create a chart showing platform readiness scores."""
+    register_font(font_bold)
+    register_font(font_normal)
     d = Drawing(width, height)
 
     bar_height = 22
@@ -551,6 +588,8 @@ def make_header_footer(lang="en"):
 
 def make_table_style(header_color=PRIMARY, font_bold='NotoSans-Bold', font_normal='NotoSans'):
     """Create a consistent table style."""
+    register_font(font_bold)
+    register_font(font_normal)
     return TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), header_color),
         ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
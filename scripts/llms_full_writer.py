@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+llms-full.txt Writer — Streams a detailed llms-full.txt straight to disk.
+
+Each listed page gets its title, meta description and its most citable
+passages, picked by the citability scorer from the page's content blocks.
+Pages are downloaded on a thread pool and written in llms.txt order as
+soon as each one is ready; only a small window of pages is ever held in
+memory, so multi-megabyte files for large sites cost no more memory than
+small ones.
+
+Size budgets keep the file usable: passages are capped per page
+(page_chars) and the whole file stops growing at max_bytes, with the
+Contact section always written last.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import urlparse
+
+from fetch_page import fetch_soup
+from passage_cache import PassageScoreCache
+
+PASSAGES_PER_PAGE = 3
+# Passage text kept per page, in characters
+PAGE_BUDGET_CHARS = 3000
+# Whole-file size cap, in bytes
+FILE_BUDGET_BYTES = 10 * 1024 * 1024
+FETCH_WORKERS = 8
+
+
+def key_passages(
+    soup, limit: int = PASSAGES_PER_PAGE, budget: int = PAGE_BUDGET_CHARS, cache: Optional[PassageScoreCache] = None
+) -> list:
+    """The page's highest-scoring content blocks, best first, within budget characters.
+
+    A passage that would overflow the budget is cut at a word boundary;
+    passages after it are dropped.
+    """
+    # The scoring stack (and NumPy) loads only when passages are written, so
+    # llmstxt_generator can import this module's budgets for plain llms.txt runs
+    from citability_scorer import extract_citability_blocks, score_passages
+    from site_citability import TopK
+
+    blocks = extract_citability_blocks(soup)
+    top = TopK(limit)
+    for block, scored in zip(blocks, score_passages(blocks, cache=cache)):
+        top.push(scored["total_score"], (block, scored))
+
+    passages = []
+    remaining = budget
+    for block, scored in top.items():
+        content = " ".join(block["content"].split())
+        if len(content) > remaining:
+            content = content[:remaining].rsplit(" ", 1)[0].rstrip(",;:") + "…"
+            if len(content) < 40:
+                break
+        passages.append(
+            {
+                "heading": block["heading"],
+                "content": content,
+                "score": scored["total_score"],
+                "grade": scored["grade"],
+            }
+        )
+        remaining -= len(content)
+        if remaining <= 0:
+            break
+    return passages
+
+
+def page_description(soup) -> str:
+    meta = soup.find("meta", attrs={"name": "description"})
+    return meta.get("content", "").strip() if meta else ""
+
+
+class LlmsFullWriter:
+    """Write llms-full.txt line by line to an open text file under a size cap."""
+
+    def __init__(self, out, max_bytes: int = FILE_BUDGET_BYTES):
+        self.out = out
+        self.max_bytes = max_bytes
+        self.bytes_written = 0
+        self.pages_written = 0
+        self.pages_omitted = 0
+        self.truncated = False
+        self._section = None
+        self._reserved = 0
+
+    def _write(self, text: str) -> None:
+        self.out.write(text)
+        self.bytes_written += len(text.encode("utf-8"))
+
+    def header(self, site_name: str, site_description: str) -> None:
+        self._write(f"# {site_name}\n> {site_description}\n\n")
+
+    def reserve(self, text: str) -> None:
+        """Keep room for text (the closing section) within max_bytes."""
+        self._reserved = len(text.encode("utf-8"))
+
+    def page(self, section: str, url: str, title: str, description: str = "", passages=()) -> bool:
+        """Write one page entry; False once the file budget is used up."""
+        lines = []
+        if section != self._section:
+            # A blank line closes the previous section
+            if self._section is not None:
+                lines.append("\n")
+            lines.append(f"## {section}\n")
+        link = f"- [{title}]({url})"
+        lines.append(f"{link}: {description}\n" if description else f"{link}\n")
+        for passage in passages:
+            heading = f"**{passage['heading']}:** " if passage.get("heading") else ""
+            lines.append(f"  > {heading}{passage['content']}\n")
+        text = "".join(lines)
+
+        if self.truncated or self.bytes_written + len(text.encode("utf-8")) + self._reserved > self.max_bytes:
+            self.truncated = True
+            self.pages_omitted += 1
+            return False
+        self._write(text)
+        self._section = section
+        self.pages_written += 1
+        return True
+
+    def close_sections(self, text: str) -> None:
+        """Finish the last page section and write text (the closing section)."""
+        if self._section is not None:
+            self._write("\n")
+        self._write(text)
+
+    def stats(self) -> dict:
+        return {
+            "bytes_written": self.bytes_written,
+            "pages_written": self.pages_written,
+            "pages_omitted": self.pages_omitted,
+            "truncated": self.truncated,
+        }
+
+
+def write_llms_full(
+    out,
+    site_name: str,
+    site_description: str,
+    base_url: str,
+    sections: dict,
+    passages_per_page: int = PASSAGES_PER_PAGE,
+    page_chars: int = PAGE_BUDGET_CHARS,
+    max_bytes: int = FILE_BUDGET_BYTES,
+    workers: int = FETCH_WORKERS,
+    cache: Optional[PassageScoreCache] = None,
+) -> dict:
+    """Stream llms-full.txt for sections ({name: [{"url", "title"}]}) to out.
+
+    out is a path or an open text file. Pages are fetched workers at a
+    time; passages are scored on the calling thread, which owns the cache.
+    Once max_bytes is reached no further pages are fetched. Returns write
+    statistics.
+    """
+    if isinstance(out, str):
+        with open(out, "w", encoding="utf-8") as f:
+            return write_llms_full(
+                f, site_name, site_description, base_url, sections,
+                passages_per_page, page_chars, max_bytes, workers, cache,
+            )
+
+    netloc = urlparse(base_url).netloc
+    contact = f"## Contact\n- Website: {base_url}\n- Email: contact@{netloc}\n"
+    writer = LlmsFullWriter(out, max_bytes)
+    writer.reserve(contact + "\n")
+    writer.header(site_name, site_description)
+
+    def fetch(url):
+        try:
+            return fetch_soup(url, timeout=15)
+        except Exception:
+            return None
+
+    entries = ((section, page) for section, pages in sections.items() for page in pages)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = deque()
+
+        def drain():
+            nonlocal failed
+            section, page, future = pending.popleft()
+            soup = future.result()
+            if soup is None:
+                failed += 1
+                return writer.page(section, page["url"], page["title"])
+            return writer.page(
+                section,
+                page["url"],
+                page["title"],
+                page_description(soup),
+                key_passages(soup, passages_per_page, page_chars, cache) if passages_per_page else (),
+            )
+
+        for section, page in entries:
+            pending.append((section, page, pool.submit(fetch, page["url"])))
+            if len(pending) >= max(1, workers) * 2 and not drain():
+                break
+        while pending and not writer.truncated:
+            drain()
+        writer.pages_omitted += len(pending) + sum(1 for _ in entries)
+        for _, _, future in pending:
+            future.cancel()
+
+    writer.close_sections(contact)
+    return {**writer.stats(), "pages_failed": failed}
+
@@ -9,10 +9,19 @@ Location: /llms.txt (root of domain)
 Extended: /llms-full.txt (detailed version)
 """
 
+import os
 import sys
 import json
 import re
-from urllib.parse import urljoin, urlparse
+import difflib
+import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Optional
+from urllib.parse import unquote, urljoin, urlparse, urlsplit
 
 try:
     import requests
@@ -21,14 +30,201 @@ except ImportError:
     print("ERROR: Required packages not installed. Run: pip install requests beautifulsoup4")
     sys.exit(1)
 
+from citability_rules import SCORER_VERSION
+from fetch_page import fetch_head, fetch_soup, iter_response_lines, iter_sitemap, load_soup, parse_html, read_head
+from llms_full_writer import FILE_BUDGET_BYTES, PAGE_BUDGET_CHARS, PASSAGES_PER_PAGE, write_llms_full
+from passage_cache import PassageScoreCache
+from path_classifier import PathClassifier, load_rules
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Pages fetched at once when collecting llms-full.txt descriptions
+DESCRIPTION_FETCH_WORKERS = 8
+
+# Sitemap-driven generation: pages read from the sitemap, pages crawled for
+# link authority, links per llms.txt section, pages given a description
+SITEMAP_MAX_PAGES = 100_000
+CRAWL_PAGES = 20
+SECTION_LINKS = 10
+DESCRIBED_PAGES = 50
+
+# Format of the regenerate_llmstxt() state file
+STATE_VERSION = 1
+
+# Link targets checked at once by validate_llmstxt()
+LINK_CHECK_WORKERS = 8
+# Distinct links checked per file; link_count still counts every link
+MAX_CHECKED_LINKS = 500
+# llms.txt text returned in the validation result
+CONTENT_MAX_CHARS = 100 * 1024
+
+_SLUG_EXTENSION_RE = re.compile(r"\.(?:html?|php|aspx?|jsp)$", re.I)
+_SLUG_SPLIT_RE = re.compile(r"[-_+.\s]+")
+
+_LINK_LINE_RE = re.compile(r"- \[.+\]\(.+\)")
+_LINK_URL_RE = re.compile(r"\]\(\s*<?([^\s()<>]+)")
+
+
+class LlmsTxtScanner:
+    """Checks llms.txt structure one line at a time.
+
+    Only counters, flags and up to keep_chars of content are held, so
+    multi-megabyte llms-full.txt files are validated in constant memory.
+    Each link target seen is passed to on_link.
+    """
+
+    def __init__(self, base_url: str, on_link=None, keep_chars: int = 0):
+        self.base_url = base_url
+        self.on_link = on_link
+        self.keep_chars = keep_chars
+        self.content = []
+        self.kept = 0
+        self.truncated = False
+        self.lines = 0
+        self.characters = 0
+        self.first_line = None
+        self.has_description = False
+        self.section_count = 0
+        self.link_count = 0
+        self.mentions_contact = False
+        self.mentions_facts = False
+
+    def feed(self, line: str) -> None:
+        self.lines += 1
+        self.characters += len(line) + 1
+        if self.kept < self.keep_chars:
+            piece = line + "\n"
+            if self.kept + len(piece) > self.keep_chars:
+                piece = piece[: self.keep_chars - self.kept]
+                self.truncated = True
+            self.content.append(piece)
+            self.kept += len(piece)
+        elif self.keep_chars:
+            self.truncated = True
+
+        if self.first_line is None:
+            if not line.strip():
+                return
+            self.first_line = line = line.lstrip()
+
+        if line.startswith("> "):
+            self.has_description = True
+        if line.startswith("## "):
+            self.section_count += 1
+        self.link_count += len(_LINK_LINE_RE.findall(line))
+        lowered = line.lower()
+        if "contact" in lowered:
+            self.mentions_contact = True
+        if "key fact" in lowered or "about" in lowered:
+            self.mentions_facts = True
+        if self.on_link is not None and "](" in line:
+            for target in _LINK_URL_RE.findall(line):
+                href = urljoin(self.base_url, target)
+                if urlparse(href).scheme in ("http", "https"):
+                    self.on_link(href.split("#")[0])
+
+    @property
+    def has_title(self) -> bool:
+        return self.first_line is not None and self.first_line.startswith("# ")
+
+    def text(self) -> str:
+        return "".join(self.content)
+
+
+class LinkChecker:
+    """Checks link targets concurrently with HEAD requests.
+
+    Every URL is requested at most once per checker, so a link repeated in
+    llms.txt and llms-full.txt costs one request. Servers that refuse HEAD
+    get a GET whose body is never read.
+    """
+
+    def __init__(self, workers: int = LINK_CHECK_WORKERS, timeout: int = 10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(1, workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        self._futures = {}
+
+    def submit(self, url: str) -> None:
+        if url not in self._futures:
+            self._futures[url] = self._pool.submit(self._check, url)
+
+    def _check(self, url: str) -> dict:
+        try:
+            response = self.session.head(
+                url, headers=DEFAULT_HEADERS, timeout=self.timeout, allow_redirects=True
+            )
+            if response.status_code in (403, 405, 501):
+                response = self.session.get(
+                    url, headers=DEFAULT_HEADERS, timeout=self.timeout, allow_redirects=True, stream=True
+                )
+                response.close()
+        except requests.exceptions.RequestException as e:
+            return {"status": None, "error": str(e)}
+        return {"status": response.status_code, "final_url": response.url, "redirected": bool(response.history)}
+
+    def report(self, urls) -> dict:
+        """Summarize the checks for urls, waiting for any still running."""
+        report = {"checked": 0, "ok": 0, "dead": [], "redirected": []}
+        for url in urls:
+            check = self._futures[url].result()
+            report["checked"] += 1
+            if check["status"] is None or check["status"] >= 400:
+                report["dead"].append({"url": url, **{k: check[k] for k in ("status", "error") if k in check}})
+                continue
+            report["ok"] += 1
+            if check["redirected"]:
+                report["redirected"].append({"url": url, "final_url": check["final_url"], "status": check["status"]})
+        return report
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 
-def validate_llmstxt(url: str) -> dict:
-    """Check if llms.txt exists and validate its format."""
+def scan_llmstxt(file_url: str, checker: Optional[LinkChecker] = None, keep_chars: int = 0, timeout: int = 15):
+    """Stream an llms.txt-style file through LlmsTxtScanner.
+
+    Returns (status_code, scanner, links); scanner is None unless the file
+    answered 200. Up to MAX_CHECKED_LINKS distinct links are handed to
+    checker while the file is still downloading.
+    """
+    links = {}
+
+    def on_link(href):
+        if href not in links and len(links) < MAX_CHECKED_LINKS:
+            links[href] = None
+            checker.submit(href)
+
+    response = requests.get(file_url, headers=DEFAULT_HEADERS, timeout=timeout, stream=True)
+    if response.status_code != 200:
+        response.close()
+        return response.status_code, None, []
+    scanner = LlmsTxtScanner(file_url, on_link if checker is not None else None, keep_chars)
+    for line in iter_response_lines(response):
+        scanner.feed(line)
+    return response.status_code, scanner, list(links)
+
+
+def validate_llmstxt(url: str, check_links: bool = True, workers: int = LINK_CHECK_WORKERS) -> dict:
+    """Check if llms.txt exists and validate its format.
+
+    Both llms.txt and llms-full.txt are streamed and validated line by line.
+    With check_links, their links are checked on up to workers threads and
+    dead or redirected targets are reported under link_check.
+    """
     parsed = urlparse(url)
     base_url = f"{parsed.scheme}://{parsed.netloc}"
     llms_url = f"{base_url}/llms.txt"
@@ -53,84 +249,205 @@ def validate_llmstxt(url: str) -> dict:
         },
     }
 
-    # Check llms.txt
-    try:
-        response = requests.get(llms_url, headers=DEFAULT_HEADERS, timeout=15)
-        if response.status_code == 200:
-            result["exists"] = True
-            result["content"] = response.text
-            content = response.text
-
-            # Validate format
-            lines = content.strip().split("\n")
-
-            # Check for title (# at start)
-            if lines and lines[0].startswith("# "):
-                result["has_title"] = True
+    with (LinkChecker(workers) if check_links else nullcontext()) as checker:
+        # Check llms.txt
+        links = []
+        try:
+            status, scanner, links = scan_llmstxt(llms_url, checker, keep_chars=CONTENT_MAX_CHARS)
+            if scanner is not None:
+                result["exists"] = True
+                result["content"] = scanner.text()
+                if scanner.truncated:
+                    result["content_truncated"] = True
+
+                # Check for title (# at start)
+                result["has_title"] = scanner.has_title
+                if not result["has_title"]:
+                    result["issues"].append("Missing title (should start with '# Site Name')")
+
+                # Check for description (> blockquote)
+                result["has_description"] = scanner.has_description
+                if not result["has_description"]:
+                    result["issues"].append("Missing description (use '> Brief description')")
+
+                # Check for sections (## headings)
+                result["section_count"] = scanner.section_count
+                result["has_sections"] = scanner.section_count > 0
+                if not result["has_sections"]:
+                    result["issues"].append("No sections found (use '## Section Name')")
+
+                # Check for links
+                result["link_count"] = scanner.link_count
+                result["has_links"] = scanner.link_count > 0
+                if not result["has_links"]:
+                    result["issues"].append("No page links found (use '- [Page Title](url): Description')")
+
+                # Overall format validity
+                result["format_valid"] = (
+                    result["has_title"]
+                    and result["has_description"]
+                    and result["has_sections"]
+                    and result["has_links"]
+                )
+
+                # Suggestions
+                if result["link_count"] < 5:
+                    result["suggestions"].append("Consider adding more key pages (aim for 10-20)")
+                if result["section_count"] < 2:
+                    result["suggestions"].append("Add more sections to organize content types")
+                if not scanner.mentions_contact:
+                    result["suggestions"].append("Add a Contact section with email and location")
+                if not scanner.mentions_facts:
+                    result["suggestions"].append("Add key facts about your business/service")
+
             else:
-                result["issues"].append("Missing title (should start with '# Site Name')")
-
-            # Check for description (> blockquote)
-            for line in lines:
-                if line.startswith("> "):
-                    result["has_description"] = True
-                    break
-            if not result["has_description"]:
-                result["issues"].append("Missing description (use '> Brief description')")
-
-            # Check for sections (## headings)
-            sections = [l for l in lines if l.startswith("## ")]
-            result["section_count"] = len(sections)
-            result["has_sections"] = len(sections) > 0
-            if not result["has_sections"]:
-                result["issues"].append("No sections found (use '## Section Name')")
-
-            # Check for links
-            link_pattern = r"- \[.+\]\(.+\)"
-            links = re.findall(link_pattern, content)
-            result["link_count"] = len(links)
-            result["has_links"] = len(links) > 0
-            if not result["has_links"]:
-                result["issues"].append("No page links found (use '- [Page Title](url): Description')")
-
-            # Overall format validity
-            result["format_valid"] = (
-                result["has_title"]
-                and result["has_description"]
-                and result["has_sections"]
-                and result["has_links"]
-            )
+                result["issues"].append(f"llms.txt returned status {status}")
+        except Exception as e:
+            result["issues"].append(f"Error fetching llms.txt: {str(e)}")
 
-            # Suggestions
-            if result["link_count"] < 5:
-                result["suggestions"].append("Consider adding more key pages (aim for 10-20)")
-            if result["section_count"] < 2:
-                result["suggestions"].append("Add more sections to organize content types")
-            if "contact" not in content.lower():
-                result["suggestions"].append("Add a Contact section with email and location")
-            if "key fact" not in content.lower() and "about" not in content.lower():
-                result["suggestions"].append("Add key facts about your business/service")
+        # Check llms-full.txt
+        full_links = []
+        try:
+            status, scanner, full_links = scan_llmstxt(llms_full_url, checker)
+            if scanner is not None:
+                result["full_version"].update(
+                    {
+                        "exists": True,
+                        "lines": scanner.lines,
+                        "characters": scanner.characters,
+                        "has_title": scanner.has_title,
+                        "section_count": scanner.section_count,
+                        "link_count": scanner.link_count,
+                    }
+                )
+        except Exception:
+            pass
+
+        if checker is not None:
+            if result["exists"]:
+                result["link_check"] = checker.report(links)
+                _link_issues(result, "llms.txt")
+            if result["full_version"]["exists"]:
+                result["full_version"]["link_check"] = checker.report(full_links)
+                _link_issues(result["full_version"], "llms-full.txt", result["issues"])
+
+    return result
 
-        else:
-            result["issues"].append(f"llms.txt returned status {response.status_code}")
-    except Exception as e:
-        result["issues"].append(f"Error fetching llms.txt: {str(e)}")
 
-    # Check llms-full.txt
+def _link_issues(section: dict, name: str, issues: Optional[list] = None) -> None:
+    report = section["link_check"]
+    issues = section["issues"] if issues is None else issues
+    if report["dead"]:
+        issues.append(f"{len(report['dead'])} dead link(s) in {name}")
+    if report["redirected"]:
+        issues.append(f"{len(report['redirected'])} redirected link(s) in {name}; link to the final URL")
+
+
+def fetch_page_description(url: str, timeout: int = 10) -> str:
+    """Return a page's meta description, or "" if it has none or can't be fetched.
+
+    Only the page's <head> is downloaded.
+    """
     try:
-        response = requests.get(llms_full_url, headers=DEFAULT_HEADERS, timeout=15)
-        if response.status_code == 200:
-            result["full_version"]["exists"] = True
+        head = fetch_head(url, timeout=timeout)
     except Exception:
-        pass
+        return ""
+    meta = head.find("meta", attrs={"name": "description"})
+    return meta.get("content", "") if meta else ""
 
-    return result
 
+def _site_identity(soup, netloc: str) -> tuple:
+    """Site name and description from a homepage's <title> and meta description."""
+    title = soup.find("title")
+    site_name = title.get_text(strip=True).split("|")[0].split("-")[0].strip() if title else netloc
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    site_description = meta_desc.get("content", "") if meta_desc else f"Official website of {site_name}"
+    return site_name, site_description
+
+
+def _llmstxt_lines(
+    site_name: str, site_description: str, base_url: str, pages: dict, limit=None, descriptions=None
+) -> list:
+    """Render llms.txt lines: up to limit links per section, with descriptions if given."""
+    netloc = urlparse(base_url).netloc
+    lines = [
+        f"# {site_name}",
+        f"> {site_description}",
+        "",
+    ]
+
+    for section, section_pages in pages.items():
+        if section_pages:
+            lines.append(f"## {section}")
+            for page in section_pages[:limit]:
+                page_desc = descriptions.get(page["url"]) if descriptions else None
+                if page_desc:
+                    lines.append(f"- [{page['title']}]({page['url']}): {page_desc}")
+                else:
+                    lines.append(f"- [{page['title']}]({page['url']})")
+            lines.append("")
+
+    # Add contact section placeholder
+    lines.extend([
+        "## Contact",
+        f"- Website: {base_url}",
+        f"- Email: contact@{netloc}",
+        "",
+    ])
+    return lines
+
+
+def _stream_full(
+    result: dict,
+    full_output: str,
+    site_name: str,
+    site_description: str,
+    base_url: str,
+    pages: dict,
+    workers: int,
+    full_options: dict,
+) -> None:
+    """Write llms-full.txt to full_output and record where and how much in result."""
+    del result["generated_llmstxt_full"]
+    stats = write_llms_full(
+        full_output, site_name, site_description, base_url, pages, workers=workers, **full_options
+    )
+    result["llmstxt_full"] = {"path": full_output, **stats}
+
+
+def _fetch_descriptions(page_urls: list, workers: int) -> dict:
+    """Meta descriptions for page_urls, fetched on up to workers threads."""
+    if not page_urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(page_urls)))) as pool:
+        return dict(zip(page_urls, pool.map(fetch_page_description, page_urls)))
 
-def generate_llmstxt(url: str, max_pages: int = 30) -> dict:
-    """Generate an llms.txt file by crawling the site."""
+
+def generate_llmstxt(
+    url: str,
+    max_pages: int = 30,
+    homepage=None,
+    workers: int = DESCRIPTION_FETCH_WORKERS,
+    rules: Optional[dict] = None,
+    full_output: Optional[str] = None,
+    **full_options,
+) -> dict:
+    """Generate an llms.txt file by crawling the site.
+
+    homepage may be the already fetched homepage (raw HTML bytes, a parsed
+    tree or a fetch_page(..., keep_tree=True) result) to avoid downloading
+    it again. Page descriptions for llms-full.txt are fetched on up to
+    workers threads; the output order doesn't depend on which page
+    answers first. rules are path_classifier rules for sorting pages into
+    sections.
+
+    With full_output (a path), llms-full.txt is streamed there with each
+    page's key passages instead of being returned as a string; full_options
+    go to llms_full_writer.write_llms_full().
+    """
     parsed = urlparse(url)
     base_url = f"{parsed.scheme}://{parsed.netloc}"
+    classifier = PathClassifier(rules)
 
     result = {
         "generated_llmstxt": "",
@@ -141,26 +458,16 @@ def generate_llmstxt(url: str, max_pages: int = 30) -> dict:
 
     # Fetch homepage
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = load_soup(homepage if homepage is not None else url)
     except Exception as e:
         result["error"] = f"Failed to fetch homepage: {str(e)}"
         return result
 
     # Extract site name and description
-    title = soup.find("title")
-    site_name = title.get_text(strip=True).split("|")[0].split("-")[0].strip() if title else parsed.netloc
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    site_description = meta_desc.get("content", "") if meta_desc else f"Official website of {site_name}"
+    site_name, site_description = _site_identity(soup, parsed.netloc)
 
     # Discover and categorize pages
-    pages = {
-        "Main Pages": [],
-        "Products & Services": [],
-        "Resources & Blog": [],
-        "Company": [],
-        "Support": [],
-    }
+    pages = {name: [] for name in classifier.section_names}
 
     # Crawl internal links
     seen_urls = set()
@@ -176,114 +483,561 @@ def generate_llmstxt(url: str, max_pages: int = 30) -> dict:
             continue
         if href in seen_urls:
             continue
-        if any(ext in href for ext in [".pdf", ".jpg", ".png", ".gif", ".css", ".js"]):
+        if classifier.excluded(href):
             continue
         if "#" in href and href.split("#")[0] in seen_urls:
             continue
 
         seen_urls.add(href)
-        path = parsed_href.path.lower()
-
-        # Categorize
-        page_entry = {"url": href, "title": link_text}
-
-        if any(kw in path for kw in ["/pricing", "/features", "/product", "/solutions", "/demo"]):
-            pages["Products & Services"].append(page_entry)
-        elif any(kw in path for kw in ["/blog", "/article", "/resource", "/guide", "/learn", "/docs", "/documentation"]):
-            pages["Resources & Blog"].append(page_entry)
-        elif any(kw in path for kw in ["/about", "/team", "/career", "/contact", "/press", "/partner"]):
-            pages["Company"].append(page_entry)
-        elif any(kw in path for kw in ["/help", "/support", "/faq", "/status"]):
-            pages["Support"].append(page_entry)
-        elif path in ["/", ""] or any(kw in path for kw in ["/home", "/index"]):
-            if href != base_url and href != base_url + "/":
-                pages["Main Pages"].append(page_entry)
-        else:
-            pages["Main Pages"].append(page_entry)
+
+        # Categorize; the homepage itself isn't listed
+        if href != base_url and href != base_url + "/":
+            section = classifier.classify(parsed_href.path)
+            pages[section].append({"url": href, "title": link_text})
 
         if len(seen_urls) >= max_pages:
             break
 
     result["pages_analyzed"] = len(seen_urls)
 
-    # Generate llms.txt (concise version)
-    llms_lines = [
-        f"# {site_name}",
-        f"> {site_description}",
-        "",
-    ]
+    # Generate llms.txt (concise version, top 10 per section)
+    result["generated_llmstxt"] = "\n".join(_llmstxt_lines(site_name, site_description, base_url, pages, limit=10))
 
-    for section, section_pages in pages.items():
-        if section_pages:
-            llms_lines.append(f"## {section}")
-            # Limit to top 10 per section for concise version
-            for page in section_pages[:10]:
-                llms_lines.append(f"- [{page['title']}]({page['url']})")
-            llms_lines.append("")
+    # Generate llms-full.txt (detailed version with descriptions)
+    if full_output:
+        _stream_full(result, full_output, site_name, site_description, base_url, pages, workers, full_options)
+    else:
+        page_urls = [page["url"] for section_pages in pages.values() for page in section_pages]
+        descriptions = _fetch_descriptions(page_urls, workers)
+        result["generated_llmstxt_full"] = "\n".join(
+            _llmstxt_lines(site_name, site_description, base_url, pages, descriptions=descriptions)
+        )
+    result["sections"] = {k: len(v) for k, v in pages.items()}
 
-    # Add contact section placeholder
-    llms_lines.extend([
-        "## Contact",
-        f"- Website: {base_url}",
-        f"- Email: contact@{parsed.netloc}",
-        "",
-    ])
+    return result
 
-    result["generated_llmstxt"] = "\n".join(llms_lines)
 
-    # Generate llms-full.txt (detailed version with descriptions)
-    full_lines = [
-        f"# {site_name}",
-        f"> {site_description}",
-        "",
-    ]
+def page_key(url: str) -> str:
+    """URL normalized for matching sitemap entries against links."""
+    return _split_key(urlsplit(url))
 
-    for section, section_pages in pages.items():
-        if section_pages:
-            full_lines.append(f"## {section}")
-            for page in section_pages:
-                # Try to fetch page description
-                try:
-                    page_resp = requests.get(page["url"], headers=DEFAULT_HEADERS, timeout=10)
-                    page_soup = BeautifulSoup(page_resp.text, "lxml")
-                    page_meta = page_soup.find("meta", attrs={"name": "description"})
-                    page_desc = page_meta.get("content", "") if page_meta else ""
-                    if page_desc:
-                        full_lines.append(f"- [{page['title']}]({page['url']}): {page_desc}")
-                    else:
-                        full_lines.append(f"- [{page['title']}]({page['url']})")
-                except Exception:
-                    full_lines.append(f"- [{page['title']}]({page['url']})")
-            full_lines.append("")
-
-    full_lines.extend([
-        "## Contact",
-        f"- Website: {base_url}",
-        f"- Email: contact@{parsed.netloc}",
-        "",
-    ])
 
-    result["generated_llmstxt_full"] = "\n".join(full_lines)
-    result["sections"] = {k: len(v) for k, v in pages.items()}
+def _split_key(parts) -> str:
+    path = parts.path.rstrip("/") or "/"
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{parts.netloc.lower()}{path}{query}"
+
+
+def title_from_slug(url: str) -> str:
+    """Readable title from the last path segment: /blog/geo-vs-seo.html -> "Geo Vs Seo"."""
+    parts = urlsplit(url)
+    return _slug_title(parts.path) or parts.netloc
+
+
+def _slug_title(path: str) -> str:
+    slug = unquote(path.rstrip("/").rpartition("/")[2])
+    slug = _SLUG_EXTENSION_RE.sub("", slug)
+    return " ".join(word[:1].upper() + word[1:] for word in _SLUG_SPLIT_RE.split(slug) if word) or slug
+
+
+def _internal_links(soup, page_url: str, netloc: str) -> dict:
+    """page_key -> anchor text for each distinct same-site link on a page."""
+    links = {}
+    for link in soup.find_all("a", href=True):
+        href = urljoin(page_url, link["href"])
+        if urlparse(href).netloc != netloc:
+            continue
+        key = page_key(href.split("#")[0])
+        text = link.get_text(strip=True)
+        if key not in links or (not links[key] and text):
+            links[key] = text
+    return links
+
+
+def _discover_sitemap(base_url: str, sitemap_url: Optional[str], timeout: int = 15):
+    """Return (sitemap URL, entry iterator) for the given or first working sitemap."""
+    candidates = [sitemap_url] if sitemap_url else [f"{base_url}/sitemap.xml", f"{base_url}/sitemap_index.xml"]
+    for candidate in candidates:
+        entries = iter_sitemap(candidate, timeout)
+        try:
+            first = next(entries)
+        except StopIteration:
+            continue
+        except Exception:
+            if sitemap_url:
+                raise
+            continue
+        return candidate, chain([first], entries)
+    return None, iter(())
+
+
+def _open_site(url: str, homepage, sitemap_url: Optional[str], result: dict):
+    """Load the homepage and open the sitemap for sitemap-driven generation.
+
+    Returns (soup, site name, site description, sitemap entries), or None
+    after recording the error in result.
+    """
+    parsed = urlparse(url)
+    try:
+        soup = load_soup(homepage if homepage is not None else url)
+    except Exception as e:
+        result["error"] = f"Failed to fetch homepage: {str(e)}"
+        return None
+    site_name, site_description = _site_identity(soup, parsed.netloc)
+
+    try:
+        result["sitemap_url"], entries = _discover_sitemap(f"{parsed.scheme}://{parsed.netloc}", sitemap_url)
+    except Exception as e:
+        result["error"] = f"Failed to read sitemap: {str(e)}"
+        return None
+    if result["sitemap_url"] is None:
+        result["error"] = "No sitemap found; use generate_llmstxt() to build from homepage links"
+        return None
+    return soup, site_name, site_description, entries
+
 
+def _sitemap_page_table(entries, classifier: PathClassifier, home_key: str, max_pages: int) -> dict:
+    """Stream sitemap entries into {page_key: page}, skipping the homepage and excluded URLs."""
+    pages = {}
+    for entry in entries:
+        loc = entry["loc"]
+        parts = urlsplit(loc)
+        key = _split_key(parts)
+        if key in pages or key == home_key or classifier.excluded(loc):
+            continue
+        pages[key] = {
+            "url": loc,
+            "path": parts.path,
+            "lastmod": entry["lastmod"] or "",
+            "depth": parts.path.rstrip("/").count("/"),
+            "section": classifier.classify(parts.path),
+        }
+        if len(pages) >= max_pages:
+            break
+    return pages
+
+
+def _link_authority(soup, base_url: str, pages: dict, crawl_pages: int, workers: int) -> tuple:
+    """Inbound link counts and anchor texts from the homepage and up to crawl_pages pages it links to.
+
+    Returns (inlinks Counter, anchors dict, pages crawled), keyed by page_key.
+    """
+    netloc = urlparse(base_url).netloc
+    home_links = _internal_links(soup, base_url, netloc)
+    hubs = [pages[key]["url"] for key in home_links if key in pages][:crawl_pages]
+
+    def crawl(page_url):
+        try:
+            return _internal_links(fetch_soup(page_url, timeout=15), page_url, netloc)
+        except Exception:
+            return None
+
+    inlinks = Counter()
+    anchors = {}
+    crawled = [home_links]
+    if hubs:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(hubs)))) as pool:
+            crawled.extend(links for links in pool.map(crawl, hubs) if links is not None)
+    for links in crawled:
+        for key, text in links.items():
+            inlinks[key] += 1
+            if text and len(text) >= 2:
+                anchors.setdefault(key, text)
+    return inlinks, anchors, len(crawled)
+
+
+def _rank_sections(pages: dict, inlinks, anchors: dict, classifier: PathClassifier, netloc: str) -> tuple:
+    """Rank pages (most linked, then shallowest, then newest) and group them by section.
+
+    Returns (ranked [(key, page)], {section: [{"url", "title"}]}).
+    """
+    ranked = sorted(pages.items(), key=lambda item: item[1]["lastmod"], reverse=True)
+    ranked.sort(key=lambda item: (-inlinks.get(item[0], 0), item[1]["depth"]))
+
+    sections = {name: [] for name in classifier.section_names}
+    for key, page in ranked:
+        title = anchors.get(key) or _slug_title(page["path"]) or netloc
+        sections[page["section"]].append({"url": page["url"], "title": title})
+    return ranked, sections
+
+
+def generate_llmstxt_from_sitemap(
+    url: str,
+    sitemap_url: Optional[str] = None,
+    homepage=None,
+    rules: Optional[dict] = None,
+    max_pages: int = SITEMAP_MAX_PAGES,
+    crawl_pages: int = CRAWL_PAGES,
+    section_links: int = SECTION_LINKS,
+    describe_pages: int = DESCRIBED_PAGES,
+    workers: int = DESCRIPTION_FETCH_WORKERS,
+    full_output: Optional[str] = None,
+    **full_options,
+) -> dict:
+    """Generate llms.txt for a large site from its sitemap.
+
+    Every sitemap page is sorted into a section by the path classifier.
+    Within a section, pages are ranked by internal link authority (how many
+    of the homepage and up to crawl_pages pages it links to link to them),
+    then by path depth and newest lastmod. llms.txt keeps the top
+    section_links pages per section; llms-full.txt lists every page, with
+    meta descriptions for the describe_pages highest ranked. Titles come
+    from anchor text where a crawled page links to the page, otherwise
+    from the URL slug.
+
+    With full_output, llms-full.txt is streamed to that path as in
+    generate_llmstxt(), up to its size budget, instead of describing
+    describe_pages pages.
+    """
+    parsed = urlparse(url)
+    base_url = f"{parsed.scheme}://{parsed.netloc}"
+    classifier = PathClassifier(rules)
+
+    result = {
+        "generated_llmstxt": "",
+        "generated_llmstxt_full": "",
+        "pages_analyzed": 0,
+        "sections": {},
+        "sitemap_url": None,
+        "pages_crawled": 0,
+    }
+
+    site = _open_site(url, homepage, sitemap_url, result)
+    if site is None:
+        return result
+    soup, site_name, site_description, entries = site
+
+    pages = _sitemap_page_table(entries, classifier, page_key(base_url), max_pages)
+    inlinks, anchors, result["pages_crawled"] = _link_authority(soup, base_url, pages, crawl_pages, workers)
+    ranked, sections = _rank_sections(pages, inlinks, anchors, classifier, parsed.netloc)
+
+    result["pages_analyzed"] = len(pages)
+    result["generated_llmstxt"] = "\n".join(
+        _llmstxt_lines(site_name, site_description, base_url, sections, limit=section_links)
+    )
+
+    result["sections"] = {k: len(v) for k, v in sections.items()}
+    if full_output:
+        _stream_full(result, full_output, site_name, site_description, base_url, sections, workers, full_options)
+        return result
+
+    # Describe the pages llms.txt lists first, then the next best ranked
+    listed = [page["url"] for section_pages in sections.values() for page in section_pages[:section_links]]
+    listed_set = set(listed)
+    to_describe = (listed + [page["url"] for _, page in ranked if page["url"] not in listed_set])[:describe_pages]
+    descriptions = _fetch_descriptions(to_describe, workers)
+    result["generated_llmstxt_full"] = "\n".join(
+        _llmstxt_lines(site_name, site_description, base_url, sections, descriptions=descriptions)
+    )
+
+    return result
+
+
+def _revalidate(url: str, previous: Optional[dict], timeout: int = 10) -> dict:
+    """Conditionally re-request a page's head.
+
+    Sends the ETag and Last-Modified from previous, so an unchanged page
+    answers 304 without a body. Otherwise returns the new validators and
+    meta description.
+    """
+    headers = dict(DEFAULT_HEADERS)
+    if previous and previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous and previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout, stream=True)
+        if response.status_code == 304 or not response.ok:
+            response.close()
+            return {"status": response.status_code}
+        head = parse_html(read_head(response), response.headers.get("Content-Type"))
+    except Exception as e:
+        return {"status": None, "error": str(e)}
+    meta = head.find("meta", attrs={"name": "description"})
+    return {
+        "status": response.status_code,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "description": meta.get("content", "") if meta else "",
+    }
+
+
+def load_state(path: str) -> dict:
+    """Read a regeneration state file; a missing file is an empty state."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {"version": STATE_VERSION, "pages": {}}
+    if state.get("version") != STATE_VERSION:
+        raise ValueError(f"{path}: unsupported state version {state.get('version')!r}")
+    return state
+
+
+def save_state(path: str, state: dict) -> None:
+    """Write the state file atomically, so an interrupted run keeps the old one."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _unified_diff(old: str, new: str, name: str) -> str:
+    return "\n".join(
+        difflib.unified_diff(old.splitlines(), new.splitlines(), f"{name} (previous)", name, lineterm="")
+    )
+
+
+def regenerate_llmstxt(
+    url: str,
+    state_path: str,
+    sitemap_url: Optional[str] = None,
+    homepage=None,
+    rules: Optional[dict] = None,
+    max_pages: int = SITEMAP_MAX_PAGES,
+    crawl_pages: int = 0,
+    section_links: int = SECTION_LINKS,
+    workers: int = DESCRIPTION_FETCH_WORKERS,
+    max_fetches: Optional[int] = None,
+) -> dict:
+    """Bring a sitemap-driven llms.txt up to date from the previous run's state.
+
+    state_path holds each page's sitemap lastmod, ETag, Last-Modified,
+    description and link data from the last run; it is created on the
+    first run and rewritten after each one. Only pages that are new, whose
+    lastmod changed, or that have no lastmod are requested, conditionally,
+    so unchanged pages cost a 304 at most. Pages gone from the sitemap are
+    dropped.
+
+    Link authority is carried over from the state unless crawl_pages asks
+    for a fresh crawl (the first run uses CRAWL_PAGES). max_fetches caps
+    the page requests per run; pages left over are fetched next time. The
+    result carries both files, the page changes and unified diffs against
+    the previous files.
+    """
+    parsed = urlparse(url)
+    base_url = f"{parsed.scheme}://{parsed.netloc}"
+    classifier = PathClassifier(rules)
+    state = load_state(state_path)
+    previous = state["pages"]
+
+    result = {
+        "generated_llmstxt": "",
+        "generated_llmstxt_full": "",
+        "pages_analyzed": 0,
+        "sections": {},
+        "sitemap_url": None,
+        "pages_crawled": 0,
+        "changes": {},
+        "diff": "",
+        "full_diff": "",
+    }
+
+    site = _open_site(url, homepage, sitemap_url or state.get("sitemap_url"), result)
+    if site is None:
+        return result
+    soup, site_name, site_description, entries = site
+
+    pages = _sitemap_page_table(entries, classifier, page_key(base_url), max_pages)
+    if not previous and not crawl_pages:
+        crawl_pages = CRAWL_PAGES
+    inlinks, anchors, result["pages_crawled"] = _link_authority(soup, base_url, pages, crawl_pages, workers)
+    if not crawl_pages:
+        # Keep the authority measured by the last crawl; the homepage alone
+        # only adds pages it newly links to
+        for key, entry in previous.items():
+            inlinks[key] = max(inlinks.get(key, 0), entry.get("inlinks", 0))
+    for key, entry in previous.items():
+        if entry.get("anchor"):
+            anchors.setdefault(key, entry["anchor"])
+
+    # Request only new pages and pages whose lastmod moved or is unknown
+    to_fetch = []
+    unchanged = 0
+    for key, page in pages.items():
+        old = previous.get(key)
+        if old is not None and "description" in old and page["lastmod"] and page["lastmod"] == old.get("lastmod"):
+            unchanged += 1
+        else:
+            to_fetch.append(key)
+    deferred = set(to_fetch[max_fetches:]) if max_fetches is not None else set()
+    to_fetch = to_fetch[:max_fetches] if max_fetches is not None else to_fetch
+
+    fetched = {}
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(to_fetch)))) as pool:
+            checks = pool.map(lambda key: _revalidate(pages[key]["url"], previous.get(key)), to_fetch)
+            fetched = dict(zip(to_fetch, checks))
+
+    added, updated, failed = [], [], []
+    not_modified = 0
+    new_pages = {}
+    for key, page in pages.items():
+        old = previous.get(key)
+        entry = dict(old) if old else {}
+        entry.update({"url": page["url"], "lastmod": page["lastmod"], "inlinks": inlinks.get(key, 0)})
+        if key in deferred:
+            # Keep the old lastmod so the next run still sees the change
+            entry["lastmod"] = old.get("lastmod", "") if old else ""
+        if anchors.get(key):
+            entry["anchor"] = anchors[key]
+        check = fetched.get(key)
+        if check is not None:
+            if check["status"] == 304:
+                not_modified += 1
+            elif "description" in check:
+                if old is not None and old.get("description") != check["description"]:
+                    updated.append(page["url"])
+                entry.update({k: check[k] for k in ("etag", "last_modified", "description")})
+            else:
+                # Keep the old lastmod so the next run retries the page
+                entry["lastmod"] = old.get("lastmod", "") if old else ""
+                failed.append({"url": page["url"], **{k: check[k] for k in ("status", "error") if k in check}})
+        if old is None:
+            added.append(page["url"])
+        new_pages[key] = entry
+    removed = [entry["url"] for key, entry in previous.items() if key not in pages]
+
+    _, sections = _rank_sections(pages, inlinks, anchors, classifier, parsed.netloc)
+    descriptions = {entry["url"]: entry.get("description") for entry in new_pages.values()}
+    llmstxt = "\n".join(_llmstxt_lines(site_name, site_description, base_url, sections, limit=section_links))
+    llmstxt_full = "\n".join(
+        _llmstxt_lines(site_name, site_description, base_url, sections, descriptions=descriptions)
+    )
+
+    result["generated_llmstxt"] = llmstxt
+    result["generated_llmstxt_full"] = llmstxt_full
+    result["pages_analyzed"] = len(pages)
+    result["sections"] = {k: len(v) for k, v in sections.items()}
+    result["changes"] = {
+        "added": added,
+        "removed": removed,
+        "updated": updated,
+        "failed": failed,
+        "requests": len(to_fetch),
+        "not_modified": not_modified,
+        "unchanged": unchanged,
+        "deferred": len(deferred),
+    }
+    result["diff"] = _unified_diff(state.get("llmstxt", ""), llmstxt, "llms.txt")
+    result["full_diff"] = _unified_diff(state.get("llmstxt_full", ""), llmstxt_full, "llms-full.txt")
+
+    save_state(
+        state_path,
+        {
+            "version": STATE_VERSION,
+            "site": base_url,
+            "sitemap_url": result["sitemap_url"],
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "llmstxt": llmstxt,
+            "llmstxt_full": llmstxt_full,
+            "pages": new_pages,
+        },
+    )
     return result
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python llmstxt_generator.py <url> [mode]")
-        print("Modes: validate (default), generate")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Validate or generate llms.txt files. Returns JSON.")
+    parser.add_argument("url", help="site URL")
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        default="validate",
+        choices=("validate", "generate", "regenerate"),
+        help="default: validate; regenerate updates a sitemap-driven llms.txt from --state",
+    )
+    parser.add_argument(
+        "--sitemap",
+        nargs="?",
+        const="",
+        metavar="URL",
+        help="generate from a sitemap (default location if no URL is given) instead of homepage links",
+    )
+    parser.add_argument("--rules", metavar="PATH", help="JSON section rules for sorting pages (see path_classifier.py)")
+    parser.add_argument(
+        "--max-pages", type=int, help="page limit (default: 30 from homepage links, 100000 from a sitemap)"
+    )
+    parser.add_argument(
+        "--crawl-pages",
+        type=int,
+        help=f"pages crawled for link authority in sitemap mode (default: {CRAWL_PAGES}; "
+        "regenerate reuses the last crawl unless this is given)",
+    )
+    parser.add_argument(
+        "--full-output",
+        metavar="PATH",
+        help="stream llms-full.txt, with each page's most citable passages, to PATH",
+    )
+    parser.add_argument(
+        "--passages",
+        type=int,
+        default=PASSAGES_PER_PAGE,
+        help=f"key passages per page in --full-output (default: {PASSAGES_PER_PAGE})",
+    )
+    parser.add_argument(
+        "--page-chars",
+        type=int,
+        default=PAGE_BUDGET_CHARS,
+        help=f"passage characters per page in --full-output (default: {PAGE_BUDGET_CHARS})",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=FILE_BUDGET_BYTES,
+        help=f"size cap for --full-output (default: {FILE_BUDGET_BYTES})",
+    )
+    parser.add_argument("--cache", metavar="PATH", help="SQLite file that keeps passage scores between runs")
+    parser.add_argument("--no-link-check", action="store_true", help="validate without checking links")
+    parser.add_argument("--state", metavar="PATH", help="regenerate: state file from the previous run")
+    parser.add_argument("--max-fetches", type=int, help="regenerate: page requests per run (default: no limit)")
+    args = parser.parse_args()
 
-    target_url = sys.argv[1]
-    mode = sys.argv[2] if len(sys.argv) > 2 else "validate"
+    try:
+        rules = load_rules(args.rules) if args.rules else None
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
 
-    if mode == "validate":
-        data = validate_llmstxt(target_url)
-    elif mode == "generate":
-        data = generate_llmstxt(target_url)
+    if args.mode == "validate":
+        data = validate_llmstxt(args.url, check_links=not args.no_link_check)
+    elif args.mode == "regenerate":
+        if not args.state:
+            parser.error("regenerate needs --state PATH")
+        try:
+            data = regenerate_llmstxt(
+                args.url,
+                args.state,
+                sitemap_url=args.sitemap or None,
+                rules=rules,
+                max_pages=args.max_pages or SITEMAP_MAX_PAGES,
+                crawl_pages=args.crawl_pages or 0,
+                max_fetches=args.max_fetches,
+            )
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
     else:
-        print(f"Unknown mode: {mode}. Use 'validate' or 'generate'.")
-        sys.exit(1)
+        with PassageScoreCache(path=args.cache, namespace=SCORER_VERSION) as cache:
+            full_options = {}
+            if args.full_output:
+                full_options = {
+                    "full_output": args.full_output,
+                    "passages_per_page": args.passages,
+                    "page_chars": args.page_chars,
+                    "max_bytes": args.max_bytes,
+                    "cache": cache,
+                }
+            if args.sitemap is not None:
+                data = generate_llmstxt_from_sitemap(
+                    args.url,
+                    sitemap_url=args.sitemap or None,
+                    rules=rules,
+                    max_pages=args.max_pages or SITEMAP_MAX_PAGES,
+                    crawl_pages=CRAWL_PAGES if args.crawl_pages is None else args.crawl_pages,
+                    **full_options,
+                )
+            else:
+                data = generate_llmstxt(args.url, max_pages=args.max_pages or 30, rules=rules, **full_options)
 
     print(json.dumps(data, indent=2, default=str))
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Mention Counter — Counts brand mentions across a local text corpus.
+
+brand_scanner.py checks where a brand is present; this counts how often
+brands are actually mentioned in content already on disk (crawled client
+and competitor pages, saved forum dumps), for offline share-of-voice.
+
+Every brand and alias is matched as whole words, case-insensitively:
+"Acme" counts in "Acme's pricing" but not in "Acmeville". Each name is
+also matched in its brand_matcher-normalized form ("Acme Corp." as
+"acme"), and multi-word names may span any run of spaces and punctuation.
+Where names overlap, the longest wins ("Apple Music" over "Apple").
+
+Files are read as bytes in large blocks and scanned in one pass. A block
+is case-folded and its ASCII punctuation blanked with a single
+translate(); the names' first words are then located with a direct
+search per word (few names) or through one split of the block into a set
+lookup (many names), so per-byte work stays in C and only candidate
+mentions reach Python, where non-ASCII punctuation (curly quotes, dashes,
+no-break spaces) is recognized as a word gap. Large corpora can be spread
+over worker processes, one file at a time.
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from brand_matcher import load_records, normalize_name
+
+# Bytes read from a file at a time
+BLOCK_BYTES = 4 << 20
+# Up to this many distinct first words are searched for one by one;
+# beyond that one split of the block is cheaper
+DIRECT_SEARCH_WORDS = 16
+# Context snippets kept per brand, and bytes of context on each side
+SNIPPETS = 3
+CONTEXT_BYTES = 80
+
+_WORD_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789\n")
+# ASCII letters fold to lower case, newlines stay (they end documents in
+# line mode) and bytes of multi-byte UTF-8 characters count as letters;
+# everything else becomes a space
+_FOLD = bytes(c + 32 if 65 <= c <= 90 else c if c in _WORD_BYTES or c >= 0x80 else 32 for c in range(256))
+# Non-ASCII punctuation that also separates words
+_UNICODE_SEPARATORS = [
+    char.encode("utf-8") for char in "\u00a0\u00ab\u00bb\u2013\u2014\u2018\u2019\u201c\u201d\u2026\u3000"
+]
+_SEPARATOR = b"|".join(map(re.escape, _UNICODE_SEPARATORS))
+# One word gap, in file mode and in line mode
+_GAP = {False: b"(?:[ \n]|" + _SEPARATOR + b")", True: b"(?: |" + _SEPARATOR + b")"}
+_GAPS_RE = re.compile(_GAP[False] + b"+")
+_SEPARATORS_BEFORE = {
+    length: frozenset(sep for sep in _UNICODE_SEPARATORS if len(sep) == length) for length in (2, 3)
+}
+
+
+def fold(data: bytes) -> bytes:
+    """data with ASCII case folded and ASCII punctuation turned into spaces, same length."""
+    return data.translate(_FOLD)
+
+
+def _words(folded: bytes) -> list:
+    return [word for word in _GAPS_RE.split(folded) if word]
+
+
+def _gap_before(folded: bytes, position: int) -> bool:
+    if position == 0 or folded[position - 1] in (32, 10):
+        return True
+    return (
+        folded[position - 2 : position] in _SEPARATORS_BEFORE[2]
+        or folded[position - 3 : position] in _SEPARATORS_BEFORE[3]
+    )
+
+
+def _variants(name: str) -> set:
+    """Spellings of name to match; ASCII case is folded, other letters aren't."""
+    return {name, name.lower(), name.upper(), name.title(), normalize_name(name)}
+
+
+def iter_corpus_files(paths: Iterable, extensions: Optional[Iterable] = None) -> Iterator[str]:
+    """Files under paths (directories walked in sorted order), optionally by extension."""
+    extensions = tuple(ext.lower() for ext in extensions) if extensions else None
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                for name in sorted(files):
+                    if not name.startswith(".") and (extensions is None or name.lower().endswith(extensions)):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+class MentionCounter:
+    """Whole-word mention counts for a set of brands and their aliases.
+
+    brands maps each brand name to a list of aliases. scan_file() returns
+    one file's counts; count_mentions() runs a whole corpus.
+    """
+
+    def __init__(self, brands: dict, snippets: int = SNIPPETS, context: int = CONTEXT_BYTES):
+        self.brands = list(brands)
+        self.snippets = snippets
+        self.context = context
+        phrases = {}  # folded phrase -> brand indexes
+        for brand_index, (brand, aliases) in enumerate(brands.items()):
+            for name in [brand, *aliases]:
+                for variant in _variants(name):
+                    words = _words(fold(variant.encode("utf-8")))
+                    if words:
+                        phrases.setdefault(b" ".join(words), set()).add(brand_index)
+        self._phrases = {phrase: sorted(indexes) for phrase, indexes in phrases.items()}
+        by_first = {}
+        for phrase in self._phrases:
+            by_first.setdefault(phrase.split()[0], []).append(phrase)
+        # Per mode and first word, its phrases longest first, words
+        # separated by any gap (in line mode, not by a newline)
+        self._continuations = {
+            lines: {
+                first: re.compile(
+                    b"(?:"
+                    + b"|".join(
+                        (gap + b"+").join(map(re.escape, p.split())) for p in sorted(group, key=len, reverse=True)
+                    )
+                    + b")(?="
+                    + _GAP[False]
+                    + b"|$)"
+                )
+                for first, group in by_first.items()
+            }
+            for lines, gap in _GAP.items()
+        }
+        self._first_words = frozenset(by_first)
+        # Bytes a mention can span, allowing wide gaps ("Halvard – Finch")
+        self._reach = max((len(phrase) + 8 * phrase.count(b" ") for phrase in self._phrases), default=0) + 1
+
+    def _present_words(self, folded: bytes) -> set:
+        """First words that occur in folded, found through one split."""
+        tokens = set(folded.split())
+        present = tokens.intersection(self._first_words)
+        for token in tokens:
+            # "škodrava’s" holds a word the split alone doesn't separate
+            if not token.isascii():
+                present.update(word for word in _words(token) if word in self._first_words)
+        return present
+
+    def _matches(self, folded: bytes, limit: int, lines: bool) -> list:
+        """(start, end, brand indexes) of mentions starting before limit."""
+        if len(self._first_words) <= DIRECT_SEARCH_WORDS:
+            words = self._first_words
+        else:
+            words = self._present_words(folded[:limit])
+        find = folded.find
+        starts = []
+        for word in words:
+            position = find(word, 0, limit)
+            while position != -1:
+                if _gap_before(folded, position):
+                    starts.append((position, word))
+                position = find(word, position + 1, limit)
+        starts.sort()
+        continuations = self._continuations[lines]
+        matches = []
+        end = 0
+        for position, word in starts:
+            if position < end:
+                continue
+            match = continuations[word].match(folded, position)
+            if match is None:
+                continue
+            end = match.end()
+            matches.append((position, end, self._phrases[b" ".join(_words(match.group()))]))
+        return matches
+
+    def _snippet(self, data: bytes, start: int, end: int, lines: bool) -> str:
+        low, high = max(0, start - self.context), end + self.context
+        if lines:
+            # Context stays within the mention's own line
+            low = max(low, data.rfind(b"\n", 0, start) + 1)
+            line_end = data.find(b"\n", end)
+            high = min(high, line_end if line_end != -1 else len(data))
+        return " ".join(data[low:high].decode("utf-8", "ignore").split())
+
+    def scan_file(self, path: str, lines: bool = False) -> dict:
+        """Mention counts in one file.
+
+        The file is one document, or with lines=True every line is one
+        ("path:line"), as in a forum dump with a post per line. Returns
+        {"documents": {document: {brand: count}}, "mentions": {brand: count},
+        "snippets": {brand: [{"document", "text"}]}, "documents_scanned",
+        "bytes"}; documents without mentions are left out.
+        """
+        documents = {}
+        mentions = {}
+        snippets = {}
+        scanned = 0
+        line = 1
+        last = b""
+        carry = b""
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(BLOCK_BYTES)
+                data = carry + block
+                if not data:
+                    break
+                folded = fold(data)
+                if block:
+                    # Only mentions that fit in this block are taken; the
+                    # rest of it, from the last word gap, goes to the next
+                    cut = folded.rfind(b" ", 0, max(0, len(data) - self._reach)) + 1
+                    if cut == 0 and len(data) > BLOCK_BYTES:
+                        cut = len(data) - self._reach
+                else:
+                    cut = len(data)
+                counted = 0
+                for start, end, brand_indexes in self._matches(folded, cut, lines):
+                    if lines:
+                        line += data.count(b"\n", counted, start)
+                        counted = start
+                        document = f"{path}:{line}"
+                    else:
+                        document = path
+                    counts = documents.setdefault(document, {})
+                    for brand_index in brand_indexes:
+                        brand = self.brands[brand_index]
+                        counts[brand] = counts.get(brand, 0) + 1
+                        mentions[brand] = mentions.get(brand, 0) + 1
+                        kept = snippets.setdefault(brand, [])
+                        if len(kept) < self.snippets:
+                            kept.append({"document": document, "text": self._snippet(data, start, end, lines)})
+                if lines:
+                    line += data.count(b"\n", counted, cut)
+                scanned += cut
+                last = data[cut - 1 : cut] if cut else last
+                carry = data[cut:]
+                if not block:
+                    break
+        if lines:
+            # A last line without a newline is a document too
+            documents_scanned = line - 1 + (1 if last and last != b"\n" else 0)
+        else:
+            documents_scanned = 1
+        return {
+            "documents": documents,
+            "mentions": mentions,
+            "snippets": snippets,
+            "documents_scanned": documents_scanned,
+            "bytes": scanned,
+        }
+
+
+_worker_counter = None
+
+
+def _init_worker(brands: dict, snippets: int, context: int) -> None:
+    global _worker_counter
+    _worker_counter = MentionCounter(brands, snippets, context)
+
+
+def _scan_in_worker(path: str, lines: bool) -> dict:
+    return _worker_counter.scan_file(path, lines)
+
+
+def count_mentions(
+    paths: Iterable,
+    brands: dict,
+    lines: bool = False,
+    workers: Optional[int] = 1,
+    snippets: int = SNIPPETS,
+    context: int = CONTEXT_BYTES,
+    extensions: Optional[Iterable] = None,
+) -> dict:
+    """Brand mention report over a corpus of files and directories.
+
+    With workers > 1 (or None for one per CPU) files are scanned in a
+    process pool, at most two per worker in flight; results are merged in
+    corpus order either way. "share_of_voice" is each brand's share of all
+    mentions found.
+    """
+    started = time.monotonic()
+    files = iter_corpus_files(paths, extensions)
+    workers = workers or os.cpu_count() or 1
+    report = {
+        "documents_scanned": 0,
+        "documents_with_mentions": 0,
+        "bytes_scanned": 0,
+        "total_mentions": 0,
+        "brands": {brand: {"mentions": 0, "documents": 0, "share_of_voice": 0.0, "snippets": []} for brand in brands},
+        "documents": {},
+    }
+
+    def merge(result: dict) -> None:
+        report["documents_scanned"] += result["documents_scanned"]
+        report["bytes_scanned"] += result["bytes"]
+        report["documents"].update(result["documents"])
+        for counts in result["documents"].values():
+            for brand in counts:
+                report["brands"][brand]["documents"] += 1
+        for brand, count in result["mentions"].items():
+            report["brands"][brand]["mentions"] += count
+            report["total_mentions"] += count
+        for brand, kept in result["snippets"].items():
+            room = snippets - len(report["brands"][brand]["snippets"])
+            report["brands"][brand]["snippets"].extend(kept[:room])
+
+    if workers <= 1:
+        counter = MentionCounter(brands, snippets, context)
+        for path in files:
+            merge(counter.scan_file(path, lines))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(brands, snippets, context)) as pool:
+            pending = deque()
+            for path in files:
+                pending.append(pool.submit(_scan_in_worker, path, lines))
+                if len(pending) >= workers * 2:
+                    merge(pending.popleft().result())
+            while pending:
+                merge(pending.popleft().result())
+
+    total = report["total_mentions"]
+    for entry in report["brands"].values():
+        entry["share_of_voice"] = round(entry["mentions"] / total, 3) if total else 0.0
+    report["documents_with_mentions"] = len(report["documents"])
+    elapsed = time.monotonic() - started
+    report["elapsed_ms"] = round(elapsed * 1000)
+    report["mb_per_second"] = round(report["bytes_scanned"] / 1e6 / elapsed, 1) if elapsed else 0.0
+    return report
+
+
+def load_brand_aliases(path: str) -> dict:
+    """{brand: aliases} from an entity list (see brand_matcher.load_records)."""
+    brands = {}
+    for record in load_records(path):
+        label = record.get("label") or next(iter(record.get("aliases", [])), "")
+        if label:
+            brands.setdefault(label, []).extend(record.get("aliases", []))
+    return brands
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count brand mentions in local files for share of voice. Returns JSON.")
+    parser.add_argument("paths", nargs="+", metavar="path", help="files or directories to scan")
+    parser.add_argument("--brand", action="append", default=[], metavar="NAME", help="brand to count (repeatable)")
+    parser.add_argument(
+        "--brands-file",
+        metavar="PATH",
+        help="brands with aliases: JSON list or JSON lines of {label, aliases}, or one name per line",
+    )
+    parser.add_argument("--lines", action="store_true", help="count each line as a document (forum dumps, JSON lines)")
+    parser.add_argument("--ext", action="append", metavar=".EXT", help="only scan files with this extension (repeatable)")
+    parser.add_argument("--workers", type=int, default=1, help="scanning processes (0: one per CPU; default: 1)")
+    parser.add_argument("--snippets", type=int, default=SNIPPETS, help=f"context snippets per brand (default: {SNIPPETS})")
+    parser.add_argument("--no-documents", action="store_true", help="leave per-document counts out of the output")
+    args = parser.parse_args()
+
+    brands = load_brand_aliases(args.brands_file) if args.brands_file else {}
+    for name in args.brand:
+        brands.setdefault(name, [])
+    if not brands:
+        parser.error("no brands given (use --brand or --brands-file)")
+
+    output = count_mentions(args.paths, brands, args.lines, args.workers or None, args.snippets, extensions=args.ext)
+    if args.no_documents:
+        del output["documents"]
+    print(json.dumps(output, indent=2, ensure_ascii=False))
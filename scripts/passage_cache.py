@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Passage Score Cache — Memoizes citability scores for repeated passages.
+
+Cookie notices, CTAs, author bios and product boilerplate repeat across
+hundreds of pages. Scores are keyed by a hash of the (heading, passage)
+pair so each distinct passage is scored once per run, and once ever when
+a persistent SQLite store is attached.
+
+The in-process layer is an LRU; the optional store is a single SQLite file
+that can be shared between runs.
+"""
+
+import json
+import sqlite3
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+
+def passage_key(text: str, heading: Optional[str] = None, namespace: str = "") -> str:
+    """Hash a passage and its heading into a cache key.
+
+    Only CRLF line endings are normalized; every other difference in the
+    text can change the score. The namespace (the scorer version) keeps
+    results from older scoring rules out of persistent stores.
+    """
+    text = text.replace("\r\n", "\n")
+    material = f"{namespace}\x1f{heading!r}\x1f{text}"
+    return hashlib.blake2b(material.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class PassageScoreCache:
+    """LRU cache of passage scores with an optional persistent SQLite store."""
+
+    def __init__(self, maxsize: int = 50000, path: Optional[str] = None, namespace: str = "", commit_every: int = 500):
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self.commit_every = commit_every
+        self._lru = OrderedDict()
+        self._uncommitted = 0
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS passage_scores (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+
+    def key(self, text: str, heading: Optional[str] = None) -> str:
+        return passage_key(text, heading, self.namespace)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached score for key, or None on a miss."""
+        result = self._lru.get(key)
+        if result is not None:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return _copy_result(result)
+
+        if self._db is not None:
+            row = self._db.execute("SELECT result FROM passage_scores WHERE key = ?", (key,)).fetchone()
+            if row:
+                result = json.loads(row[0])
+                self._remember(key, result)
+                self.store_hits += 1
+                return _copy_result(result)
+
+        self.misses += 1
+        return None
+
+    def peek(self, key: str) -> Optional[dict]:
+        """Like get(), but not counted in stats(): for a lookup already counted."""
+        result = self._lru.get(key)
+        if result is None and self._db is not None:
+            row = self._db.execute("SELECT result FROM passage_scores WHERE key = ?", (key,)).fetchone()
+            result = json.loads(row[0]) if row else None
+        return _copy_result(result) if result is not None else None
+
+    def count_hit(self) -> None:
+        """Record a hit served outside get(), e.g. a duplicate already being scored."""
+        self.hits += 1
+
+    def put(self, key: str, result: dict) -> None:
+        """Cache a freshly computed score."""
+        self._remember(key, _copy_result(result))
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO passage_scores (key, result) VALUES (?, ?)",
+                (key, json.dumps(result)),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self._db.commit()
+                self._uncommitted = 0
+
+    def _remember(self, key: str, result: dict) -> None:
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Hit/miss counters for the report."""
+        lookups = self.hits + self.store_hits + self.misses
+        stats = {
+            "lookups": lookups,
+            "memory_hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.store_hits) / lookups, 3) if lookups else 0.0,
+            "entries_in_memory": len(self._lru),
+        }
+        if self._db is not None:
+            stats["entries_in_store"] = self._db.execute("SELECT COUNT(*) FROM passage_scores").fetchone()[0]
+        return stats
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy a score dict deeply enough that callers can't corrupt the cache."""
+    return dict(result, breakdown=dict(result["breakdown"]))
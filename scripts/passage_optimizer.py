@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Passage Optimizer — Regroups a page's paragraphs into citation-length passages.
+
+The citability scorer rewards passages of 134-167 words, but page sections
+are whatever length the author wrote. This finds the re-chunking of each
+section's paragraphs that keeps passages closest to that range, without
+splitting a paragraph or crossing a heading, and scores the page before
+and after.
+
+Segmentation is a dynamic program over paragraph boundaries. Candidate
+passages are capped at MAX_PASSAGE_WORDS and the window of candidates
+slides forward with the paragraphs, so the work is linear in the number of
+paragraphs for a fixed cap.
+"""
+
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from citability_scorer import (
+    MIN_BLOCK_WORDS,
+    SCORER_VERSION,
+    blocks_from_sections,
+    extract_sections,
+    score_passages,
+    summarize_page,
+)
+from fetch_page import fetch_soup, load_soup
+from passage_cache import PassageScoreCache
+
+TARGET_MIN_WORDS = 134
+TARGET_MAX_WORDS = 167
+# Longest passage worth considering; past 400 words the scorer gives no length credit
+MAX_PASSAGE_WORDS = 400
+
+
+def length_penalty(words: int, low: int = TARGET_MIN_WORDS, high: int = TARGET_MAX_WORDS) -> int:
+    """Squared distance from words to the [low, high] range."""
+    if words < low:
+        return (low - words) ** 2
+    if words > high:
+        return (words - high) ** 2
+    return 0
+
+
+def segment_paragraphs(
+    word_counts: list,
+    low: int = TARGET_MIN_WORDS,
+    high: int = TARGET_MAX_WORDS,
+    max_words: int = MAX_PASSAGE_WORDS,
+) -> list:
+    """Split a run of paragraphs into passages with the least total length penalty.
+
+    word_counts holds each paragraph's word count. Returns (start, end)
+    paragraph index ranges, end exclusive, covering every paragraph in
+    order. A passage may exceed max_words only when it is one paragraph.
+    """
+    n = len(word_counts)
+    prefix = [0] * (n + 1)
+    for i, count in enumerate(word_counts):
+        prefix[i + 1] = prefix[i] + count
+
+    best = [0] + [None] * n
+    cut = [0] * (n + 1)
+    start = 0
+    for end in range(1, n + 1):
+        # Earliest passage start still within max_words of end
+        while start < end - 1 and prefix[end] - prefix[start] > max_words:
+            start += 1
+        best_cost = None
+        for begin in range(start, end):
+            cost = best[begin] + length_penalty(prefix[end] - prefix[begin], low, high)
+            if best_cost is None or cost < best_cost:
+                best_cost = cost
+                cut[end] = begin
+        best[end] = best_cost
+
+    segments = []
+    end = n
+    while end > 0:
+        segments.append((cut[end], end))
+        end = cut[end]
+    segments.reverse()
+    return segments
+
+
+def merge_short_segments(
+    segments: list,
+    word_counts: list,
+    min_words: int = MIN_BLOCK_WORDS,
+    low: int = TARGET_MIN_WORDS,
+    high: int = TARGET_MAX_WORDS,
+) -> list:
+    """Fold passages under min_words into a neighbouring passage.
+
+    blocks_from_sections() never scores anything shorter than min_words,
+    so neither may the re-chunked page; a leftover fragment (say, next to
+    a paragraph past max_words) joins whichever neighbour it brings closer
+    to the target range.
+    """
+    segments = list(segments)
+    lengths = [sum(word_counts[begin:end]) for begin, end in segments]
+    i = 0
+    while len(segments) > 1 and i < len(segments):
+        if lengths[i] >= min_words:
+            i += 1
+            continue
+        neighbours = [j for j in (i - 1, i + 1) if 0 <= j < len(segments)]
+        j = min(
+            neighbours,
+            key=lambda j: length_penalty(lengths[i] + lengths[j], low, high) - length_penalty(lengths[j], low, high),
+        )
+        left, right = min(i, j), max(i, j)
+        segments[left : right + 1] = [(segments[left][0], segments[right][1])]
+        lengths[left : right + 1] = [lengths[left] + lengths[right]]
+        i = left
+    return segments
+
+
+def resegment_sections(
+    sections: list,
+    low: int = TARGET_MIN_WORDS,
+    high: int = TARGET_MAX_WORDS,
+    max_words: int = MAX_PASSAGE_WORDS,
+) -> list:
+    """Regroup each section's paragraphs into passages dicts ready for scoring.
+
+    Like blocks_from_sections(), sections under MIN_BLOCK_WORDS are left
+    out and no passage is shorter than that, so before and after compare
+    the same text.
+    """
+    passages = []
+    for section in sections:
+        paragraphs = section["paragraphs"]
+        word_counts = [len(p.split()) for p in paragraphs]
+        if sum(word_counts) < MIN_BLOCK_WORDS:
+            continue
+        segments = segment_paragraphs(word_counts, low, high, max_words)
+        for begin, end in merge_short_segments(segments, word_counts, MIN_BLOCK_WORDS, low, high):
+            passages.append(
+                {
+                    "heading": section["heading"],
+                    "content": " ".join(paragraphs[begin:end]),
+                    "paragraphs": end - begin,
+                }
+            )
+    return passages
+
+
+def _page_metrics(url: str, scored: list) -> dict:
+    summary = summarize_page(url, scored)
+    return {
+        "passages": summary["total_blocks_analyzed"],
+        "average_citability_score": summary["average_citability_score"],
+        "optimal_length_passages": summary["optimal_length_passages"],
+        "grade_distribution": summary["grade_distribution"],
+    }
+
+
+def optimize_page(source, cache: Optional[PassageScoreCache] = None, url: Optional[str] = None) -> dict:
+    """Re-chunk a page's sections and compare citability before and after.
+
+    source is a URL, raw HTML bytes, a parsed tree or a
+    fetch_page(..., keep_tree=True) result.
+    """
+    if isinstance(source, str):
+        url = url or source
+    elif isinstance(source, dict):
+        url = url or source.get("url")
+
+    try:
+        soup = load_soup(source)
+    except Exception as e:
+        return {"url": url, "error": f"Failed to fetch page: {str(e)}"}
+
+    sections = extract_sections(soup)
+    before_blocks = blocks_from_sections(sections)
+    after_blocks = resegment_sections(sections)
+
+    before = list(score_passages(before_blocks, cache=cache))
+    after = list(score_passages(after_blocks, cache=cache))
+
+    before_metrics = _page_metrics(url, before)
+    after_metrics = _page_metrics(url, after)
+    return {
+        "url": url,
+        "target_words": [TARGET_MIN_WORDS, TARGET_MAX_WORDS],
+        "before": before_metrics,
+        "after": after_metrics,
+        "score_change": round(
+            after_metrics["average_citability_score"] - before_metrics["average_citability_score"], 1
+        ),
+        "optimized_passages": [
+            {
+                "heading": block["heading"],
+                "paragraphs": block["paragraphs"],
+                "word_count": scored["word_count"],
+                "total_score": scored["total_score"],
+                "grade": scored["grade"],
+                "preview": scored["preview"],
+            }
+            for block, scored in zip(after_blocks, after)
+        ],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Suggest how to regroup page paragraphs into 134-167 word passages. "
+        "Returns JSON with citability before and after re-chunking."
+    )
+    parser.add_argument("urls", nargs="+", metavar="url", help="page URL(s) to optimize")
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=8,
+        help="concurrent page downloads for multi-URL runs (default: 8)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite file that keeps passage scores between runs",
+    )
+    args = parser.parse_args()
+
+    def fetch(url):
+        try:
+            return fetch_soup(url)
+        except Exception as e:
+            return e
+
+    results = []
+    with PassageScoreCache(path=args.cache, namespace=SCORER_VERSION) as cache:
+        # Downloads overlap; scoring stays on this thread, which owns the cache
+        with ThreadPoolExecutor(max_workers=max(1, args.fetch_workers)) as fetcher:
+            for url, soup in zip(args.urls, fetcher.map(fetch, args.urls)):
+                if isinstance(soup, Exception):
+                    results.append({"url": url, "error": f"Failed to fetch page: {str(soup)}"})
+                else:
+                    results.append(optimize_page(soup, cache=cache, url=url))
+
+    if len(results) == 1:
+        output = results[0]
+    else:
+        changes = [r["score_change"] for r in results if "error" not in r]
+        output = {
+            "pages": results,
+            "summary": {
+                "pages_optimized": len(changes),
+                "pages_failed": len(results) - len(changes),
+                "pages_improved": sum(1 for c in changes if c > 0),
+                "average_score_change": round(sum(changes) / len(changes), 1) if changes else 0,
+            },
+        }
+    print(json.dumps(output, indent=2, default=str))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Path Classifier — Sorts site URLs into llms.txt sections by path keywords.
+
+A section matches when any of its keywords appears anywhere in the
+lower-cased URL path; sections are tried in order and the first match
+wins, otherwise the page goes to the default section. All keywords are
+folded into one precompiled pattern: each section is one lookahead over
+the path, its keywords merged into a prefix trie, tried in section order.
+Classifying a URL is one regex call that scans the path once per section
+until one matches, rather than once per keyword; cost still grows with
+the number of sections. (A single-pass alternation of named groups
+cannot stop at the first section in priority order and measured slower.)
+
+Rules can be loaded from a JSON file shaped like DEFAULT_RULES.
+"""
+
+import re
+import json
+import argparse
+from typing import Optional
+from urllib.parse import urlparse
+
+DEFAULT_RULES = {
+    "default_section": "Main Pages",
+    "sections": [
+        {"name": "Products & Services", "keywords": ["/pricing", "/features", "/product", "/solutions", "/demo"]},
+        {
+            "name": "Resources & Blog",
+            "keywords": ["/blog", "/article", "/resource", "/guide", "/learn", "/docs", "/documentation"],
+        },
+        {"name": "Company", "keywords": ["/about", "/team", "/career", "/contact", "/press", "/partner"]},
+        {"name": "Support", "keywords": ["/help", "/support", "/faq", "/status"]},
+    ],
+    # URLs containing any of these (case-sensitive, anywhere in the URL) are left out
+    "exclude": [".pdf", ".jpg", ".png", ".gif", ".css", ".js"],
+}
+
+
+def trie_pattern(words) -> str:
+    """Regex matching any of words, with shared prefixes factored out.
+
+    ["/doc", "/docs", "/documentation"] becomes "/doc(?:s|umentation)?",
+    so the regex engine walks each common prefix once instead of once per
+    word.
+    """
+    trie = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return _node_pattern(trie) if trie else "(?!)"
+
+
+def _node_pattern(node: dict) -> str:
+    branches = []
+    optional = False
+    for char in sorted(node):
+        if char == "":
+            optional = True
+            continue
+        branches.append(re.escape(char) + _node_pattern(node[char]))
+    if not branches:
+        return ""
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if optional else group
+
+
+def load_rules(path: str) -> dict:
+    """Read classifier rules from a JSON file, filling gaps from DEFAULT_RULES."""
+    with open(path, encoding="utf-8") as f:
+        rules = json.load(f)
+    if not isinstance(rules, dict) or not isinstance(rules.get("sections", []), list):
+        raise ValueError(f"{path}: expected an object with a 'sections' list")
+    for section in rules.get("sections", []):
+        if not isinstance(section, dict) or "name" not in section or not isinstance(section.get("keywords"), list):
+            raise ValueError(f"{path}: each section needs a 'name' and a 'keywords' list")
+    return {**DEFAULT_RULES, **rules}
+
+
+class PathClassifier:
+    """Assigns URL paths to llms.txt sections using precompiled rules."""
+
+    def __init__(self, rules: Optional[dict] = None):
+        rules = rules or DEFAULT_RULES
+        self.default_section = rules.get("default_section", DEFAULT_RULES["default_section"])
+        self._names = [section["name"] for section in rules["sections"]]
+        # One lookahead per section, tried in order, each rescanning the path
+        # from the start; the empty named group after it reports which
+        # section matched first.
+        branches = [
+            f"(?=.*?{trie_pattern(section['keywords'])})(?P<s{i}>)" for i, section in enumerate(rules["sections"])
+        ]
+        self._sections_re = re.compile("(?s)(?:" + "|".join(branches) + ")") if branches else None
+        exclude = rules.get("exclude") or []
+        self._exclude_re = re.compile(trie_pattern(exclude)) if exclude else None
+
+    @property
+    def section_names(self) -> list:
+        """Section names in llms.txt order: the default section first."""
+        names = [self.default_section]
+        for name in self._names:
+            if name not in names:
+                names.append(name)
+        return names
+
+    def classify(self, path: str) -> str:
+        """Section for a URL path (matched lower-cased)."""
+        if self._sections_re is not None:
+            match = self._sections_re.match(path.lower())
+            if match:
+                return self._names[int(match.lastgroup[1:])]
+        return self.default_section
+
+    def excluded(self, url: str) -> bool:
+        """True for URLs (assets, documents) that don't belong in llms.txt."""
+        return self._exclude_re is not None and self._exclude_re.search(url) is not None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show which llms.txt section each URL falls into.")
+    parser.add_argument("urls", nargs="+", metavar="url", help="URLs or paths to classify")
+    parser.add_argument("--rules", metavar="PATH", help="JSON rules file (default: built-in rules)")
+    args = parser.parse_args()
+
+    classifier = PathClassifier(load_rules(args.rules) if args.rules else None)
+    output = {
+        url: None if classifier.excluded(url) else classifier.classify(urlparse(url).path) for url in args.urls
+    }
+    print(json.dumps(output, indent=2))
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Site Citability Aggregator — Rolls per-block citability scores up to a site view.
+
+Block scores and breakdown components are collected into NumPy arrays one
+page at a time, so the caller can drop each page's block dicts once they
+have been added. Only the k best and worst blocks are kept in full.
+
+Produces:
+- Score percentiles, histogram and grade distribution across all blocks
+- Per-dimension means (answer quality, self-containment, ...)
+- Per-template comparisons (pages grouped by URL section, e.g. /blog/)
+- Global top-k / bottom-k blocks and weakest pages
+
+BoilerplateDetector finds template paragraphs (sidebars, related-post
+widgets, legal blurbs) by counting paragraph fingerprints across pages, so
+they can be excluded from scoring and reported separately.
+"""
+
+import re
+import sys
+import heapq
+import hashlib
+from typing import Optional
+from urllib.parse import urlparse
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: Required packages not installed. Run: pip install numpy")
+    sys.exit(1)
+
+DIMENSIONS = (
+    "answer_block_quality",
+    "self_containment",
+    "structural_readability",
+    "statistical_density",
+    "uniqueness_signals",
+)
+
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+HISTOGRAM_BINS = np.arange(0, 110, 10)
+GRADE_THRESHOLDS = np.array([35, 50, 65, 80])
+GRADES = ("F", "D", "C", "B", "A")
+
+
+def template_for_url(url: str) -> str:
+    """Group a URL under its first path segment ("/blog/post" -> "/blog/")."""
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    if len(segments) <= 1:
+        return "/"
+    return f"/{segments[0]}/"
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def block_fingerprint(content: str) -> str:
+    """Fingerprint block text so near-identical template copies collide.
+
+    Case, whitespace and digits (dates, counters, years) are normalized away.
+    """
+    normalized = _DIGITS_RE.sub("0", _WHITESPACE_RE.sub(" ", content.strip().lower()))
+    return hashlib.blake2b(normalized.encode("utf-8", "surrogatepass"), digest_size=12).hexdigest()
+
+
+def _is_heading(element: dict) -> bool:
+    return element["tag"].startswith("h")
+
+
+class BoilerplateDetector:
+    """Flag paragraphs that repeat on more than a share of a site's pages.
+
+    Works on the page elements from citability_scorer.extract_elements(),
+    before they are grouped into sections: a sidebar or legal blurb placed
+    inside an article is then the same paragraph on every page, rather than
+    part of a different block each time. Feed pages with add_page() until
+    sample_pages have been seen, then call split() per page. A fingerprint
+    counts once per page however often it repeats there.
+
+    A repeated heading is only template when a template paragraph follows
+    it (a widget title like "Related posts"); "Conclusion" headings stay.
+    """
+
+    def __init__(self, threshold: float = 0.5, min_pages: int = 3, sample_pages: int = 20):
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.sample_pages = sample_pages
+        self.pages = 0
+        self._page_counts = {}
+        self._heading_counts = {}
+        self._examples = {}
+        self.elements_skipped = 0
+
+    def add_page(self, elements: list) -> None:
+        fingerprints = set()
+        headings = set()
+        for element in elements:
+            fingerprint = block_fingerprint(element["text"])
+            if _is_heading(element):
+                headings.add(fingerprint)
+                continue
+            fingerprints.add(fingerprint)
+            if fingerprint not in self._examples:
+                words = element["text"].split()
+                self._examples[fingerprint] = {
+                    "tag": element["tag"],
+                    "word_count": len(words),
+                    "preview": " ".join(words[:30]) + ("..." if len(words) > 30 else ""),
+                }
+        for fingerprint in fingerprints:
+            self._page_counts[fingerprint] = self._page_counts.get(fingerprint, 0) + 1
+        for fingerprint in headings:
+            self._heading_counts[fingerprint] = self._heading_counts.get(fingerprint, 0) + 1
+        self.pages += 1
+
+    def _repeated(self, count: int) -> bool:
+        return count > 1 and count / self.pages > self.threshold
+
+    def is_template(self, element: dict) -> bool:
+        """Whether a paragraph element repeats across the site."""
+        if self.pages < self.min_pages:
+            return False
+        return self._repeated(self._page_counts.get(block_fingerprint(element["text"]), 0))
+
+    def split(self, elements: list) -> tuple:
+        """Return (content_elements, template_elements) for one page."""
+        content, template = [], []
+        for i, element in enumerate(elements):
+            if _is_heading(element):
+                following = elements[i + 1] if i + 1 < len(elements) else None
+                is_template = (
+                    self.pages >= self.min_pages
+                    and following is not None
+                    and not _is_heading(following)
+                    and self.is_template(following)
+                    and self._repeated(self._heading_counts.get(block_fingerprint(element["text"]), 0))
+                )
+            else:
+                is_template = self.is_template(element)
+            (template if is_template else content).append(element)
+        self.elements_skipped += len(template)
+        return content, template
+
+    def summary(self, limit: int = 20) -> dict:
+        """Describe the template paragraphs found, most widespread first."""
+        templates = []
+        if self.pages >= self.min_pages:
+            for fingerprint, count in self._page_counts.items():
+                if self._repeated(count):
+                    templates.append(
+                        dict(self._examples[fingerprint], pages=count, page_share=round(count / self.pages, 3))
+                    )
+        templates.sort(key=lambda t: -t["pages"])
+        return {
+            "threshold": self.threshold,
+            "pages_sampled": self.pages,
+            "template_elements_found": len(templates),
+            "elements_skipped": self.elements_skipped,
+            "templates": templates[:limit],
+        }
+
+
+class TopK:
+    """Keep the k highest-keyed items seen, preferring earlier items on ties.
+
+    Matches sorted(items, key=key, reverse=True)[:k] without holding every
+    item: a min-heap of size k whose root is the weakest kept entry.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._seq = 0
+
+    def push(self, key, item) -> None:
+        heap = self._heap
+        self._seq += 1
+        if len(heap) < self.k:
+            heapq.heappush(heap, (key, -self._seq, item))
+        elif key > heap[0][0]:
+            # An equal key never displaces the root: the root came first
+            heapq.heapreplace(heap, (key, -self._seq, item))
+
+    def items(self) -> list:
+        return [item for _, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+class SiteCitabilityAggregator:
+    """Accumulate scored blocks from many pages into a site-level summary."""
+
+    def __init__(self, top_k: int = 10):
+        self.top_k = top_k
+        self._totals = []
+        self._breakdowns = []
+        self._word_counts = []
+        self._template_ids = []
+        self._templates = {}
+        self._template_pages = []
+        self._page_averages = []
+        self._top_blocks = TopK(top_k)
+        self._bottom_blocks = TopK(top_k)
+        self._weakest_pages = TopK(top_k)
+        self.pages = 0
+        self.failed_pages = 0
+
+    def add_page(self, url: str, scored_blocks: list, template: Optional[str] = None) -> None:
+        """Add one page's scored blocks (as returned by score_passage)."""
+        if not scored_blocks:
+            self.pages += 1
+            return
+
+        template = template or template_for_url(url)
+        if template not in self._templates:
+            self._templates[template] = len(self._templates)
+            self._template_pages.append(0)
+        template_id = self._templates[template]
+        self._template_pages[template_id] += 1
+
+        totals = np.fromiter((b["total_score"] for b in scored_blocks), dtype=np.int16, count=len(scored_blocks))
+        self._totals.append(totals)
+        self._breakdowns.append(
+            np.array([[b["breakdown"][d] for d in DIMENSIONS] for b in scored_blocks], dtype=np.int16)
+        )
+        self._word_counts.append(
+            np.fromiter((b["word_count"] for b in scored_blocks), dtype=np.int32, count=len(scored_blocks))
+        )
+        self._template_ids.append(np.full(len(scored_blocks), template_id, dtype=np.int32))
+
+        for block in scored_blocks:
+            record = {
+                "url": url,
+                "heading": block["heading"],
+                "total_score": block["total_score"],
+                "grade": block["grade"],
+                "word_count": block["word_count"],
+                "preview": block.get("preview", ""),
+            }
+            self._top_blocks.push(block["total_score"], record)
+            self._bottom_blocks.push(-block["total_score"], record)
+
+        page_average = float(totals.mean())
+        self._page_averages.append(page_average)
+        self._weakest_pages.push(
+            -page_average, {"url": url, "average_citability_score": round(page_average, 1), "blocks": len(scored_blocks)}
+        )
+        self.pages += 1
+
+    def add_page_result(self, page: dict) -> None:
+        """Add a page report from summarize_page()/analyze_page_citability()."""
+        if "error" in page:
+            self.failed_pages += 1
+            return
+        self.add_page(page["url"], page.get("all_blocks", []))
+
+    def summary(self) -> dict:
+        """Compute site-level statistics over every block added so far."""
+        result = {
+            "pages_analyzed": self.pages,
+            "pages_failed": self.failed_pages,
+            "total_blocks_analyzed": 0,
+        }
+        if not self._totals:
+            return result
+
+        totals = np.concatenate(self._totals)
+        breakdowns = np.concatenate(self._breakdowns)
+        word_counts = np.concatenate(self._word_counts)
+        template_ids = np.concatenate(self._template_ids)
+        page_averages = np.array(self._page_averages)
+
+        histogram, _ = np.histogram(totals, bins=HISTOGRAM_BINS)
+        grade_counts = np.bincount(np.searchsorted(GRADE_THRESHOLDS, totals, side="right"), minlength=len(GRADES))
+        dimension_means = breakdowns.mean(axis=0)
+
+        template_blocks = np.bincount(template_ids, minlength=len(self._templates))
+        template_sums = np.bincount(template_ids, weights=totals, minlength=len(self._templates))
+        templates = {}
+        for name, index in sorted(self._templates.items(), key=lambda item: -template_blocks[item[1]]):
+            mask = template_ids == index
+            templates[name] = {
+                "pages": self._template_pages[index],
+                "blocks": int(template_blocks[index]),
+                "average_citability_score": round(float(template_sums[index] / template_blocks[index]), 1),
+                "median_citability_score": float(np.median(totals[mask])),
+                "dimension_means": {
+                    d: round(float(v), 2) for d, v in zip(DIMENSIONS, breakdowns[mask].mean(axis=0))
+                },
+            }
+
+        result.update(
+            {
+                "total_blocks_analyzed": int(totals.size),
+                "average_citability_score": round(float(totals.mean()), 1),
+                "score_std": round(float(totals.std()), 1),
+                "score_percentiles": {
+                    f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(totals, PERCENTILES))
+                },
+                "score_histogram": [
+                    {"range": f"{lo}-{hi - 1 if hi < 100 else 100}", "blocks": int(n)}
+                    for lo, hi, n in zip(HISTOGRAM_BINS[:-1], HISTOGRAM_BINS[1:], histogram)
+                ],
+                "grade_distribution": {g: int(n) for g, n in zip(reversed(GRADES), reversed(grade_counts))},
+                "optimal_length_passages": int(((word_counts >= 134) & (word_counts <= 167)).sum()),
+                "dimension_means": {d: round(float(v), 2) for d, v in zip(DIMENSIONS, dimension_means)},
+                "page_average_percentiles": {
+                    f"p{p}": round(float(v), 1) for p, v in zip(PERCENTILES, np.percentile(page_averages, PERCENTILES))
+                },
+                "templates": templates,
+                f"top_{self.top_k}_citable": self._top_blocks.items(),
+                f"bottom_{self.top_k}_citable": self._bottom_blocks.items(),
+                f"weakest_{self.top_k}_pages": self._weakest_pages.items(),
+            }
+        )
+        return result
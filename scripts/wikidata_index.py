@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Wikidata Index — Offline brand entity lookups from a Wikidata JSON dump.
+
+Bulk brand work shouldn't depend on the live Wikidata API. This builds a
+compact on-disk index from a line-delimited Wikidata JSON dump
+(latest-all.json.bz2, .gz or uncompressed) mapping every label and alias
+in one language to the entity's id, label, description, aliases and
+sitelinks, and looks names up through a memory map.
+
+The dump is streamed one entity per line, so building needs constant
+memory however large the dump is: key hashes are sorted in bounded
+chunks on disk and merged at the end. The index file holds
+
+    header | entity records (one JSON line each) | sorted (key hash, record offset) table
+
+and a lookup is a binary search over the table followed by reading the
+matching records, a few microseconds without loading the file.
+"""
+
+import os
+import bz2
+import gzip
+import json
+import heapq
+import mmap
+import struct
+import hashlib
+import argparse
+import tempfile
+from typing import Optional
+
+from entity_cache import normalize_brand
+
+MAGIC = b"WDIDX\x00\x00\x01"
+# magic, entities, keys, records offset, table offset
+_HEADER = struct.Struct("<8sQQQQ")
+# 64-bit key hash, record offset
+_ENTRY = struct.Struct("<QQ")
+# Table entries sorted in memory at a time while building
+CHUNK_ENTRIES = 250_000
+# Most records returned for one name (common words label many entities)
+LOOKUP_LIMIT = 20
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def open_dump(path: str):
+    """Binary file object for a dump, decompressing .bz2 and .gz."""
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_dump_entities(path: str):
+    """Entities from a dump, one at a time.
+
+    Wikidata dumps are a JSON array with one entity per line; the array
+    brackets and each line's trailing comma are stripped. Lines that don't
+    parse are skipped.
+    """
+    with open_dump(path) as f:
+        for line in f:
+            line = line.strip()
+            if line in (b"[", b"]", b""):
+                continue
+            if line.endswith(b","):
+                line = line[:-1]
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def entity_record(entity: dict, language: str = "en") -> Optional[dict]:
+    """The compact record the index keeps for an item, or None when it has no name."""
+    if entity.get("type", "item") != "item":
+        return None
+    label = entity.get("labels", {}).get(language, {}).get("value", "")
+    aliases = [alias["value"] for alias in entity.get("aliases", {}).get(language, []) if alias.get("value")]
+    if not label and not aliases:
+        return None
+    sitelinks = entity.get("sitelinks", {})
+    return {
+        "id": entity.get("id", ""),
+        "label": label,
+        "description": entity.get("descriptions", {}).get(language, {}).get("value", ""),
+        "aliases": aliases,
+        "sitelinks": len(sitelinks),
+        "wikipedia_title": sitelinks.get(f"{language}wiki", {}).get("title", ""),
+    }
+
+
+def _record_keys(record: dict) -> set:
+    return {normalize_brand(name) for name in [record["label"], *record["aliases"]] if name.strip()}
+
+
+def _write_chunk(entries: list, directory: str) -> str:
+    entries.sort()
+    fd, path = tempfile.mkstemp(suffix=".chunk", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"".join(_ENTRY.pack(*entry) for entry in entries))
+    entries.clear()
+    return path
+
+
+def _read_chunk(path: str, block_entries: int = 8192):
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_ENTRY.size * block_entries)
+            if not block:
+                return
+            yield from _ENTRY.iter_unpack(block)
+
+
+def build_index(
+    dump_path: str,
+    index_path: str,
+    language: str = "en",
+    chunk_entries: int = CHUNK_ENTRIES,
+) -> dict:
+    """Build an index file from a dump; returns build statistics.
+
+    The index is written next to index_path and renamed into place when
+    complete, so a failed build never leaves a truncated index behind.
+    """
+    directory = os.path.dirname(os.path.abspath(index_path))
+    work = tempfile.mkdtemp(prefix="wdidx-", dir=directory)
+    records_path = os.path.join(work, "records")
+    chunks = []
+    entries = []
+    stats = {"entities_read": 0, "entities_indexed": 0, "keys": 0}
+    try:
+        # Pass 1: records straight to disk, key hashes sorted in chunks
+        with open(records_path, "wb") as records:
+            offset = 0
+            for entity in iter_dump_entities(dump_path):
+                stats["entities_read"] += 1
+                record = entity_record(entity, language)
+                if record is None:
+                    continue
+                line = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+                records.write(line)
+                keys = _record_keys(record)
+                entries.extend((key_hash(key), offset) for key in keys)
+                stats["entities_indexed"] += 1
+                stats["keys"] += len(keys)
+                offset += len(line)
+                if len(entries) >= chunk_entries:
+                    chunks.append(_write_chunk(entries, work))
+            if entries:
+                chunks.append(_write_chunk(entries, work))
+            records_size = offset
+
+        # Pass 2: header, records, then the merged table
+        records_offset = _HEADER.size
+        table_offset = records_offset + records_size
+        partial = os.path.join(work, "index")
+        with open(partial, "wb") as out:
+            out.write(_HEADER.pack(MAGIC, stats["entities_indexed"], stats["keys"], records_offset, table_offset))
+            with open(records_path, "rb") as records:
+                while True:
+                    block = records.read(1 << 20)
+                    if not block:
+                        break
+                    out.write(block)
+            buffer = []
+            for entry in heapq.merge(*(_read_chunk(path) for path in chunks)):
+                buffer.append(_ENTRY.pack(*entry))
+                if len(buffer) >= 8192:
+                    out.write(b"".join(buffer))
+                    buffer.clear()
+            out.write(b"".join(buffer))
+        os.replace(partial, index_path)
+    finally:
+        for path in chunks + [records_path, os.path.join(work, "index")]:
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(work)
+    stats["index_bytes"] = os.path.getsize(index_path)
+    return stats
+
+
+class WikidataIndex:
+    """Memory-mapped, read-only view of an index built by build_index()."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.entities, self.keys, self._records, self._table = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a Wikidata index")
+
+    def __len__(self) -> int:
+        return self.keys
+
+    def _first(self, target: int) -> int:
+        """Index of the first table entry whose hash is >= target."""
+        lo, hi = 0, self.keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _ENTRY.unpack_from(self._map, self._table + mid * _ENTRY.size)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _record(self, offset: int) -> dict:
+        start = self._records + offset
+        return json.loads(self._map[start : self._map.find(b"\n", start)])
+
+    def lookup(self, name: str, limit: int = LOOKUP_LIMIT) -> list:
+        """Entities labelled or aliased name, exact label matches and most sitelinks first.
+
+        Each record has "match": "label" or "alias".
+        """
+        key = normalize_brand(name)
+        target = key_hash(key)
+        matches = []
+        position = self._first(target)
+        while position < self.keys:
+            entry_hash, offset = _ENTRY.unpack_from(self._map, self._table + position * _ENTRY.size)
+            if entry_hash != target:
+                break
+            record = self._record(offset)
+            # A different key with the same hash doesn't count
+            if normalize_brand(record["label"]) == key:
+                matches.append(dict(record, match="label"))
+            elif key in _record_keys(record):
+                matches.append(dict(record, match="alias"))
+            position += 1
+        matches.sort(key=lambda r: (r["match"] != "label", -r["sitelinks"]))
+        return matches[:limit]
+
+    def iter_records(self):
+        """Every entity record in the index, in dump order."""
+        position = self._records
+        while position < self._table:
+            end = self._map.find(b"\n", position)
+            yield json.loads(self._map[position:end])
+            position = end + 1
+
+    def best(self, name: str) -> Optional[dict]:
+        """The likeliest entity for name, or None."""
+        matches = self.lookup(name, limit=1)
+        return matches[0] if matches else None
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query an offline Wikidata label index. Returns JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="index a Wikidata JSON dump (.json, .json.gz or .json.bz2)")
+    build.add_argument("dump", help="dump file")
+    build.add_argument("index", help="index file to write")
+    build.add_argument("--language", default="en", help="label, alias and Wikipedia language (default: en)")
+    build.add_argument(
+        "--chunk-entries",
+        type=int,
+        default=CHUNK_ENTRIES,
+        help=f"keys sorted in memory at a time (default: {CHUNK_ENTRIES})",
+    )
+    lookup = commands.add_parser("lookup", help="look names up in an index")
+    lookup.add_argument("index", help="index file")
+    lookup.add_argument("names", nargs="+", metavar="name", help="brand or entity names")
+    lookup.add_argument("--limit", type=int, default=5, help="entities per name (default: 5)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        output = build_index(args.dump, args.index, args.language, args.chunk_entries)
+    else:
+        with WikidataIndex(args.index) as index:
+            output = {name: index.lookup(name, args.limit) for name in args.names}
+    print(json.dumps(output, indent=2, ensure_ascii=False))
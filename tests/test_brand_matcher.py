@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from brand_matcher import BrandMatcher, name_similarity, normalize_name
+
+SYLLABLES = "ka lo mi ne ru sta bri vel dor an ex tra gen co mar lux ter fin ol ia".split()
+INDUSTRY = ["Group", "Bank", "Motors", "Foods", "Labs", "Systems", "Capital"]
+
+
+def make_entities(count: int, rng: random.Random) -> list:
+    words = sorted({"".join(rng.choices(SYLLABLES, k=rng.randint(1, 3))).title() for _ in range(300)})
+    names, entities = set(), []
+    while len(entities) < count:
+        parts = rng.sample(words, rng.choice([1, 2, 2]))
+        if rng.random() < 0.4:
+            parts.append(rng.choice(INDUSTRY))
+        name = " ".join(parts)
+        if name not in names:
+            names.add(name)
+            entities.append({"id": f"Q{len(entities) + 1}", "label": name, "sitelinks": rng.randrange(4)})
+    return entities
+
+
+def typo(name: str, rng: random.Random) -> str:
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice("aeiou") + name[i + 1 :]
+
+
+def best_scores(entities: list, query: str) -> list:
+    return [
+        max(name_similarity(query, name) for name in [entity["label"], *entity.get("aliases", [])])
+        for entity in entities
+    ]
+
+
+def brute_force(entities: list, scores: list, limit: int, min_score: float) -> list:
+    """(id, score) of every entity scoring min_score, ranked as match() ranks them."""
+    ranked = sorted(
+        (-score, -entity["sitelinks"], order, entity["id"], round(score, 3))
+        for order, (entity, score) in enumerate(zip(entities, scores))
+        if score >= min_score
+    )
+    return [(entity_id, score) for *_, entity_id, score in ranked[:limit]]
+
+
+@pytest.fixture(scope="module")
+def indexed():
+    rng = random.Random(5)
+    entities = make_entities(1000, rng)
+    for entity in entities[:100]:
+        entity["aliases"] = [typo(entity["label"], rng)]
+    return entities, BrandMatcher.from_records(entities), rng
+
+
+def test_matches_equal_brute_force(indexed):
+    entities, matcher, rng = indexed
+    queries = [typo(e["label"], rng) for e in rng.sample(entities, 50)]
+    queries += [e["label"].upper() + " Inc." for e in rng.sample(entities, 15)]
+    queries += ["Stadorbri Velmar", "Kalo", "Exterfin Lux Holdings"]
+    for query in queries:
+        scores = best_scores(entities, query)
+        for limit, min_score in [(5, None), (1, None), (3, 0.6), (2, 0.9)]:
+            expected = brute_force(entities, scores, limit, min_score or matcher.min_score)
+            got = matcher.match(query, limit=limit, min_score=min_score)
+            assert [(r["id"], r["score"]) for r in got] == expected, (query, limit, min_score)
+
+
+def test_exact_name_does_not_hide_an_equal_score():
+    # "Aaaaa" and "Aaaaaa" have the same trigrams, so both score 1.0; sitelinks rank them
+    matcher = BrandMatcher.from_records(
+        [{"id": "Q1", "label": "Aaaaa", "sitelinks": 1}, {"id": "Q2", "label": "Aaaaaa", "sitelinks": 9}]
+    )
+    assert normalize_name("Aaaaa") != normalize_name("Aaaaaa")
+    assert [r["id"] for r in matcher.match("Aaaaa", limit=1)] == ["Q2"]
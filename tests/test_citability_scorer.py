@@ -0,0 +1,30 @@
+import pytest
+
+from citability_scorer import score_passages
+from passage_cache import PassageScoreCache
+
+TEXTS = [
+    f"Passage {name} explains how generative engines choose sources, with enough words to be scored here."
+    for name in ("alpha", "beta", "gamma")
+]
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 256])
+def test_cache_stats_count_each_passage_once(chunksize):
+    passages = TEXTS * 10
+    cache = PassageScoreCache()
+    results = list(score_passages(passages, workers=2, chunksize=chunksize, cache=cache))
+
+    assert [r["preview"] for r in results] == [" ".join(p.split()) for p in passages]
+    stats = cache.stats()
+    assert (stats["lookups"], stats["memory_hits"], stats["store_hits"], stats["misses"]) == (30, 27, 0, 3)
+
+
+def test_cache_stats_with_store(tmp_path):
+    path = str(tmp_path / "scores.sqlite")
+    with PassageScoreCache(path=path) as cache:
+        list(score_passages(TEXTS, workers=2, cache=cache))
+    with PassageScoreCache(path=path) as cache:
+        list(score_passages(TEXTS * 10, workers=2, chunksize=4, cache=cache))
+        stats = cache.stats()
+    assert (stats["lookups"], stats["memory_hits"], stats["store_hits"], stats["misses"]) == (30, 27, 3, 0)
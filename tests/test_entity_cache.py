@@ -0,0 +1,32 @@
+import threading
+
+from entity_cache import EntityCache
+
+
+def test_late_lookups_after_close_are_ignored(tmp_path):
+    path = str(tmp_path / "entities.sqlite")
+    cache = EntityCache(path)
+    cache.put("wikipedia_search", "api", "acme", {"title": "Acme"})
+    cache.close()
+
+    # A timed-out lookup finishing after the caller closed the cache
+    errors = []
+
+    def late_lookup():
+        try:
+            cache.put("wikidata_search", "api", "acme", {"id": "Q1"})
+            assert cache.get("wikidata_search", "api", "acme") is None
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=late_lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    cache.close()
+
+    with EntityCache(path) as reopened:
+        assert reopened.get("wikipedia_search", "api", "acme") == {"title": "Acme"}
+        assert reopened.get("wikidata_search", "api", "acme") is None
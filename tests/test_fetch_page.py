@@ -0,0 +1,16 @@
+from fetch_page import CHARSET_DETECT_BYTES, detect_encoding, parse_html
+
+PARAGRAPH = "<p>生成エンジンは自己完結した文章を引用します。二〇二五年に千二百のサイトが分析されました。</p>\n"
+
+
+def test_detection_sample_does_not_cut_a_double_byte_character():
+    html = "<html><head><title>x</title></head><body>" + PARAGRAPH * 2000 + "</body></html>"
+    content = html.encode("shift_jis")
+    assert len(content) > CHARSET_DETECT_BYTES
+    assert detect_encoding(content) in ("shift_jis", "cp932")
+    assert parse_html(content).p.get_text() == PARAGRAPH[3:-5]
+
+
+def test_header_charset_wins_over_detection():
+    content = ("<p>" + "naïve café " * 50 + "</p>").encode("windows-1252")
+    assert detect_encoding(content, "text/html; charset=windows-1252") == "cp1252"
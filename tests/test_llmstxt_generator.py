@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+
+def test_import_does_not_load_the_scoring_stack():
+    code = (
+        "import sys, llmstxt_generator\n"
+        "print(sorted(m for m in ('numpy', 'citability_scorer', 'site_citability') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SCRIPTS, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_scorer_version_is_shared():
+    import citability_rules
+    import citability_scorer
+    import llmstxt_generator
+
+    assert llmstxt_generator.SCORER_VERSION == citability_scorer.SCORER_VERSION == citability_rules.SCORER_VERSION
+
+
+def test_failed_refetch_is_retried_next_run(tmp_path, monkeypatch):
+    import llmstxt_generator
+
+    lastmod = {"value": "2026-01-01"}
+    responses = []
+    monkeypatch.setattr(
+        llmstxt_generator,
+        "_discover_sitemap",
+        lambda base, sitemap_url: (
+            "https://example.com/sitemap.xml",
+            [{"loc": "https://example.com/blog/post", "lastmod": lastmod["value"]}],
+        ),
+    )
+    monkeypatch.setattr(llmstxt_generator, "_revalidate", lambda url, previous: responses.pop(0))
+    homepage = b"<html><head><title>Example</title></head><body></body></html>"
+    state = str(tmp_path / "state.json")
+
+    def run():
+        return llmstxt_generator.regenerate_llmstxt("https://example.com", state, homepage=homepage)
+
+    responses.append({"status": 200, "etag": None, "last_modified": None, "description": "Old post"})
+    run()
+    # The page changes, but its refetch fails
+    lastmod["value"] = "2026-02-01"
+    responses.append({"status": 503})
+    assert run()["changes"]["failed"] == [{"url": "https://example.com/blog/post", "status": 503}]
+    # Same sitemap lastmod next run: the page is requested again, not counted unchanged
+    responses.append({"status": 200, "etag": None, "last_modified": None, "description": "New post"})
+    changes = run()["changes"]
+    assert (changes["requests"], changes["unchanged"], changes["updated"]) == (
+        1,
+        0,
+        ["https://example.com/blog/post"],
+    )
+    assert responses == []
@@ -0,0 +1,43 @@
+from citability_scorer import MIN_BLOCK_WORDS, blocks_from_sections
+from passage_optimizer import merge_short_segments, resegment_sections, segment_paragraphs
+
+
+def words(count: int, word: str = "word") -> str:
+    return " ".join([word] * count)
+
+
+def test_fragment_next_to_long_paragraph_is_merged():
+    sections = [{"heading": "Long", "paragraphs": [words(450), words(12, "tail")]}]
+    assert segment_paragraphs([450, 12]) == [(0, 1), (1, 2)]
+
+    passages = resegment_sections(sections)
+    assert [p["paragraphs"] for p in passages] == [2]
+    assert all(len(p["content"].split()) >= MIN_BLOCK_WORDS for p in passages)
+
+
+def test_before_and_after_cover_the_same_text():
+    sections = [
+        {"heading": "A", "paragraphs": [words(8), words(9)]},  # under MIN_BLOCK_WORDS: skipped by both
+        {"heading": "B", "paragraphs": [words(150), words(10), words(420), words(6), words(140)]},
+    ]
+    before = blocks_from_sections(sections)
+    after = resegment_sections(sections)
+    assert sum(len(b["content"].split()) for b in before) == sum(len(p["content"].split()) for p in after)
+    assert min(len(p["content"].split()) for p in after) >= MIN_BLOCK_WORDS
+
+
+def test_merge_picks_the_neighbour_closer_to_target():
+    # 10 words joins the 130-word passage (-> 140, in range) rather than the 160-word one
+    assert merge_short_segments([(0, 1), (1, 2), (2, 3)], [130, 10, 160]) == [(0, 2), (2, 3)]
+    assert merge_short_segments([(0, 1)], [5]) == [(0, 1)]
+
+
+def test_later_merges_still_score_against_the_word_range():
+    # 30 joins 130 (-> 160); then 5 joins 160 (-> 165) or 150 (-> 155), both in range: the first wins
+    segments = [(k, k + 1) for k in range(6)]
+    assert merge_short_segments(segments, [30, 130, 5, 150, 170, 200], min_words=40) == [
+        (0, 3),
+        (3, 4),
+        (4, 5),
+        (5, 6),
+    ]
@@ -0,0 +1,105 @@
+import threading
+
+import citability_scorer
+from citability_scorer import analyze_pages_citability, iter_pages_citability, blocks_from_sections, extract_elements, sections_from_elements
+from site_citability import BoilerplateDetector
+
+SIDEBAR = (
+    "Subscribe to our newsletter for weekly marketing tips, case studies and the latest search updates "
+    "delivered straight to your inbox every Tuesday morning."
+)
+LEGAL = (
+    "Copyright 2026 Example Media. All rights reserved. Content on this site is provided for information "
+    "only and does not constitute professional advice."
+)
+
+
+TOPICS = ["canonical tags", "schema markup", "crawl budget", "internal links", "alt text",
+          "hreflang", "page speed", "sitemaps", "robots rules", "author pages"]
+
+
+def page_html(topic: str) -> bytes:
+    """An article whose sections have the sidebar and legal divs inside them."""
+    return f"""<html><body><article>
+<h2>What are {topic}?</h2>
+<p>Getting {topic} right is a way of organizing pages so readers and crawlers find answers quickly.</p>
+<div class="sidebar"><p>{SIDEBAR}</p></div>
+<p>Teams that audit {topic} report clearer pages and fewer support questions afterwards.</p>
+<h2>Why {topic} matter</h2>
+<p>Search engines quote pages about {topic} when the answer sits in one short self-contained paragraph.</p>
+<p>Fixing {topic} first is usually cheaper than rewriting whole articles for the same result.</p>
+<div class="legal"><p>{LEGAL}</p></div>
+</article></body></html>""".encode()
+
+
+PAGES = {f"https://example.com/blog/{topic.replace(' ', '-')}": page_html(topic) for topic in TOPICS}
+
+
+def test_template_divs_inside_article_sections_are_dropped():
+    pages = [extract_elements(html) for html in PAGES.values()]
+    detector = BoilerplateDetector()
+    for elements in pages:
+        detector.add_page(elements)
+
+    for elements in pages:
+        content, template = detector.split(elements)
+        assert [e["text"] for e in template] == [SIDEBAR, LEGAL]
+        blocks = blocks_from_sections(sections_from_elements(content))
+        assert len(blocks) == 2
+        assert all(SIDEBAR not in b["content"] and LEGAL not in b["content"] for b in blocks)
+
+    summary = detector.summary()
+    assert summary["template_elements_found"] == 2
+    assert summary["elements_skipped"] == 20
+
+
+def test_repeated_heading_kept_unless_followed_by_template():
+    pages = [
+        [
+            {"tag": "h2", "text": "Related posts"},
+            {"tag": "p", "text": SIDEBAR},
+            {"tag": "h2", "text": "Conclusion"},
+            {"tag": "p", "text": f"This page on {topic} closes with its own summary of the topic."},
+        ]
+        for topic in TOPICS[:5]
+    ]
+    detector = BoilerplateDetector()
+    for elements in pages:
+        detector.add_page(elements)
+    content, template = detector.split(pages[0])
+    assert [e["text"] for e in template] == ["Related posts", SIDEBAR]
+    assert [e["text"] for e in content][0] == "Conclusion"
+
+
+def test_site_run_excludes_template_elements(monkeypatch):
+    monkeypatch.setattr(citability_scorer, "fetch_soup", lambda url: citability_scorer.load_soup(PAGES[url]))
+    reports = analyze_pages_citability(list(PAGES), workers=1, fetch_workers=2, boilerplate=BoilerplateDetector())
+    for report in reports:
+        assert report["template_elements_excluded"] == 2
+        assert report["total_blocks_analyzed"] == 2
+        assert all(SIDEBAR not in b["preview"] for b in report["all_blocks"])
+
+
+def test_stream_emits_after_sample_while_crawl_continues(monkeypatch):
+    urls = [f"https://example.com/blog/{topic.replace(' ', '-')}/{n}" for n in range(3) for topic in TOPICS]
+    html = {url: page_html(f"{url.split('/')[-2].replace('-', ' ')} part {'abc'[int(url[-1])]}") for url in urls}
+    crawl_may_finish = threading.Event()
+    later_urls = set(urls[5:])
+
+    def fetch(url):
+        if url in later_urls:
+            crawl_may_finish.wait(10)
+        return citability_scorer.load_soup(html[url])
+
+    monkeypatch.setattr(citability_scorer, "fetch_soup", fetch)
+    detector = BoilerplateDetector(sample_pages=3)
+    reports = iter_pages_citability(urls, workers=1, fetch_workers=len(urls), boilerplate=detector)
+    first = next(reports)
+    # A report is out while most of the crawl is still waiting to download
+    assert not crawl_may_finish.is_set()
+    crawl_may_finish.set()
+    rest = list(reports)
+
+    assert len(rest) == len(urls) - 1
+    assert detector.pages == 3
+    assert all(report["template_elements_excluded"] == 2 for report in [first, *rest])